@@ -1,21 +1,69 @@
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import ORJSONResponse
-from fastapi.staticfiles import StaticFiles
 
 from app.api.v1.auth_router import router as auth_router
 from app.api.v1.column_router import router as column_router
 from app.api.v1.health_router import router as health_router
+from app.api.v1.metrics_router import router as metrics_router
 from app.api.v1.portfolio_router import router as portfolio_router
 from app.api.v1.review_router import router as review_router
-from app.core.configs.settings import settings
-from app.log import initialize_log
+from app.core.cache import response_cache
+from app.core.configs.settings import SqlProfileMode, settings
+from app.core.database import async_session, dispose_engine, warm_up_pool
+from app.core.database.session import named_engines
+from app.core.metrics.collectors import register_collectors
+from app.core.metrics.database import instrument_engine
+from app.core.metrics.middleware import MetricsMiddleware
+from app.core.metrics.profiler import SqlProfilerMiddleware, instrument_engine_for_profiling
+from app.core.stats import review_stats, view_count_buffer
+from app.core.storage.static_files import UploadStaticFiles
+from app.core.utils.image import shutdown_image_executor
+from app.log import initialize_log, shutdown_log, start_log
+from app.log.access import AccessLogMiddleware
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    start_log()
+
+    # 커넥션 풀 미리 채우기 (실패하면 요청 시 연결)
+    try:
+        await warm_up_pool()
+    except Exception:
+        logger.exception("Failed to warm up the database pool")
+
+    # 리뷰 통계 미리 집계 (실패하면 첫 조회 시 다시 집계)
+    try:
+        async with async_session() as session:
+            await review_stats.rebuild(session)
+    except Exception:
+        logger.exception("Failed to build review stats at startup")
+
+    view_count_buffer.start()
+
+    yield
+
+    # 남은 조회수 증가분 반영
+    await view_count_buffer.stop()
+    shutdown_image_executor()
+    await response_cache.close()
+    await dispose_engine()
+    shutdown_log()
+
 
 app = FastAPI(
     title="Logo Design API",
     description="Logo Design Website Backend API",
     version="1.0.0",
     default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -27,13 +75,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 메트릭 (라우트별 지연 시간, 요청당 SQL 수/시간)
+if settings.METRICS_ENABLED:
+    for engine_name, engine in named_engines().items():
+        instrument_engine(engine, engine_name)
+    register_collectors()
+    app.add_middleware(MetricsMiddleware)
+
+# SQL 프로필 (요청별 쿼리 수, DB 시간, 느린/반복 쿼리)
+if settings.SQL_PROFILE_MODE != SqlProfileMode.OFF:
+    for engine in named_engines().values():
+        instrument_engine_for_profiling(engine)
+    app.add_middleware(SqlProfilerMiddleware)
+
+# 접근 로그 (가장 바깥에서 전체 처리 시간을 측정)
+app.add_middleware(AccessLogMiddleware)
+
 # static path 설정
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+app.mount("/uploads", UploadStaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
 
 initialize_log()
 
 # Health check
 app.include_router(health_router, prefix="/api/v1")
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
 
 # API routes
 app.include_router(auth_router, prefix="/api/v1")
@@ -4,16 +4,14 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.jwt_codec import JWTHandler, TokenType
-from app.auth.password_hasher import PasswordHasher
+from app.auth.password_hasher import PasswordHasher, PasswordHasherBusyError
 from app.core.dependencies import CurrentSession
 from app.dtos.auth import LoginRequest, TokenRefreshResponse, TokenResponse
-from app.log.route import LoggedRoute
 from app.models.user import User
 
 router = APIRouter(
     prefix="/auth",
     tags=["Authentication"],
-    route_class=LoggedRoute,
 )
 
 
@@ -32,8 +30,17 @@ async def login(
             detail="Incorrect email or password",
         )
 
-    # Verify password
-    if not PasswordHasher.verify_password(login_data.password, user.hashed_password):
+    # Verify password (off the event loop)
+    try:
+        is_valid_password = await PasswordHasher.verify_password_async(login_data.password, user.hashed_password)
+    except PasswordHasherBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
+
+    if not is_valid_password:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
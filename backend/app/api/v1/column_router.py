@@ -1,18 +1,22 @@
-from fastapi import APIRouter, Depends, File, Form, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, Query, Request, Response, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import CurrentAdmin
-from app.core.dependencies import get_db
+from app.core.dependencies import get_db, get_read_db
+from app.core.utils.conditional import is_not_modified, not_modified_response, set_validator_headers
 from app.core.utils.uuid_formatter import get_uuid_id
-from app.dtos.column.column_response import ColumnResponse
-from app.dtos.common.paginated_response import PaginatedResponse
-from app.log.route import LoggedRoute
+from app.dtos.column.column_response import ColumnResponse, ColumnSummaryResponse
+from app.dtos.common.list_view import ListView
+from app.dtos.common.paginated_response import CursorPaginatedResponse, PaginatedResponse, PaginationMode
 from app.models.column_enums import ColumnStatus
 from app.services.column_service import (
     service_create_column,
     service_delete_column,
     service_get_column,
+    service_get_column_validator,
     service_get_columns,
+    service_get_columns_by_cursor,
+    service_get_columns_validator,
     service_increment_view_count,
     service_update_column,
 )
@@ -20,24 +24,51 @@ from app.services.column_service import (
 router = APIRouter(
     prefix="/columns",
     tags=["Columns"],
-    route_class=LoggedRoute,
 )
 
 
-@router.get("", response_model=PaginatedResponse[ColumnResponse])
+ColumnListResponse = (
+    PaginatedResponse[ColumnResponse | ColumnSummaryResponse]
+    | CursorPaginatedResponse[ColumnResponse | ColumnSummaryResponse]
+)
+
+
+@router.get("", response_model=ColumnListResponse)
 async def api_get_columns(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1, description="페이지 번호"),
     per_page: int = Query(12, ge=1, le=100, description="페이지당 항목 수"),
     status: ColumnStatus | None = Query(None, description="칼럼 상태"),
-    session: AsyncSession = Depends(get_db),
-) -> PaginatedResponse[ColumnResponse]:
-    return await service_get_columns(session, page, per_page, status)
+    pagination: PaginationMode = Query(PaginationMode.OFFSET, description="페이지네이션 방식"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor/prev_cursor"),
+    view: ListView = Query(ListView.FULL, description="summary면 본문 없이 카드 필드만 반환"),
+    excerpt_length: int = Query(0, ge=0, le=500, description="summary 응답에 포함할 본문 앞부분 길이"),
+    session: AsyncSession = Depends(get_read_db),
+) -> ColumnListResponse | Response:
+    # 목록이 바뀌지 않았으면 목록 조회 없이 304
+    validator = await service_get_columns_validator(session, status)
+    if is_not_modified(request, validator):
+        return not_modified_response(validator)
+    set_validator_headers(response, validator)
+
+    if pagination == PaginationMode.CURSOR or cursor is not None:
+        return await service_get_columns_by_cursor(session, per_page, cursor, status, view, excerpt_length)
+    return await service_get_columns(session, page, per_page, status, view, excerpt_length)
 
 
 @router.get("/{uuid}", response_model=ColumnResponse)
 async def api_get_column(
-    column_id: str = Depends(get_uuid_id), session: AsyncSession = Depends(get_db)
-) -> ColumnResponse:
+    request: Request,
+    response: Response,
+    column_id: str = Depends(get_uuid_id),
+    session: AsyncSession = Depends(get_read_db),
+) -> ColumnResponse | Response:
+    validator = await service_get_column_validator(session, column_id)
+    if is_not_modified(request, validator):
+        return not_modified_response(validator)
+    set_validator_headers(response, validator)
+
     return await service_get_column(session, column_id)
 
 
@@ -1,14 +1,28 @@
 from fastapi import APIRouter
 
-from app.log.route import LoggedRoute
+from app.core.cache import response_cache
+from app.core.database import engine, pool_stats, read_engine, replica_engines
 
 router = APIRouter(
     prefix="/health",
     tags=["Health"],
-    route_class=LoggedRoute,
 )
 
 
 @router.get("")
 async def health_check() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@router.get("/cache")
+async def cache_stats() -> dict[str, int | float]:
+    return response_cache.stats()
+
+
+@router.get("/db")
+async def db_pool_stats() -> dict[str, dict[str, int | float] | list[dict[str, int | float]]]:
+    return {
+        "primary": pool_stats(engine),
+        "primary_read": pool_stats(read_engine),
+        "replicas": [pool_stats(replica) for replica in replica_engines],
+    }
@@ -0,0 +1,35 @@
+import hmac
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from app.core.configs import settings
+from app.core.metrics import registry
+
+router = APIRouter(
+    prefix="/metrics",
+    tags=["Metrics"],
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+metrics_security = HTTPBearer(auto_error=False)
+
+
+async def verify_metrics_token(credentials: HTTPAuthorizationCredentials | None = Depends(metrics_security)) -> None:
+    """METRICS_TOKEN이 설정되어 있으면 같은 Bearer 토큰을 보낸 요청만 허용합니다."""
+    token = settings.METRICS_TOKEN
+    if token is None:
+        return
+    if credentials is None or not hmac.compare_digest(credentials.credentials.encode(), token.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@router.get("", response_class=PlainTextResponse, include_in_schema=False, dependencies=[Depends(verify_metrics_token)])
+async def metrics() -> PlainTextResponse:
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
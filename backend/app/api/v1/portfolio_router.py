@@ -1,40 +1,72 @@
-from fastapi import APIRouter, Depends, File, Form, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, Query, Request, Response, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import CurrentAdmin
-from app.core.dependencies import get_db
+from app.core.dependencies import get_db, get_read_db
+from app.core.utils.conditional import is_not_modified, not_modified_response, set_validator_headers
 from app.core.utils.uuid_formatter import get_uuid_id
-from app.dtos.common.paginated_response import PaginatedResponse
-from app.dtos.portfolio.portfolio_response import PortfolioResponse
-from app.log.route import LoggedRoute
+from app.dtos.common.list_view import ListView
+from app.dtos.common.paginated_response import CursorPaginatedResponse, PaginatedResponse, PaginationMode
+from app.dtos.portfolio.portfolio_response import PortfolioResponse, PortfolioSummaryResponse
 from app.services.portfolio_service import (
     service_create_portfolio,
     service_delete_portfolio,
     service_get_portfolio,
+    service_get_portfolio_validator,
     service_get_portfolios,
+    service_get_portfolios_by_cursor,
+    service_get_portfolios_validator,
     service_update_portfolio,
 )
 
 router = APIRouter(
     prefix="/portfolios",
     tags=["Portfolios"],
-    route_class=LoggedRoute,
 )
 
 
-@router.get("", response_model=PaginatedResponse[PortfolioResponse])
+PortfolioListResponse = (
+    PaginatedResponse[PortfolioResponse | PortfolioSummaryResponse]
+    | CursorPaginatedResponse[PortfolioResponse | PortfolioSummaryResponse]
+)
+
+
+@router.get("", response_model=PortfolioListResponse)
 async def api_get_portfolios(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1, description="페이지 번호"),
     per_page: int = Query(12, ge=1, le=100, description="페이지당 항목 수"),
-    session: AsyncSession = Depends(get_db),
-) -> PaginatedResponse[PortfolioResponse]:
-    return await service_get_portfolios(session, page, per_page)
+    pagination: PaginationMode = Query(PaginationMode.OFFSET, description="페이지네이션 방식"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor/prev_cursor"),
+    view: ListView = Query(ListView.FULL, description="summary면 설명 없이 카드 필드만 반환"),
+    excerpt_length: int = Query(0, ge=0, le=500, description="summary 응답에 포함할 설명 앞부분 길이"),
+    session: AsyncSession = Depends(get_read_db),
+) -> PortfolioListResponse | Response:
+    # 목록이 바뀌지 않았으면 목록 조회 없이 304
+    validator = await service_get_portfolios_validator(session)
+    if is_not_modified(request, validator):
+        return not_modified_response(validator)
+    set_validator_headers(response, validator)
+
+    if pagination == PaginationMode.CURSOR or cursor is not None:
+        return await service_get_portfolios_by_cursor(session, per_page, cursor, view, excerpt_length)
+    return await service_get_portfolios(session, page, per_page, view, excerpt_length)
 
 
 @router.get("/{uuid}", response_model=PortfolioResponse)
 async def api_get_portfolio(
-    portfolio_id: str = Depends(get_uuid_id), session: AsyncSession = Depends(get_db)
-) -> PortfolioResponse:
+    request: Request,
+    response: Response,
+    portfolio_id: str = Depends(get_uuid_id),
+    session: AsyncSession = Depends(get_read_db),
+) -> PortfolioResponse | Response:
+    validator = await service_get_portfolio_validator(session, portfolio_id)
+    if validator is not None:
+        if is_not_modified(request, validator):
+            return not_modified_response(validator)
+        set_validator_headers(response, validator)
+
     return await service_get_portfolio(session, portfolio_id)
 
 
@@ -1,53 +1,89 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, Response, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import CurrentAdmin
-from app.core.dependencies import get_db
+from app.core.dependencies import get_db, get_read_db
+from app.core.utils.conditional import (
+    is_not_modified,
+    make_validator,
+    not_modified_response,
+    set_validator_headers,
+)
 from app.core.utils.uuid_formatter import get_uuid_id
-from app.dtos.common.paginated_response import PaginatedResponse
+from app.dtos.common.paginated_response import CursorPaginatedResponse, PaginatedResponse, PaginationMode
 from app.dtos.review import ReviewStatsResponse
 from app.dtos.review.review_query import ReviewQueryParams
 from app.dtos.review.review_response import ReviewResponse
-from app.log.route import LoggedRoute
 from app.services.review_service import (
     service_create_review,
     service_delete_review,
     service_get_review_by_id,
     service_get_review_stats,
+    service_get_review_validator,
     service_get_reviews,
+    service_get_reviews_by_cursor,
+    service_get_reviews_validator,
     service_update_review,
 )
 
 router = APIRouter(
     prefix="/reviews",
     tags=["Reviews"],
-    route_class=LoggedRoute,
 )
 
 
-@router.get("", response_model=PaginatedResponse[ReviewResponse])
+@router.get("", response_model=PaginatedResponse[ReviewResponse] | CursorPaginatedResponse[ReviewResponse])
 async def api_get_reviews(
+    request: Request,
+    response: Response,
     query_params: ReviewQueryParams = Depends(),
-    session: AsyncSession = Depends(get_db),
-) -> PaginatedResponse[ReviewResponse]:
+    session: AsyncSession = Depends(get_read_db),
+) -> PaginatedResponse[ReviewResponse] | CursorPaginatedResponse[ReviewResponse] | Response:
     """리뷰 목록을 조회합니다."""
+    # 목록이 바뀌지 않았으면 목록 조회 없이 304
+    validator = await service_get_reviews_validator(session, query_params.is_visible)
+    if is_not_modified(request, validator):
+        return not_modified_response(validator)
+    set_validator_headers(response, validator)
+
+    if query_params.pagination == PaginationMode.CURSOR or query_params.cursor is not None:
+        return await service_get_reviews_by_cursor(session=session, query_params=query_params)
     return await service_get_reviews(session=session, query_params=query_params)
 
 
 @router.get("/stats", response_model=ReviewStatsResponse)
-async def api_get_review_stats(session: AsyncSession = Depends(get_db)) -> ReviewStatsResponse:
+async def api_get_review_stats(
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_read_db),
+) -> ReviewStatsResponse | Response:
     """리뷰 통계를 조회합니다."""
-    return await service_get_review_stats(session=session)
+    # 통계는 메모리에서 바로 계산되므로 응답 값으로 검증자를 만들고 직렬화만 생략합니다.
+    stats = await service_get_review_stats(session=session)
+    validator = make_validator("review-stats", stats.model_dump(mode="json"))
+    if is_not_modified(request, validator):
+        return not_modified_response(validator)
+    set_validator_headers(response, validator)
+
+    return stats
 
 
 @router.get("/{uuid}", response_model=ReviewResponse)
 async def api_get_review(
+    request: Request,
+    response: Response,
     review_id: str = Depends(get_uuid_id),
-    session: AsyncSession = Depends(get_db),
-) -> ReviewResponse:
+    session: AsyncSession = Depends(get_read_db),
+) -> ReviewResponse | Response:
     """리뷰 상세 정보를 조회합니다."""
+    validator = await service_get_review_validator(session=session, review_id=review_id)
+    if validator is not None:
+        if is_not_modified(request, validator):
+            return not_modified_response(validator)
+        set_validator_headers(response, validator)
+
     review = await service_get_review_by_id(session=session, review_id=review_id)
     if not review:
         raise HTTPException(status_code=404, detail="Review not found")
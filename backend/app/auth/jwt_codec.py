@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from enum import StrEnum
 
@@ -5,6 +6,7 @@ import jwt
 from pydantic import BaseModel
 
 from app.core.configs import settings
+from app.dtos.frozen_config import FROZEN_CONFIG
 
 
 class UserRole(StrEnum):
@@ -18,6 +20,8 @@ class TokenType(StrEnum):
 
 
 class JWTPayload(BaseModel):
+    model_config = FROZEN_CONFIG
+
     sub: str  # user_id
     email: str
     role: UserRole
@@ -26,6 +30,9 @@ class JWTPayload(BaseModel):
 
 
 class JWTHandler:
+    # 서명 검증을 마친 토큰 -> payload (LRU). 토큰 문자열 전체를 키로 사용합니다.
+    _verified_tokens: OrderedDict[str, JWTPayload] = OrderedDict()
+
     @classmethod
     def create_access_token(
         cls,
@@ -86,6 +93,14 @@ class JWTHandler:
         token: str,
         verify_exp: bool = True,
     ) -> JWTPayload:
+        cached_payload = cls._verified_tokens.get(token)
+        if cached_payload is not None:
+            if verify_exp and cached_payload.exp <= datetime.now(timezone.utc):
+                cls._verified_tokens.pop(token, None)
+                raise ValueError("Token has expired")
+            cls._verified_tokens.move_to_end(token)
+            return cached_payload
+
         try:
             payload = jwt.decode(
                 token,
@@ -93,8 +108,20 @@ class JWTHandler:
                 algorithms=[settings.JWT_ALGORITHM],
                 options={"verify_exp": verify_exp},
             )
-            return JWTPayload(**payload)
         except jwt.ExpiredSignatureError:
             raise ValueError("Token has expired")
         except jwt.InvalidTokenError:
             raise ValueError("Invalid token")
+
+        jwt_payload = JWTPayload(**payload)
+        cls._cache_verified_token(token, jwt_payload)
+        return jwt_payload
+
+    @classmethod
+    def _cache_verified_token(cls, token: str, payload: JWTPayload) -> None:
+        if settings.JWT_CACHE_SIZE <= 0:
+            return
+
+        cls._verified_tokens[token] = payload
+        while len(cls._verified_tokens) > settings.JWT_CACHE_SIZE:
+            cls._verified_tokens.popitem(last=False)
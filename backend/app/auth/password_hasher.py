@@ -1,9 +1,27 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
 from passlib.context import CryptContext
 
+from app.core.configs import settings
+
+T = TypeVar("T")
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt는 GIL을 놓고 계산하므로 스레드 풀로도 이벤트 루프를 막지 않습니다.
+_executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hasher")
+
+
+class PasswordHasherBusyError(Exception):
+    pass
+
 
 class PasswordHasher:
+    # 실행 중이거나 대기 중인 해시 작업 수 (이벤트 루프에서만 변경)
+    _pending = 0
+
     @classmethod
     def hash_password(cls, password: str) -> str:
         return pwd_context.hash(password)
@@ -11,3 +29,27 @@ class PasswordHasher:
     @classmethod
     def verify_password(cls, plain_password: str, hashed_password: str) -> bool:
         return pwd_context.verify(plain_password, hashed_password)
+
+    @classmethod
+    async def hash_password_async(cls, password: str) -> str:
+        return await cls._run_in_pool(cls.hash_password, password)
+
+    @classmethod
+    async def verify_password_async(cls, plain_password: str, hashed_password: str) -> bool:
+        return await cls._run_in_pool(cls.verify_password, plain_password, hashed_password)
+
+    @classmethod
+    async def _run_in_pool(cls, func: Callable[..., T], *args: str) -> T:
+        if cls._pending >= settings.PASSWORD_HASH_MAX_PENDING:
+            raise PasswordHasherBusyError("Too many password hashing requests")
+
+        loop = asyncio.get_running_loop()
+        future = _executor.submit(func, *args)
+        cls._pending += 1
+        # 요청이 취소되어도 스레드의 bcrypt 계산은 끝까지 돌므로, 계산이 실제로 끝났을 때 줄입니다.
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(cls._release))
+        return await asyncio.wrap_future(future)
+
+    @classmethod
+    def _release(cls) -> None:
+        cls._pending -= 1
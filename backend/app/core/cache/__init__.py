@@ -0,0 +1,60 @@
+import os
+
+from app.core.cache.backend import (
+    CacheBackend,
+    KeyValueClient,
+    LocalKeyValueClient,
+    MemoryCacheBackend,
+    SharedCacheBackend,
+)
+from app.core.cache.response_cache import ResponseCache
+from app.core.configs import settings
+from app.core.configs.settings import CacheBackendType
+
+
+def worker_count() -> int:
+    """gunicorn/uvicorn이 읽는 WEB_CONCURRENCY로 워커 프로세스 수를 구합니다. (기본 1)"""
+    return int(os.environ.get("WEB_CONCURRENCY", "1"))
+
+
+def _check_single_worker(backend_type: CacheBackendType) -> None:
+    # 무효화가 쓰기를 처리한 워커에만 반영되므로 다른 워커는 TTL 동안 이전 응답을 돌려줍니다.
+    # gunicorn -w, uvicorn --workers는 WEB_CONCURRENCY를 설정하지 않으므로 운영자가 직접 단일 워커임을 밝혀야 합니다.
+    if not settings.RESPONSE_CACHE_SINGLE_WORKER or worker_count() > 1:
+        raise ValueError(
+            f"RESPONSE_CACHE_BACKEND={backend_type} is per worker process; "
+            "set RESPONSE_CACHE_SINGLE_WORKER=true only when running a single worker, or use redis (or none)"
+        )
+
+
+def create_cache_backend(backend_type: CacheBackendType) -> CacheBackend | None:
+    if backend_type == CacheBackendType.MEMORY:
+        _check_single_worker(backend_type)
+        return MemoryCacheBackend(max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES)
+    if backend_type == CacheBackendType.LOCAL:
+        _check_single_worker(backend_type)
+        return SharedCacheBackend(LocalKeyValueClient())
+    if backend_type == CacheBackendType.REDIS:
+        from redis.asyncio import Redis
+
+        return SharedCacheBackend(Redis.from_url(settings.RESPONSE_CACHE_REDIS_URL))
+    return None
+
+
+response_cache = ResponseCache(
+    backend=create_cache_backend(settings.RESPONSE_CACHE_BACKEND),
+    ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+    replica_lag=settings.DB_STICKY_PRIMARY_SECONDS if settings.DB_REPLICA_URLS else 0.0,
+)
+
+__all__ = [
+    "CacheBackend",
+    "KeyValueClient",
+    "LocalKeyValueClient",
+    "MemoryCacheBackend",
+    "ResponseCache",
+    "SharedCacheBackend",
+    "create_cache_backend",
+    "response_cache",
+    "worker_count",
+]
@@ -0,0 +1,146 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Protocol
+
+
+class CacheBackend(ABC):
+    # True면 값을 직렬화하지 않고 파이썬 객체 그대로 저장합니다.
+    stores_objects: bool = False
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: int) -> None: ...
+
+    @abstractmethod
+    async def get_generation(self, namespace: str) -> int: ...
+
+    @abstractmethod
+    async def bump_generation(self, namespace: str) -> None: ...
+
+    async def close(self) -> None:
+        return None
+
+    @property
+    def size(self) -> int:
+        return 0
+
+    @property
+    def evictions(self) -> int:
+        return 0
+
+
+class MemoryCacheBackend(CacheBackend):
+    """프로세스 내 LRU + TTL 캐시. 워커 프로세스마다 따로 유지됩니다."""
+
+    stores_objects = True
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._evictions = 0
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    async def get_generation(self, namespace: str) -> int:
+        return self._generations.get(namespace, 0)
+
+    async def bump_generation(self, namespace: str) -> None:
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+
+class KeyValueClient(Protocol):
+    """공유 캐시 저장소 클라이언트 인터페이스 (redis.asyncio.Redis와 같은 시그니처)."""
+
+    def get(self, name: str) -> Awaitable[bytes | str | None]: ...
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> Awaitable[Any]: ...
+
+    def incr(self, name: str, amount: int = 1) -> Awaitable[int]: ...
+
+    async def aclose(self) -> None: ...
+
+
+class SharedCacheBackend(CacheBackend):
+    """여러 워커가 함께 쓰는 외부 저장소 캐시. 값은 직렬화된 bytes로 저장됩니다."""
+
+    def __init__(self, client: KeyValueClient, prefix: str = "cache") -> None:
+        self._client = client
+        self._prefix = prefix
+
+    async def get(self, key: str) -> bytes | None:
+        value = await self._client.get(f"{self._prefix}:{key}")
+        # decode_responses=True로 만든 클라이언트는 str을 돌려줍니다.
+        return value.encode() if isinstance(value, str) else value
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        await self._client.set(f"{self._prefix}:{key}", value, ex=ttl)
+
+    async def get_generation(self, namespace: str) -> int:
+        value = await self._client.get(f"{self._prefix}:generation:{namespace}")
+        return int(value) if value is not None else 0
+
+    async def bump_generation(self, namespace: str) -> None:
+        await self._client.incr(f"{self._prefix}:generation:{namespace}")
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class LocalKeyValueClient:
+    """테스트와 로컬 개발용 KeyValueClient 구현."""
+
+    def __init__(self) -> None:
+        self._values: dict[str, tuple[float | None, bytes]] = {}
+
+    async def get(self, name: str) -> bytes | None:
+        entry = self._values.get(name)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._values[name]
+            return None
+        return value
+
+    async def set(self, name: str, value: bytes, ex: int | None = None) -> None:
+        self._values[name] = (time.monotonic() + ex if ex is not None else None, value)
+
+    async def incr(self, name: str, amount: int = 1) -> int:
+        current = await self.get(name)
+        value = int(current) + amount if current is not None else amount
+        self._values[name] = (None, str(value).encode())
+        return value
+
+    async def aclose(self) -> None:
+        self._values.clear()
@@ -0,0 +1,140 @@
+import asyncio
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, ParamSpec, TypeVar, get_type_hints
+
+import orjson
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache.backend import CacheBackend
+from app.core.database.hooks import on_commit
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# 쓰기 직후라 primary에서 읽는 세션 (session.info 키). 복제본에서 채운 캐시 항목을 읽지 않습니다.
+READ_YOUR_WRITES = "read_your_writes"
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Cannot build cache key from {type(value).__name__}")
+
+
+class ResponseCache:
+    """
+    service_get_* 함수 앞에 두는 read-through 캐시.
+
+    캐시 키는 네임스페이스의 세대 번호 + 함수 이름 + 인자로 구성됩니다.
+    쓰기 트랜잭션이 커밋되면 네임스페이스의 세대를 올려 이전 항목을 모두 무효화합니다.
+    """
+
+    def __init__(self, backend: CacheBackend | None, ttl: int, replica_lag: float = 0.0) -> None:
+        self._backend = backend
+        self._ttl = ttl
+        # 복제본을 쓰면 커밋 후 이 시간이 지나 한 번 더 무효화합니다.
+        self._replica_lag = replica_lag
+        self._delayed_invalidations: set[asyncio.Task[None]] = set()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._backend is not None
+
+    def cached(self, namespace: str) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+        """
+        AsyncSession을 받는 조회 함수의 결과를 캐시합니다.
+
+        Args:
+            namespace: 무효화 단위 (예: "columns")
+        """
+
+        def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+            signature = inspect.signature(func)
+
+            @functools.cache
+            def adapter() -> TypeAdapter[Any]:
+                return TypeAdapter(get_type_hints(func)["return"])
+
+            @functools.wraps(func)
+            async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                backend = self._backend
+                if backend is None:
+                    return await func(*args, **kwargs)
+
+                # 호출 방식(위치/키워드)과 무관하게 같은 키가 나오도록 인자를 정규화하고 세션은 제외
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                sessions = [value for value in bound.arguments.values() if isinstance(value, AsyncSession)]
+                if any(session.info.get(READ_YOUR_WRITES) for session in sessions):
+                    return await func(*args, **kwargs)
+
+                arguments = orjson.dumps(
+                    {name: value for name, value in bound.arguments.items() if not isinstance(value, AsyncSession)},
+                    default=_default,
+                    option=orjson.OPT_SORT_KEYS,
+                )
+                generation = await backend.get_generation(namespace)
+                key = f"{namespace}:{generation}:{func.__name__}:{arguments.decode()}"
+
+                cached_value = await backend.get(key)
+                if cached_value is not None:
+                    self.hits += 1
+                    if backend.stores_objects:
+                        return cached_value  # type: ignore[no-any-return]
+                    return adapter().validate_json(cached_value)  # type: ignore[no-any-return]
+
+                self.misses += 1
+                value = await func(*args, **kwargs)
+                await backend.set(key, value if backend.stores_objects else adapter().dump_json(value), self._ttl)
+                return value
+
+            return wrapper
+
+        return decorator
+
+    async def invalidate(self, *namespaces: str) -> None:
+        """네임스페이스의 캐시를 즉시 무효화합니다."""
+        backend = self._backend
+        if backend is None:
+            return
+
+        for namespace in namespaces:
+            await backend.bump_generation(namespace)
+
+    def invalidate_on_commit(self, session: AsyncSession, *namespaces: str) -> None:
+        """세션의 트랜잭션이 커밋되면 네임스페이스의 캐시를 무효화합니다."""
+        if self._backend is not None:
+            on_commit(session, lambda: self._invalidate_after_commit(namespaces))
+
+    async def _invalidate_after_commit(self, namespaces: tuple[str, ...]) -> None:
+        await self.invalidate(*namespaces)
+        if self._replica_lag > 0:
+            # 복제본이 커밋을 따라잡기 전에 복제본에서 읽어 채운 항목을 버립니다.
+            task = asyncio.create_task(self._invalidate_later(namespaces))
+            self._delayed_invalidations.add(task)
+            task.add_done_callback(self._delayed_invalidations.discard)
+
+    async def _invalidate_later(self, namespaces: tuple[str, ...]) -> None:
+        await asyncio.sleep(self._replica_lag)
+        await self.invalidate(*namespaces)
+
+    async def close(self) -> None:
+        """대기 중인 지연 무효화를 취소하고 백엔드 연결을 닫습니다."""
+        for task in list(self._delayed_invalidations):
+            task.cancel()
+        if self._backend is not None:
+            await self._backend.close()
+
+    def stats(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self._backend.evictions if self._backend else 0,
+            "size": self._backend.size if self._backend else 0,
+        }
@@ -12,6 +12,30 @@ class Env(StrEnum):
     PROD = "prod"
 
 
+class CacheBackendType(StrEnum):
+    NONE = "none"
+    MEMORY = "memory"  # 워커 프로세스마다 따로 유지 (단일 워커 전용)
+    LOCAL = "local"  # 워커 프로세스마다 따로 유지 (단일 워커 전용, 테스트/로컬 개발용)
+    REDIS = "redis"  # 여러 워커가 공유
+
+
+class ReplicaStrategy(StrEnum):
+    ROUND_ROBIN = "round_robin"
+    LEAST_CONNECTIONS = "least_connections"
+
+
+class ListCountMode(StrEnum):
+    EXACT = "exact"  # 요청마다 COUNT(*)
+    CACHED = "cached"  # 필터별 개수를 메모리에 두고 쓰기가 커밋될 때 증감
+    ESTIMATED = "estimated"  # cached + 큰 테이블은 테이블 통계의 추정치 사용 (MySQL)
+
+
+class SqlProfileMode(StrEnum):
+    OFF = "off"
+    HEADER = "header"  # DEBUG일 때 X-Profile-SQL 헤더가 있는 요청만
+    ALWAYS = "always"
+
+
 class Settings(BaseSettings):
     # Environment
     ENV: Env = Env.LOCAL
@@ -23,12 +47,34 @@ class Settings(BaseSettings):
     DB_USER: str = "root"
     DB_PASSWORD: str = "password"
     DB_NAME: str = "logo_design_db"
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0  # 커넥션을 기다리는 최대 시간 (초)
+    DB_POOL_RECYCLE: int = 1800  # MySQL wait_timeout보다 짧게
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP: int = 2  # 시작 시 미리 열어 둘 커넥션 수
+    DB_READ_AUTOCOMMIT: bool = False  # 조회 전용 라우트는 AUTOCOMMIT 커넥션 풀 사용 (COMMIT/ROLLBACK 왕복 생략)
+    # AUTOCOMMIT 조회 풀은 primary 풀과 따로 커넥션을 엽니다.
+    # 워커당 primary 커넥션은 최대 DB_POOL_SIZE + DB_MAX_OVERFLOW + DB_READ_POOL_SIZE + DB_READ_MAX_OVERFLOW개입니다.
+    DB_READ_POOL_SIZE: int = 5
+    DB_READ_MAX_OVERFLOW: int = 5
+    DB_READ_ONLY_TRANSACTION: bool = False  # AUTOCOMMIT을 쓰지 않을 때 조회 트랜잭션을 READ ONLY로 시작 (MySQL)
+    DB_REPLICA_URLS: list[str] = []  # 읽기 전용 복제본 URL (비어 있으면 모든 요청을 primary로)
+    DB_REPLICA_STRATEGY: ReplicaStrategy = ReplicaStrategy.ROUND_ROBIN
+    DB_STICKY_PRIMARY_SECONDS: float = 5.0  # 쓰기 후 이 시간 동안 같은 클라이언트의 읽기를 primary로
+    DB_STICKY_MAX_CLIENTS: int = 10000
 
     # JWT
     JWT_SECRET_KEY: str = "your-secret-key-here"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    JWT_CACHE_SIZE: int = 1024  # 검증된 토큰 캐시 크기 (0이면 사용 안 함)
+
+    # Password Hashing
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 16
 
     # CORS
     CORS_ORIGINS: str = "http://localhost:3000,http://127.0.0.1:3000"
@@ -36,6 +82,52 @@ class Settings(BaseSettings):
     # File Upload
     UPLOAD_DIR: Path = Path(__file__).resolve().parent.parent.parent.parent / "uploads"
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10MB
+    UPLOAD_CONCURRENCY: int = 4
+    UPLOAD_GC_GRACE_SECONDS: int = 24 * 60 * 60  # 이보다 최근에 저장된 파일은 GC하지 않음
+    UPLOAD_RELEASE_GRACE_SECONDS: int = (
+        10 * 60
+    )  # 이보다 최근에 저장(또는 재업로드)된 blob은 참조가 없어도 바로 지우지 않음
+    UPLOAD_CACHE_MAX_AGE: int = 3600  # blob 저장소 이전 파일의 Cache-Control max-age
+    UPLOAD_ACCEL_REDIRECT_PREFIX: str | None = None  # 예: "/protected-uploads" (nginx internal location)
+
+    # Image variants
+    IMAGE_VARIANT_WIDTHS: list[int] = [320, 640, 1280]
+    IMAGE_VARIANT_FORMAT: str = "webp"
+    IMAGE_VARIANT_QUALITY: int = 80
+    IMAGE_PROCESS_WORKERS: int = 2
+
+    # Review Stats
+    REVIEW_STATS_REFRESH_SECONDS: int = 300
+
+    # List Counts (페이지 목록의 total)
+    LIST_COUNT_MODE: ListCountMode = ListCountMode.CACHED
+    LIST_COUNT_REFRESH_SECONDS: int = 300  # 다른 워커의 변경을 반영하기 위해 다시 세는 주기
+    LIST_COUNT_ESTIMATE_THRESHOLD: int = 100_000  # estimated 모드에서 추정치가 이보다 크면 추정치 사용
+
+    # View Count
+    VIEW_COUNT_FLUSH_SECONDS: float = 5.0
+
+    # Response Cache
+    RESPONSE_CACHE_BACKEND: CacheBackendType = CacheBackendType.NONE
+    # memory/local은 워커마다 따로 유지되므로 워커 하나로만 실행할 때 True로 켜야 쓸 수 있습니다.
+    RESPONSE_CACHE_SINGLE_WORKER: bool = False
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1024
+    RESPONSE_CACHE_TTL_SECONDS: int = 30
+    RESPONSE_CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+
+    # Access Log
+    ACCESS_LOG_ENABLED: bool = True
+    ACCESS_LOG_SAMPLE_RATE: float = 1.0  # 5xx는 항상 기록
+    ACCESS_LOG_BODY_MAX_BYTES: int = 0  # JSON/폼 요청 본문을 기록할 최대 크기 (비밀번호가 포함될 수 있어 기본은 0)
+
+    # Metrics (/metrics, Prometheus 텍스트 형식)
+    METRICS_ENABLED: bool = False
+    METRICS_TOKEN: str | None = None  # 설정하면 /metrics는 "Authorization: Bearer <토큰>" 요청만 허용
+
+    # SQL Profiling (Server-Timing 헤더 + app.sql_profile 로그)
+    SQL_PROFILE_MODE: SqlProfileMode = SqlProfileMode.OFF
+    SQL_QUERY_BUDGET: int | None = None  # 프로필한 요청의 쿼리 수가 이를 넘으면 경고
+    SQL_QUERY_BUDGET_STRICT: bool = False  # 테스트용: 예산을 넘으면 QueryBudgetExceeded 발생
 
     # Debug
     DEBUG: bool = True
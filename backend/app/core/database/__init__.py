@@ -1,3 +1,25 @@
-from app.core.database.session import AsyncSessionLocal, Base, engine
+from app.core.database.session import (
+    AsyncSessionLocal,
+    Base,
+    async_session,
+    dispose_engine,
+    engine,
+    pool_stats,
+    read_engine,
+    read_session,
+    replica_engines,
+    warm_up_pool,
+)
 
-__all__ = ["AsyncSessionLocal", "Base", "engine"]
+__all__ = [
+    "AsyncSessionLocal",
+    "Base",
+    "async_session",
+    "dispose_engine",
+    "engine",
+    "pool_stats",
+    "read_engine",
+    "read_session",
+    "replica_engines",
+    "warm_up_pool",
+]
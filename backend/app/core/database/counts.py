@@ -0,0 +1,145 @@
+import time
+from collections import Counter
+from collections.abc import Hashable
+from typing import Any, NamedTuple
+
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.configs import settings
+from app.core.configs.settings import ListCountMode
+from app.core.database.hooks import on_commit
+
+# (테이블 이름, 필터 값). 필터 값이 None이면 필터 없는 전체 목록
+CountKey = tuple[str, Hashable]
+
+
+class ListCount(NamedTuple):
+    total: int
+    estimated: bool
+
+
+class ListCountCache:
+    """
+    페이지 목록의 전체 개수(total)를 필터별로 메모리에 유지합니다.
+
+    목록 요청마다 COUNT(*)로 인덱스 전체를 훑는 대신 처음 한 번만 세고, 이후에는 쓰기가 커밋될 때 증감합니다.
+    다른 워커 프로세스의 변경은 보이지 않으므로 `refresh_interval`초마다 다시 셉니다.
+    estimated 모드에서는 테이블 통계로 추정한 행 수가 `estimate_threshold` 이상이면 세지 않고 추정치를 씁니다.
+    """
+
+    def __init__(
+        self, mode: ListCountMode, refresh_interval: float, estimate_threshold: int, replica_lag: float = 0.0
+    ) -> None:
+        self._mode = mode
+        self._refresh_interval = refresh_interval
+        self._estimate_threshold = estimate_threshold
+        self._replica_lag = replica_lag
+        self._entries: dict[CountKey, tuple[float, ListCount]] = {}
+        self._generations: Counter[str] = Counter()
+        self._written_at: dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def count(
+        self, session: AsyncSession, query: Select[Any], table: str, filter_value: Hashable = None
+    ) -> ListCount:
+        """필터만 적용한 query의 행 수를 반환합니다."""
+        if self._mode == ListCountMode.EXACT:
+            return ListCount(await self._count_rows(session, query), estimated=False)
+
+        key = (table, filter_value)
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self._refresh_interval:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        generation = self._generations[table]
+        result = await self._load(session, query, table, filter_value)
+
+        # 세는 동안 커밋된 변경이 있거나 복제본이 아직 변경을 따라잡지 못했을 수 있으면 저장하지 않습니다.
+        if generation == self._generations[table] and not self._within_replica_lag(table):
+            self._entries[key] = (time.monotonic(), result)
+        return result
+
+    def apply(self, table: str, before: Hashable, after: Hashable) -> None:
+        """
+        행 하나의 변경을 저장된 개수에 반영합니다.
+
+        Args:
+            table: 테이블 이름
+            before: 변경 전 행의 필터 값 (새 행이면 None)
+            after: 변경 후 행의 필터 값 (삭제되었으면 None)
+        """
+        if before == after:
+            return
+
+        self._generations[table] += 1
+        self._written_at[table] = time.monotonic()
+        for filter_value, delta in ((before, -1), (after, 1)):
+            if filter_value is None:
+                continue
+            for key in ((table, None), (table, filter_value)):
+                entry = self._entries.get(key)
+                if entry is not None:
+                    loaded_at, count = entry
+                    self._entries[key] = (loaded_at, count._replace(total=max(count.total + delta, 0)))
+
+    def apply_on_commit(self, session: AsyncSession, table: str, before: Hashable, after: Hashable) -> None:
+        """세션의 트랜잭션이 커밋된 뒤에 변경을 반영하도록 예약합니다."""
+        if before != after:
+            on_commit(session, lambda: self.apply(table, before, after))
+
+    def _within_replica_lag(self, table: str) -> bool:
+        written_at = self._written_at.get(table)
+        return written_at is not None and time.monotonic() - written_at < self._replica_lag
+
+    async def _load(self, session: AsyncSession, query: Select[Any], table: str, filter_value: Hashable) -> ListCount:
+        if self._mode == ListCountMode.ESTIMATED:
+            estimate = await self._estimate_rows(session, query, table, filter_value)
+            if estimate is not None and estimate >= self._estimate_threshold:
+                return ListCount(estimate, estimated=True)
+        return ListCount(await self._count_rows(session, query), estimated=False)
+
+    @staticmethod
+    async def _count_rows(session: AsyncSession, query: Select[Any]) -> int:
+        return await session.scalar(select(func.count()).select_from(query.subquery())) or 0
+
+    @staticmethod
+    async def _estimate_rows(
+        session: AsyncSession, query: Select[Any], table: str, filter_value: Hashable
+    ) -> int | None:
+        """
+        MySQL 통계로 행 수를 추정합니다. (다른 DB면 None)
+
+        필터가 없으면 InnoDB가 유지하는 TABLE_ROWS를, 있으면 EXPLAIN의 rows × filtered를 씁니다.
+        """
+        connection = await session.connection()
+        if connection.dialect.name != "mysql":
+            return None
+
+        if filter_value is None:
+            rows = await session.scalar(
+                text(
+                    "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"
+                ),
+                {"table": table},
+            )
+            return int(rows) if rows is not None else None
+
+        # 필터 값은 enum/bool뿐이므로 리터럴로 바로 넣습니다.
+        compiled = query.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+        plan = (await session.execute(text(f"EXPLAIN {compiled}"))).mappings().first()
+        if plan is None or plan["rows"] is None:
+            return None
+        return int(plan["rows"] * float(plan.get("filtered") or 100) / 100)
+
+
+list_counts = ListCountCache(
+    mode=settings.LIST_COUNT_MODE,
+    refresh_interval=settings.LIST_COUNT_REFRESH_SECONDS,
+    estimate_threshold=settings.LIST_COUNT_ESTIMATE_THRESHOLD,
+    replica_lag=settings.DB_STICKY_PRIMARY_SECONDS if settings.DB_REPLICA_URLS else 0.0,
+)
@@ -0,0 +1,59 @@
+import inspect
+from typing import Awaitable, Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+
+CommitHook = Callable[[], Awaitable[None] | None]
+
+_COMMIT_HOOKS_KEY = "commit_hooks"
+_ROLLBACK_HOOKS_KEY = "rollback_hooks"
+_HAS_WRITES_KEY = "has_writes"
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session: Session, flush_context: UOWTransaction) -> None:
+    session.info[_HAS_WRITES_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_bulk_write(orm_execute_state: ORMExecuteState) -> None:
+    # flush를 거치지 않는 update()/delete()/insert() 문
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[_HAS_WRITES_KEY] = True
+
+
+def has_writes(session: AsyncSession) -> bool:
+    """세션이 INSERT/UPDATE/DELETE를 실행했는지 반환합니다."""
+    return bool(session.info.get(_HAS_WRITES_KEY))
+
+
+def on_commit(session: AsyncSession, hook: CommitHook) -> None:
+    """트랜잭션이 커밋된 뒤에 실행할 콜백을 등록합니다. 롤백되면 실행되지 않습니다."""
+    session.info.setdefault(_COMMIT_HOOKS_KEY, []).append(hook)
+
+
+def on_rollback(session: AsyncSession, hook: CommitHook) -> None:
+    """트랜잭션이 롤백된 뒤에 실행할 콜백을 등록합니다. 커밋되면 실행되지 않습니다."""
+    session.info.setdefault(_ROLLBACK_HOOKS_KEY, []).append(hook)
+
+
+async def _run_hooks(session: AsyncSession, key: str) -> None:
+    hooks: list[CommitHook] = session.info.pop(key, [])
+    for hook in hooks:
+        result = hook()
+        if inspect.isawaitable(result):
+            await result
+
+
+async def run_commit_hooks(session: AsyncSession) -> None:
+    """등록된 커밋 콜백을 등록 순서대로 실행하고 롤백 콜백은 버립니다."""
+    session.info.pop(_ROLLBACK_HOOKS_KEY, None)
+    await _run_hooks(session, _COMMIT_HOOKS_KEY)
+
+
+async def run_rollback_hooks(session: AsyncSession) -> None:
+    """등록된 롤백 콜백을 등록 순서대로 실행하고 커밋 콜백은 버립니다."""
+    session.info.pop(_COMMIT_HOOKS_KEY, None)
+    await _run_hooks(session, _ROLLBACK_HOOKS_KEY)
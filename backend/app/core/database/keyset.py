@@ -0,0 +1,119 @@
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+from typing import Any, Generic, Sequence, TypeVar
+
+import orjson
+from sqlalchemy import ColumnElement, Select, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+class CursorDirection(StrEnum):
+    NEXT = "next"
+    PREV = "prev"
+
+
+@dataclass(frozen=True)
+class SortKey:
+    attribute: InstrumentedAttribute[Any]
+    descending: bool = False
+
+
+@dataclass(frozen=True)
+class KeysetPage(Generic[T]):
+    rows: list[T]
+    next_cursor: str | None
+    prev_cursor: str | None
+
+
+def _signature(keys: Sequence[SortKey]) -> str:
+    return ",".join(f"{key.attribute.key}:{'desc' if key.descending else 'asc'}" for key in keys)
+
+
+def encode_cursor(keys: Sequence[SortKey], direction: CursorDirection, row: Any) -> str:
+    values = []
+    for key in keys:
+        value = getattr(row, key.attribute.key)
+        values.append(value.isoformat() if isinstance(value, datetime) else value)
+
+    payload = orjson.dumps({"s": _signature(keys), "d": direction, "k": values})
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(keys: Sequence[SortKey], cursor: str) -> tuple[CursorDirection, list[Any]]:
+    try:
+        payload = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if payload["s"] != _signature(keys) or len(payload["k"]) != len(keys):
+            raise InvalidCursorError("Cursor does not match the requested sort order")
+
+        values = []
+        for key, value in zip(keys, payload["k"]):
+            python_type = key.attribute.type.python_type
+            values.append(datetime.fromisoformat(value) if python_type is datetime else python_type(value))
+        return CursorDirection(payload["d"]), values
+    except InvalidCursorError:
+        raise
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursorError("Invalid cursor")
+
+
+def _seek_condition(keys: Sequence[SortKey], values: Sequence[Any], backward: bool) -> ColumnElement[bool]:
+    # (a, b, c) 가 커서 이후인 조건: a > A OR (a = A AND b > B) OR (a = A AND b = B AND c > C)
+    clauses = []
+    for index, key in enumerate(keys):
+        before = key.descending != backward
+        comparison = key.attribute < values[index] if before else key.attribute > values[index]
+        equals = [keys[i].attribute == values[i] for i in range(index)]
+        clauses.append(and_(*equals, comparison))
+    return or_(*clauses)
+
+
+async def fetch_keyset_page(
+    session: AsyncSession,
+    query: Select[Any],
+    keys: Sequence[SortKey],
+    per_page: int,
+    cursor: str | None = None,
+) -> KeysetPage[Any]:
+    """
+    OFFSET과 COUNT 없이 정렬 키 기준으로 다음/이전 페이지를 조회합니다.
+
+    Args:
+        query: 필터가 적용된 조회 쿼리 (정렬은 keys로 지정)
+        keys: 정렬 키 목록. 마지막 키는 유일해야 합니다 (보통 id).
+        cursor: 이전 응답의 next_cursor 또는 prev_cursor
+
+    Raises:
+        InvalidCursorError: 커서를 해석할 수 없거나 정렬 기준이 다른 경우
+    """
+    backward = False
+    if cursor is not None:
+        direction, values = decode_cursor(keys, cursor)
+        backward = direction == CursorDirection.PREV
+        query = query.where(_seek_condition(keys, values, backward))
+
+    order_by = [key.attribute.desc() if key.descending != backward else key.attribute.asc() for key in keys]
+    result = await session.execute(query.order_by(*order_by).limit(per_page + 1))
+    rows = list(result.scalars().all())
+
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    if backward:
+        rows.reverse()
+
+    has_next = has_more if not backward else True
+    has_prev = has_more if backward else cursor is not None
+
+    return KeysetPage(
+        rows=rows,
+        next_cursor=encode_cursor(keys, CursorDirection.NEXT, rows[-1]) if rows and has_next else None,
+        prev_cursor=encode_cursor(keys, CursorDirection.PREV, rows[0]) if rows and has_prev else None,
+    )
@@ -0,0 +1,98 @@
+import hashlib
+import itertools
+import time
+from collections import OrderedDict
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from app.core.configs import settings
+from app.core.configs.settings import ReplicaStrategy
+from app.core.database.session import read_session, replica_sessions
+
+SessionFactory = async_sessionmaker[AsyncSession]
+
+
+def client_key(request: Request) -> str | None:
+    """
+    read-your-writes 고정에 쓰는 클라이언트 식별자. (Bearer 토큰의 해시)
+
+    프록시 뒤에서는 모든 요청의 클라이언트 주소가 같을 수 있으므로 토큰이 없으면 고정하지 않습니다.
+    """
+    authorization = request.headers.get("authorization")
+    if authorization:
+        return hashlib.blake2b(authorization.encode(), digest_size=16).hexdigest()
+    return None
+
+
+class ReplicaRouter:
+    """
+    읽기 요청을 복제본에 분산하고, 쓰기 직후의 클라이언트는 잠시 primary로 고정합니다.
+
+    복제 지연 때문에 방금 수정한 내용이 복제본에 아직 없을 수 있으므로
+    쓰기를 커밋한 클라이언트는 sticky_seconds 동안 primary에서 읽습니다.
+    고정 정보는 워커 프로세스 메모리에만 있으므로 워커가 여럿이면 같은 워커로 들어온 요청에만 적용됩니다.
+    """
+
+    def __init__(
+        self,
+        primary: SessionFactory,
+        replicas: list[SessionFactory],
+        strategy: ReplicaStrategy,
+        sticky_seconds: float,
+        max_clients: int,
+    ) -> None:
+        self._primary = primary
+        self._replicas = replicas
+        self._strategy = strategy
+        self._sticky_seconds = sticky_seconds
+        self._max_clients = max_clients
+        self._next_replica = itertools.cycle(range(len(replicas)))
+        # 클라이언트 -> primary 고정 만료 시각 (LRU)
+        self._sticky_until: OrderedDict[str, float] = OrderedDict()
+
+    def mark_write(self, key: str | None) -> None:
+        """쓰기를 커밋한 클라이언트를 primary에 고정합니다."""
+        if key is None or not self._replicas or self._sticky_seconds <= 0:
+            return
+
+        self._sticky_until[key] = time.monotonic() + self._sticky_seconds
+        self._sticky_until.move_to_end(key)
+        while len(self._sticky_until) > self._max_clients:
+            self._sticky_until.popitem(last=False)
+
+    def is_sticky(self, key: str | None) -> bool:
+        if key is None:
+            return False
+        until = self._sticky_until.get(key)
+        if until is None:
+            return False
+        if until < time.monotonic():
+            del self._sticky_until[key]
+            return False
+        return True
+
+    def choose(self, key: str | None = None) -> SessionFactory:
+        """읽기 요청에 쓸 세션 팩토리를 고릅니다."""
+        if not self._replicas or self.is_sticky(key):
+            return self._primary
+
+        if self._strategy == ReplicaStrategy.LEAST_CONNECTIONS:
+            return min(self._replicas, key=_checked_out)
+        return self._replicas[next(self._next_replica)]
+
+
+def _checked_out(session_factory: SessionFactory) -> int:
+    bind: AsyncEngine = session_factory.kw["bind"]
+    pool = bind.pool
+    return pool.checkedout() if isinstance(pool, QueuePool) else 0
+
+
+replica_router = ReplicaRouter(
+    primary=read_session,
+    replicas=replica_sessions,
+    strategy=settings.DB_REPLICA_STRATEGY,
+    sticky_seconds=settings.DB_STICKY_PRIMARY_SECONDS,
+    max_clients=settings.DB_STICKY_MAX_CLIENTS,
+)
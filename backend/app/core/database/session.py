@@ -1,5 +1,12 @@
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 
 from app.core.configs import settings
 
@@ -8,17 +15,151 @@ class Base(DeclarativeBase):
     pass
 
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.ENV == "local",
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-)
+@dataclass
+class PoolMetrics:
+    checkouts: int = 0
+    timeouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.total_wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+
+class MonitoredQueuePool(AsyncAdaptedQueuePool):
+    """커넥션을 얻기까지 기다린 시간(새 커넥션 생성 포함)을 기록하는 커넥션 풀"""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # QueuePool의 기본값과 같음
+        self.max_overflow: int = kwargs.get("max_overflow", 10)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.record_wait(time.perf_counter() - started_at)
+
 
-AsyncSessionLocal = async_sessionmaker(
-    bind=engine,
-    autocommit=False,
-    autoflush=False,
-    expire_on_commit=False,
+def _skip_rollback(dbapi_connection: Any) -> None:
+    # 자동 커밋 커넥션에는 되돌릴 트랜잭션이 없으므로 ROLLBACK 왕복을 보내지 않습니다.
+    return None
+
+
+def create_engine(
+    url: str | None = None, read_only: bool = False, pool_size: int | None = None, max_overflow: int | None = None
+) -> AsyncEngine:
+    """
+    Settings의 풀 설정으로 엔진을 만듭니다. 프로세스에서 엔진은 이 함수로만 생성합니다.
+
+    Args:
+        url: DB URL (기본 settings.database_url)
+        read_only: 조회 전용 엔진. DB_READ_AUTOCOMMIT이면 커넥션을 AUTOCOMMIT으로 열어
+            요청마다 COMMIT/ROLLBACK 왕복 없이 SELECT만 보냅니다.
+        pool_size: 풀 크기 (기본 DB_POOL_SIZE)
+        max_overflow: 풀 크기를 넘어 더 열 수 있는 커넥션 수 (기본 DB_MAX_OVERFLOW)
+    """
+    options: dict[str, Any] = {}
+    autocommit = read_only and settings.DB_READ_AUTOCOMMIT
+    if autocommit:
+        options["isolation_level"] = "AUTOCOMMIT"
+
+    target = create_async_engine(
+        url or settings.database_url,
+        echo=settings.DB_ECHO,
+        poolclass=MonitoredQueuePool,
+        pool_size=settings.DB_POOL_SIZE if pool_size is None else pool_size,
+        max_overflow=settings.DB_MAX_OVERFLOW if max_overflow is None else max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        **options,
+    )
+    if autocommit:
+        # SQLAlchemy는 AUTOCOMMIT 커넥션에도 세션을 닫을 때와 풀에 반환할 때 DBAPI rollback()을 호출합니다.
+        target.sync_engine.dialect.do_rollback = _skip_rollback  # type: ignore[method-assign]
+    return target
+
+
+engine = create_engine()
+# primary에서 조회하는 요청용 (AUTOCOMMIT을 쓰지 않으면 쓰기 엔진과 같은 풀)
+read_engine = (
+    create_engine(read_only=True, pool_size=settings.DB_READ_POOL_SIZE, max_overflow=settings.DB_READ_MAX_OVERFLOW)
+    if settings.DB_READ_AUTOCOMMIT
+    else engine
 )
+replica_engines = [create_engine(url, read_only=True) for url in settings.DB_REPLICA_URLS]
+
+async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+read_session = async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+replica_sessions = [
+    async_sessionmaker(replica, class_=AsyncSession, expire_on_commit=False) for replica in replica_engines
+]
+AsyncSessionLocal = async_session
+
+
+def named_engines() -> dict[str, AsyncEngine]:
+    """메트릭과 상태 확인에 쓰는 이름 -> 엔진 (같은 엔진은 한 번만)"""
+    engines = {"primary": engine}
+    if read_engine is not engine:
+        engines["primary_read"] = read_engine
+    engines.update({f"replica{index}": replica for index, replica in enumerate(replica_engines)})
+    return engines
+
+
+def all_engines() -> list[AsyncEngine]:
+    return list(named_engines().values())
+
+
+def pool_stats(target: AsyncEngine = engine) -> dict[str, int | float]:
+    """커넥션 풀 사용률과 체크아웃 대기 시간을 반환합니다."""
+    pool = target.pool
+    if not isinstance(pool, MonitoredQueuePool):
+        return {}
+
+    capacity = pool.size() + max(pool.max_overflow, 0)
+    metrics = pool.metrics
+    return {
+        "size": pool.size(),
+        "capacity": capacity,
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "utilization": round(pool.checkedout() / capacity, 4) if capacity else 0.0,
+        "checkouts": metrics.checkouts,
+        "timeouts": metrics.timeouts,
+        "wait_avg_ms": round(metrics.total_wait_seconds / metrics.checkouts * 1000, 3) if metrics.checkouts else 0.0,
+        "wait_max_ms": round(metrics.max_wait_seconds * 1000, 3),
+    }
+
+
+async def warm_up_pool(target: AsyncEngine | None = None, connections: int | None = None) -> None:
+    """
+    첫 요청이 커넥션 생성 비용을 내지 않도록 커넥션을 미리 열어 둡니다.
+
+    Args:
+        target: 대상 엔진. 없으면 primary와 모든 복제본
+        connections: 엔진마다 열어 둘 커넥션 수 (기본 DB_POOL_WARMUP)
+    """
+    count = min(settings.DB_POOL_WARMUP if connections is None else connections, settings.DB_POOL_SIZE)
+
+    async def connect(target_engine: AsyncEngine) -> None:
+        async with target_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    targets = [target] if target is not None else all_engines()
+    await asyncio.gather(*(connect(target_engine) for target_engine in targets for _ in range(count)))
+
+
+async def dispose_engine(target: AsyncEngine | None = None) -> None:
+    """풀의 커넥션을 모두 닫습니다. target이 없으면 primary와 모든 복제본을 닫습니다."""
+    targets = [target] if target is not None else all_engines()
+    for target_engine in targets:
+        await target_engine.dispose()
@@ -1,24 +1,51 @@
 from typing import AsyncGenerator
 
-from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Depends, Request
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache.response_cache import READ_YOUR_WRITES
 from app.core.configs import settings
+from app.core.database.hooks import has_writes, run_commit_hooks, run_rollback_hooks
+from app.core.database.routing import client_key, replica_router
+from app.core.database.session import async_session
 
-engine = create_async_engine(settings.database_url)
-async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
-
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
         try:
             yield session
             await session.commit()
         except Exception:
             await session.rollback()
+            await run_rollback_hooks(session)
             raise
-        finally:
-            await session.close()
+        else:
+            await run_commit_hooks(session)
+            # 복제 지연 동안 방금 쓴 내용을 못 보지 않도록 이 클라이언트의 읽기를 primary로 고정
+            if has_writes(session):
+                replica_router.mark_write(client_key(request))
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    조회 전용 라우트용 세션. 복제본이 설정되어 있으면 복제본에서 읽습니다.
+
+    커밋하지 않으며, DB_READ_AUTOCOMMIT이면 AUTOCOMMIT 커넥션이라 요청 끝의 COMMIT/ROLLBACK 왕복도 없습니다.
+    대신 한 요청 안의 SELECT들이 같은 스냅숏을 보지 않으므로 (예: 목록과 total) 쓰기는 get_db를 사용합니다.
+    """
+    key = client_key(request)
+    sticky = replica_router.is_sticky(key)
+    session_factory = replica_router.choose(key)
+    async with session_factory() as session:
+        # 방금 쓴 클라이언트는 복제본에서 채운 캐시 항목도 건너뜁니다.
+        session.info[READ_YOUR_WRITES] = sticky
+        if settings.DB_READ_ONLY_TRANSACTION and not settings.DB_READ_AUTOCOMMIT:
+            connection = await session.connection()
+            if connection.dialect.name == "mysql":
+                await connection.execute(text("SET TRANSACTION READ ONLY"))
+        yield session
 
 
 CurrentSession = Depends(get_db)
+ReadSession = Depends(get_read_db)
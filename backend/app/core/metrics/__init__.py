@@ -0,0 +1,46 @@
+from app.core.metrics.registry import Counter, Gauge, Histogram, MetricsRegistry
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    "http_requests_total", "HTTP requests by method, route template and status", ("method", "route", "status")
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by method and route template", ("method", "route")
+)
+http_requests_in_flight = registry.gauge("http_requests_in_flight", "HTTP requests currently being handled")
+http_request_db_queries = registry.histogram(
+    "http_request_db_queries",
+    "SQL statements executed per HTTP request",
+    ("route",),
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55),
+)
+http_request_db_seconds = registry.histogram(
+    "http_request_db_seconds", "Total SQL execution time per HTTP request", ("route",)
+)
+db_query_duration_seconds = registry.histogram(
+    "db_query_duration_seconds",
+    "SQL statement execution time by engine",
+    ("engine",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+upload_bytes_total = registry.counter("upload_bytes_total", "Bytes received in uploaded files")
+upload_files_total = registry.counter(
+    "upload_files_total", "Uploaded files by whether a new blob was stored", ("stored",)
+)
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "db_query_duration_seconds",
+    "http_request_db_queries",
+    "http_request_db_seconds",
+    "http_request_duration_seconds",
+    "http_requests_in_flight",
+    "http_requests_total",
+    "registry",
+    "upload_bytes_total",
+    "upload_files_total",
+]
@@ -0,0 +1,56 @@
+from app.core.cache import response_cache
+from app.core.database.counts import list_counts
+from app.core.database.session import named_engines, pool_stats
+from app.core.metrics import registry
+from app.core.metrics.registry import LabelValues
+from app.core.stats import view_count_buffer
+
+
+def _pool_values(key: str) -> dict[LabelValues, float]:
+    return {(name,): pool_stats(engine).get(key, 0) for name, engine in named_engines().items()}
+
+
+def register_collectors() -> None:
+    """스크레이프할 때 계산하는 메트릭을 등록합니다. (풀 상태, 캐시 적중 수 등)"""
+    registry.gauge("db_pool_size", "Configured pool size", ("engine",), lambda: _pool_values("size"))
+    registry.gauge("db_pool_capacity", "Pool size plus max overflow", ("engine",), lambda: _pool_values("capacity"))
+    registry.gauge(
+        "db_pool_checked_out", "Connections currently checked out", ("engine",), lambda: _pool_values("checked_out")
+    )
+    registry.gauge("db_pool_overflow", "Overflow connections in use", ("engine",), lambda: _pool_values("overflow"))
+    registry.gauge(
+        "db_pool_utilization", "Checked-out share of pool capacity", ("engine",), lambda: _pool_values("utilization")
+    )
+    registry.counter("db_pool_checkouts_total", "Connection checkouts", ("engine",), lambda: _pool_values("checkouts"))
+    registry.counter(
+        "db_pool_timeouts_total", "Checkouts that timed out", ("engine",), lambda: _pool_values("timeouts")
+    )
+    registry.gauge(
+        "db_pool_checkout_wait_max_seconds",
+        "Longest checkout wait since start",
+        ("engine",),
+        lambda: {labels: value / 1000 for labels, value in _pool_values("wait_max_ms").items()},
+    )
+
+    registry.counter("response_cache_hits_total", "Response cache hits", collect=lambda: {(): response_cache.hits})
+    registry.counter(
+        "response_cache_misses_total", "Response cache misses", collect=lambda: {(): response_cache.misses}
+    )
+    registry.gauge(
+        "response_cache_entries", "Entries in the response cache", collect=lambda: {(): response_cache.stats()["size"]}
+    )
+    registry.counter(
+        "list_count_cache_hits_total",
+        "Paginated list totals served from memory",
+        collect=lambda: {(): list_counts.hits},
+    )
+    registry.counter(
+        "list_count_cache_misses_total",
+        "Paginated list totals counted in the DB",
+        collect=lambda: {(): list_counts.misses},
+    )
+    registry.gauge(
+        "view_count_pending",
+        "View count increments not yet flushed",
+        collect=lambda: {(): view_count_buffer.total_pending()},
+    )
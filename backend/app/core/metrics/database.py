@@ -0,0 +1,45 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.metrics import db_query_duration_seconds
+
+_QUERY_STARTED = "metrics_query_started"
+
+
+@dataclass
+class RequestQueryStats:
+    queries: int = 0
+    seconds: float = 0.0
+
+
+# 요청마다 MetricsMiddleware가 설정하고 커서 이벤트가 채웁니다.
+request_query_stats: ContextVar[RequestQueryStats | None] = ContextVar("request_query_stats", default=None)
+
+
+def _before_cursor_execute(conn: Connection, *_: Any) -> None:
+    conn.info.setdefault(_QUERY_STARTED, []).append(time.perf_counter())
+
+
+def instrument_engine(engine: AsyncEngine, name: str) -> None:
+    """엔진이 실행하는 SQL 문의 실행 시간을 엔진별 히스토그램과 요청별 통계에 기록합니다."""
+
+    def after_cursor_execute(conn: Connection, *_: Any) -> None:
+        started = conn.info.get(_QUERY_STARTED)
+        if not started:
+            return
+        elapsed = time.perf_counter() - started.pop()
+        db_query_duration_seconds.observe(elapsed, name)
+
+        stats = request_query_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.seconds += elapsed
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
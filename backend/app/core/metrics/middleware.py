@@ -0,0 +1,50 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+    http_request_db_queries,
+    http_request_db_seconds,
+    http_request_duration_seconds,
+    http_requests_in_flight,
+    http_requests_total,
+)
+from app.core.metrics.database import RequestQueryStats, request_query_stats
+from app.log.access import route_template
+
+
+class MetricsMiddleware:
+    """요청 수, 처리 중인 요청 수, 라우트별 지연 시간과 요청당 SQL 수/시간을 기록합니다."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        status_code = 500
+        query_stats = RequestQueryStats()
+        token = request_query_stats.set(query_stats)
+        http_requests_in_flight.inc()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec()
+            request_query_stats.reset(token)
+
+            method = scope["method"]
+            route = route_template(scope)
+            http_requests_total.inc(method, route, str(status_code))
+            http_request_duration_seconds.observe(time.perf_counter() - started_at, method, route)
+            http_request_db_queries.observe(query_stats.queries, route)
+            http_request_db_seconds.observe(query_stats.seconds, route)
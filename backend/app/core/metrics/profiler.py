@@ -0,0 +1,185 @@
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+import orjson
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.configs import settings
+from app.core.configs.settings import SqlProfileMode
+from app.log.access import route_template
+
+logger = logging.getLogger("app.sql_profile")
+
+PROFILE_HEADER = "x-profile-sql"
+_STATEMENT_STARTED = "profile_statement_started"
+_SLOWEST_LIMIT = 5
+_STATEMENT_PREVIEW = 300
+
+# IN (?, ?, ?) 처럼 개수만 다른 목록과 공백을 접어 같은 모양의 쿼리로 묶습니다.
+_IN_LIST = re.compile(r"\(\s*(?:\?|%s|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|:\w+))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    return _IN_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@dataclass
+class QueryProfile:
+    """한 요청(또는 코드 블록)에서 실행된 SQL 문과 실행 시간"""
+
+    statements: list[tuple[str, float]] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(seconds for _, seconds in self.statements)
+
+    def slowest(self, limit: int = _SLOWEST_LIMIT) -> list[tuple[str, float]]:
+        return sorted(self.statements, key=lambda item: item[1], reverse=True)[:limit]
+
+    def repeated(self) -> dict[str, int]:
+        """두 번 이상 실행된 쿼리 모양 -> 실행 횟수. 루프 안의 조회(N+1)가 여기에 드러납니다."""
+        shapes = Counter(statement_shape(statement) for statement, _ in self.statements)
+        return {shape: count for shape, count in shapes.most_common() if count > 1}
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.total_seconds * 1000:.3f};desc="{self.count} queries"'
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "queries": self.count,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "slowest": [
+                {"ms": round(seconds * 1000, 3), "sql": statement_shape(statement)[:_STATEMENT_PREVIEW]}
+                for statement, seconds in self.slowest()
+            ],
+            "repeated": {shape[:_STATEMENT_PREVIEW]: count for shape, count in self.repeated().items()},
+        }
+
+
+# 현재 기록 중인 프로필들 (요청 프로필 안에 테스트의 query_budget이 겹칠 수 있음)
+_active_profiles: ContextVar[tuple[QueryProfile, ...]] = ContextVar("active_query_profiles", default=())
+
+
+@contextmanager
+def profile_queries() -> Iterator[QueryProfile]:
+    """블록 안에서 실행된 SQL 문을 기록합니다."""
+    profile = QueryProfile()
+    token = _active_profiles.set((*_active_profiles.get(), profile))
+    try:
+        yield profile
+    finally:
+        _active_profiles.reset(token)
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[QueryProfile]:
+    """
+    블록 안에서 실행된 SQL 문이 max_queries개를 넘으면 QueryBudgetExceeded를 발생시킵니다.
+
+    테스트에서 서비스 함수나 ASGITransport 클라이언트 호출을 감싸 쿼리 수 회귀를 잡는 용도입니다.
+    """
+    with profile_queries() as profile:
+        yield profile
+    if profile.count > max_queries:
+        raise QueryBudgetExceeded(
+            f"{profile.count} queries exceeded the budget of {max_queries}: {orjson.dumps(profile.summary()).decode()}"
+        )
+
+
+def _before_cursor_execute(conn: Connection, *_: Any) -> None:
+    if _active_profiles.get():
+        conn.info.setdefault(_STATEMENT_STARTED, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Connection, cursor: Any, statement: str, *_: Any) -> None:
+    profiles = _active_profiles.get()
+    started = conn.info.get(_STATEMENT_STARTED)
+    if not profiles or not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    for profile in profiles:
+        profile.statements.append((statement, elapsed))
+
+
+def instrument_engine_for_profiling(engine: AsyncEngine) -> None:
+    """프로필이 켜진 요청에서만 SQL 문을 기록하도록 커서 이벤트를 등록합니다."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class SqlProfilerMiddleware:
+    """
+    SQL_PROFILE_MODE가 always이거나, header이고 DEBUG이며 요청에 X-Profile-SQL 헤더가 있으면
+    요청의 쿼리 수와 DB 시간을 Server-Timing 헤더로 돌려주고 상세 내용(느린 쿼리, 반복된 쿼리)을 로그로 남깁니다.
+
+    SQL_QUERY_BUDGET을 넘으면 경고를 남기고, SQL_QUERY_BUDGET_STRICT이면 응답 대신 QueryBudgetExceeded를 발생시킵니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._enabled(scope):
+            await self.app(scope, receive, send)
+            return
+
+        budget_checked = False
+
+        with profile_queries() as profile:
+
+            async def send_wrapper(message: Message) -> None:
+                nonlocal budget_checked
+                if message["type"] == "http.response.start":
+                    # 예산 초과로 만들어진 500 응답에서 다시 검사하지 않도록 한 번만 확인
+                    if not budget_checked:
+                        budget_checked = True
+                        self._check_budget(scope, profile)
+                    MutableHeaders(scope=message).append("server-timing", profile.server_timing())
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        record = {"method": scope["method"], "route": route_template(scope), **profile.summary()}
+        level = logging.WARNING if profile.repeated() else logging.DEBUG
+        logger.log(level, orjson.dumps(record).decode())
+
+    @staticmethod
+    def _enabled(scope: Scope) -> bool:
+        if settings.SQL_PROFILE_MODE == SqlProfileMode.ALWAYS:
+            return True
+        # 응답 헤더와 로그로 쿼리 정보가 드러나므로 익명 요청이 켤 수 없게 DEBUG에서만 헤더를 따릅니다.
+        return (
+            settings.SQL_PROFILE_MODE == SqlProfileMode.HEADER
+            and settings.DEBUG
+            and PROFILE_HEADER in Headers(scope=scope)
+        )
+
+    @staticmethod
+    def _check_budget(scope: Scope, profile: QueryProfile) -> None:
+        budget = settings.SQL_QUERY_BUDGET
+        if budget is None or profile.count <= budget:
+            return
+
+        message = f"{scope['method']} {route_template(scope)} ran {profile.count} queries (budget {budget})"
+        if settings.SQL_QUERY_BUDGET_STRICT:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
@@ -0,0 +1,175 @@
+import bisect
+import math
+from typing import Callable, Iterable
+
+LabelValues = tuple[str, ...]
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    """
+    Prometheus 텍스트 형식으로 내보내는 메트릭의 공통 부분.
+
+    값은 이벤트 루프 스레드에서만 갱신하므로 잠금 없이 dict와 list만 사용합니다.
+    """
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+    def samples(self) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> list[str]:
+        return [*self.header(), *self.samples()]
+
+
+class _ValueMetric(Metric):
+    """
+    라벨 값마다 숫자 하나를 갖는 메트릭.
+
+    collect 함수를 주면 값을 직접 갱신하지 않고 스크레이프할 때 계산합니다. (예: 풀 상태, 캐시 적중 수)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        collect: Callable[[], dict[LabelValues, float]] | None = None,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: dict[LabelValues, float] = {}
+        self._collect = collect
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def samples(self) -> list[str]:
+        values = self._collect() if self._collect is not None else self._values
+        return [
+            f"{self.name}{_format_labels(self.label_names, label_values)} {_format_value(value)}"
+            for label_values, value in values.items()
+        ]
+
+
+class Counter(_ValueMetric):
+    type_name = "counter"
+
+
+class Gauge(_ValueMetric):
+    type_name = "gauge"
+
+    def set(self, value: float, *label_values: str) -> None:
+        self._values[label_values] = value
+
+    def dec(self, *label_values: str, amount: float = 1) -> None:
+        self.inc(*label_values, amount=-amount)
+
+
+class Histogram(Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self._buckets = tuple(sorted(buckets))
+        # 라벨 값 -> [버킷별 개수..., +Inf 개수], 합계
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        counts = self._counts.get(label_values)
+        if counts is None:
+            counts = self._counts[label_values] = [0] * (len(self._buckets) + 1)
+            self._sums[label_values] = 0.0
+        # 누적 개수는 내보낼 때 계산하고, 관측 시에는 해당 버킷 하나만 올립니다.
+        counts[bisect.bisect_left(self._buckets, value)] += 1
+        self._sums[label_values] += value
+
+    def samples(self) -> list[str]:
+        lines: list[str] = []
+        for label_values, counts in self._counts.items():
+            cumulative = 0
+            for bound, count in zip((*self._buckets, math.inf), counts):
+                cumulative += count
+                bucket_labels = _format_labels(self.label_names, label_values, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            labels = _format_labels(self.label_names, label_values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(self._sums[label_values])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        collect: Callable[[], dict[LabelValues, float]] | None = None,
+    ) -> Counter:
+        return self.register(Counter(name, documentation, labels, collect))  # type: ignore[return-value]
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        collect: Callable[[], dict[LabelValues, float]] | None = None,
+    ) -> Gauge:
+        return self.register(Gauge(name, documentation, labels, collect))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labels, buckets))  # type: ignore[return-value]
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식(0.0.4)으로 모든 메트릭을 내보냅니다."""
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,4 @@
+from app.core.stats.review_stats import ReviewStatsCounter, review_stats
+from app.core.stats.view_counter import ViewCountBuffer, view_count_buffer
+
+__all__ = ["ReviewStatsCounter", "ViewCountBuffer", "review_stats", "view_count_buffer"]
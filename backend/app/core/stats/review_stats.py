@@ -0,0 +1,91 @@
+import asyncio
+import time
+from collections import Counter
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.configs import settings
+from app.core.database.hooks import on_commit
+from app.dtos.review import ReviewStatsResponse
+from app.models.review import Review
+
+RATING_RANGE = range(1, 6)
+
+
+class ReviewStatsCounter:
+    """
+    공개 리뷰의 개수, 평점 합계, 평점별 분포를 메모리에 유지합니다.
+
+    리뷰 생성/수정/삭제가 커밋될 때마다 증분으로 갱신되므로 통계 조회는 테이블 크기와 무관하게 O(1)입니다.
+    다른 워커 프로세스의 변경은 보이지 않으므로 `refresh_interval`초마다 DB에서 다시 집계해 보정합니다.
+    """
+
+    def __init__(self, refresh_interval: float) -> None:
+        self._refresh_interval = refresh_interval
+        self._count = 0
+        self._rating_sum = 0
+        self._histogram: Counter[int] = Counter()
+        self._loaded_at: float | None = None
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_fresh(self) -> bool:
+        if self._loaded_at is None:
+            return False
+        return time.monotonic() - self._loaded_at < self._refresh_interval
+
+    def apply(self, before: int | None, after: int | None) -> None:
+        """
+        리뷰 한 건의 변경을 반영합니다.
+
+        Args:
+            before: 변경 전 공개 상태였던 리뷰의 평점 (비공개였거나 새 리뷰면 None)
+            after: 변경 후 공개 상태인 리뷰의 평점 (비공개가 되었거나 삭제되면 None)
+        """
+        if before == after:
+            return
+
+        if before is not None:
+            self._count -= 1
+            self._rating_sum -= before
+            self._histogram[before] -= 1
+        if after is not None:
+            self._count += 1
+            self._rating_sum += after
+            self._histogram[after] += 1
+        self._generation += 1
+
+    def apply_on_commit(self, session: AsyncSession, before: int | None, after: int | None) -> None:
+        """세션의 트랜잭션이 커밋된 뒤에 변경을 반영하도록 예약합니다."""
+        if before != after:
+            on_commit(session, lambda: self.apply(before, after))
+
+    async def rebuild(self, session: AsyncSession) -> None:
+        """DB에서 평점별 개수를 다시 집계합니다."""
+        async with self._lock:
+            generation = self._generation
+            histogram = await Review.get_rating_histogram(session)
+
+            # 집계하는 동안 커밋된 변경이 있으면 결과를 신뢰할 수 없으므로 다음 조회에서 다시 집계합니다.
+            if generation != self._generation:
+                self._loaded_at = None
+                return
+
+            self._histogram = Counter(histogram)
+            self._count = sum(histogram.values())
+            self._rating_sum = sum(rating * count for rating, count in histogram.items())
+            self._loaded_at = time.monotonic()
+
+    async def get_stats(self, session: AsyncSession) -> ReviewStatsResponse:
+        if not self.is_fresh:
+            await self.rebuild(session)
+
+        return ReviewStatsResponse(
+            total_reviews=self._count,
+            average_rating=round(self._rating_sum / self._count, 1) if self._count else 0.0,
+            rating_distribution={rating: self._histogram[rating] for rating in RATING_RANGE},
+        )
+
+
+review_stats = ReviewStatsCounter(refresh_interval=settings.REVIEW_STATS_REFRESH_SECONDS)
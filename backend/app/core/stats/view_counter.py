@@ -0,0 +1,97 @@
+import asyncio
+import logging
+from collections import Counter
+from contextlib import suppress
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.configs import settings
+from app.core.database import async_session
+from app.models.column import Column
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCountBuffer:
+    """
+    칼럼 조회수 증가분을 메모리에 모았다가 주기적으로 한 번에 반영합니다.
+
+    조회마다 SELECT + UPDATE를 하는 대신 `view_count = view_count + n` 형태의 원자적 UPDATE를
+    `flush_interval`초마다 실행하므로 인기 글의 행 잠금 경합과 증가분 유실이 없습니다.
+    워커 프로세스마다 자기 증가분만 반영하므로 여러 워커가 동시에 flush해도 안전합니다.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], flush_interval: float) -> None:
+        self._session_factory = session_factory
+        self._flush_interval = flush_interval
+        self._pending: Counter[str] = Counter()
+        self._flushing: Counter[str] = Counter()
+        self._known_ids: set[str] = set()
+        self._lock = asyncio.Lock()
+        self._stopped = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def is_known(self, column_id: str) -> bool:
+        """존재가 확인된 칼럼인지 반환합니다. 확인된 칼럼은 조회수 증가 시 DB를 조회하지 않습니다."""
+        return column_id in self._known_ids
+
+    def remember(self, column_id: str) -> None:
+        self._known_ids.add(column_id)
+
+    def forget(self, column_id: str) -> None:
+        self._known_ids.discard(column_id)
+        self._pending.pop(column_id, None)
+
+    def increment(self, column_id: str) -> None:
+        self._pending[column_id] += 1
+
+    def pending(self, column_id: str) -> int:
+        """아직 DB에 반영되지 않은 조회수 증가분을 반환합니다."""
+        return self._pending[column_id] + self._flushing[column_id]
+
+    def total_pending(self) -> int:
+        """아직 DB에 반영되지 않은 전체 조회수 증가분을 반환합니다."""
+        return self._pending.total() + self._flushing.total()
+
+    async def flush(self) -> None:
+        async with self._lock:
+            if not self._pending:
+                return
+
+            self._flushing, self._pending = self._pending, Counter()
+            try:
+                async with self._session_factory() as session:
+                    await Column.add_view_counts(session, self._flushing)
+                    await session.commit()
+            except Exception:
+                # 반영하지 못한 증가분은 다음 flush에서 다시 시도합니다.
+                self._pending.update(self._flushing)
+                self._flushing = Counter()
+                raise
+
+            # 캐시된 목록 응답은 무효화하지 않으므로 view_count가 최대 캐시 TTL만큼 늦게 보일 수 있습니다.
+            self._flushing = Counter()
+
+    def start(self) -> None:
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """주기적 반영을 멈추고 남은 증가분을 반영합니다."""
+        self._stopped.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        while not self._stopped.is_set():
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._stopped.wait(), timeout=self._flush_interval)
+
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to flush view counts")
+
+
+view_count_buffer = ViewCountBuffer(session_factory=async_session, flush_interval=settings.VIEW_COUNT_FLUSH_SECONDS)
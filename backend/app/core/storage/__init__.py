@@ -0,0 +1,17 @@
+from app.core.storage.blob_store import (
+    collect_garbage,
+    discard_stored_files,
+    find_referenced_keys,
+    release_files,
+    release_files_on_commit,
+    release_files_on_rollback,
+)
+
+__all__ = [
+    "collect_garbage",
+    "discard_stored_files",
+    "find_referenced_keys",
+    "release_files",
+    "release_files_on_commit",
+    "release_files_on_rollback",
+]
@@ -0,0 +1,163 @@
+import logging
+import re
+import time
+from pathlib import Path
+from typing import Collection, Sequence
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.core.configs import settings
+from app.core.database import async_session
+from app.core.database.hooks import on_commit, on_rollback
+from app.core.utils.file import BLOB_DIR, StoredFile, blob_dir, blob_key, delete_file
+from app.models.column import Column
+from app.models.portfolio import Portfolio
+from app.models.review_image import ReviewImage
+
+logger = logging.getLogger(__name__)
+
+_BLOB_KEY_PATTERN = re.compile(rf"/{BLOB_DIR}/[0-9a-f]{{2}}/([0-9a-f]{{64}})")
+
+# blob을 참조하는 URL 컬럼. 변환본은 원본과 같은 키를 쓰므로 원본 URL만 확인하면 됩니다.
+_URL_COLUMNS: tuple[InstrumentedAttribute[str | None], ...] = (
+    Portfolio.image_url,
+    Column.thumbnail_url,
+    ReviewImage.url,
+)
+
+
+async def find_referenced_keys(session: AsyncSession, keys: Collection[str]) -> set[str]:
+    """주어진 blob 키 중 portfolios, columns, reviews에서 참조 중인 키를 반환합니다."""
+    referenced: set[str] = set()
+    if not keys:
+        return referenced
+
+    for url_column in _URL_COLUMNS:
+        result = await session.execute(select(url_column).where(or_(*(url_column.contains(key) for key in keys))))
+        for (urls,) in result:
+            referenced.update(key for key in keys if urls and key in urls)
+    return referenced
+
+
+async def find_all_referenced_keys(session: AsyncSession) -> set[str]:
+    """portfolios, columns, reviews에서 참조 중인 모든 blob 키를 반환합니다."""
+    referenced: set[str] = set()
+    for url_column in _URL_COLUMNS:
+        result = await session.stream(select(url_column).where(url_column.contains(f"/{BLOB_DIR}/")))
+        async for (urls,) in result:
+            referenced.update(_BLOB_KEY_PATTERN.findall(urls or ""))
+    return referenced
+
+
+def _unlink_blob(paths: list[Path]) -> None:
+    # 원본과 너비별 변환본을 함께 삭제
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+
+def _delete_blob(key: str, deadline: float) -> None:
+    paths = list(blob_dir(key).glob(f"{key}*"))
+    # 같은 내용을 재업로드하면 원본의 mtime이 갱신되므로, 최근 blob은 아직 커밋되지 않은 다른 요청이 쓰는 중일 수 있습니다.
+    if any(path.stat().st_mtime > deadline for path in paths):
+        return
+    _unlink_blob(paths)
+
+
+def _discard_blob(stored_file: StoredFile) -> None:
+    try:
+        mtime = stored_file.path.stat().st_mtime
+    except FileNotFoundError:
+        return
+    # 저장한 뒤에 다른 요청이 같은 내용을 재업로드했으면 그 요청이 쓰는 중이므로 남겨 둡니다.
+    if mtime > stored_file.mtime:
+        return
+    _unlink_blob(list(stored_file.path.parent.glob(f"{stored_file.sha256}*")))
+
+
+async def release_files(file_urls: Sequence[str]) -> None:
+    """
+    더 이상 참조되지 않는 업로드 파일을 삭제합니다.
+
+    blob 저장소의 파일은 다른 행이 같은 내용을 참조하지 않고 최근 `UPLOAD_RELEASE_GRACE_SECONDS` 안에
+    저장되지 않았을 때만 삭제합니다. 남겨 둔 blob은 collect_garbage가 정리합니다.
+    blob 저장소 이전에 저장된 파일은 행마다 고유하므로 바로 삭제합니다.
+
+    Args:
+        file_urls: 더 이상 사용하지 않는 파일 URL 목록
+    """
+    keys = {key for file_url in file_urls if (key := blob_key(file_url))}
+    legacy_urls = [file_url for file_url in file_urls if blob_key(file_url) is None]
+
+    if keys:
+        async with async_session() as session:
+            referenced = await find_referenced_keys(session, keys)
+        deadline = time.time() - settings.UPLOAD_RELEASE_GRACE_SECONDS
+        for key in keys - referenced:
+            await run_in_threadpool(_delete_blob, key, deadline)
+
+    for file_url in legacy_urls:
+        await run_in_threadpool(delete_file, file_url)
+
+
+def release_files_on_commit(session: AsyncSession, file_urls: Sequence[str]) -> None:
+    """트랜잭션이 커밋되면 교체되거나 삭제된 행이 쓰던 파일을 정리합니다."""
+    if file_urls:
+        on_commit(session, lambda: release_files(file_urls))
+
+
+async def discard_stored_files(stored_files: Sequence[StoredFile]) -> None:
+    """
+    이번 요청에서 새로 저장한 blob과 변환본을 삭제합니다.
+
+    유예 시간 없이 바로 삭제하되, 저장한 뒤 다른 요청이 같은 내용을 재업로드한 blob은 남겨 둡니다.
+    이미 있던 blob에 중복 제거된 파일(created=False)은 다른 행이 참조할 수 있으므로 삭제하지 않고,
+    참조되지 않으면 collect_garbage가 정리합니다.
+    """
+    for stored_file in stored_files:
+        if stored_file.created:
+            await run_in_threadpool(_discard_blob, stored_file)
+
+
+def release_files_on_rollback(session: AsyncSession, stored_files: Sequence[StoredFile]) -> None:
+    """트랜잭션이 롤백되면 이번 요청에서 저장한 파일을 정리합니다."""
+    if stored_files:
+        on_rollback(session, lambda: discard_stored_files(stored_files))
+
+
+def _sweep_blobs(referenced: set[str], grace_seconds: float) -> int:
+    blob_root = Path(settings.UPLOAD_DIR) / BLOB_DIR
+    deadline = time.time() - grace_seconds
+    removed = 0
+
+    for path in blob_root.rglob("*"):
+        if not path.is_file():
+            continue
+        # 아직 커밋되지 않은 업로드가 참조할 수 있으므로 최근 파일은 남겨 둡니다.
+        if path.stat().st_mtime > deadline:
+            continue
+        # 중단된 업로드의 임시 파일이거나 참조되지 않는 blob(과 변환본)
+        if path.name.startswith(".") or path.name[:64] not in referenced:
+            path.unlink(missing_ok=True)
+            removed += 1
+
+    return removed
+
+
+async def collect_garbage(session: AsyncSession, grace_seconds: float | None = None) -> int:
+    """
+    어떤 행에서도 참조하지 않는 blob을 삭제합니다.
+
+    Args:
+        grace_seconds: 이 시간 안에 저장(또는 재업로드)된 파일은 삭제하지 않음
+
+    Returns:
+        int: 삭제한 파일 수
+    """
+    referenced = await find_all_referenced_keys(session)
+    grace = settings.UPLOAD_GC_GRACE_SECONDS if grace_seconds is None else grace_seconds
+    removed = await run_in_threadpool(_sweep_blobs, referenced, grace)
+    logger.info("Upload GC removed %d files (%d blobs referenced)", removed, len(referenced))
+    return removed
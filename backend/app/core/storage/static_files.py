@@ -0,0 +1,107 @@
+import os
+from email.utils import formatdate
+from typing import BinaryIO
+
+import anyio.to_thread
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, PathLike, StaticFiles
+from starlette.types import Receive, Scope, Send
+
+from app.core.configs import settings
+from app.core.utils.file import blob_key
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+
+
+def _open_binary(path: str | os.PathLike[str]) -> BinaryIO:
+    return open(path, "rb")
+
+
+class ZeroCopyFileResponse(FileResponse):
+    """
+    서버가 ASGI zero-copy 확장을 지원하면 파일 디스크립터를 넘겨 sendfile로 전송합니다.
+
+    Range 요청, HEAD 요청이나 확장을 지원하지 않는 서버에서는 FileResponse와 같게 동작합니다.
+    (http.response.pathsend 확장은 FileResponse가 처리합니다.)
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        request_headers = Headers(scope=scope)
+        if (
+            scope["type"] != "http"
+            or scope["method"].upper() != "GET"
+            or _ZEROCOPY_EXTENSION not in scope.get("extensions", {})
+            or "range" in request_headers
+            or self.stat_result is None
+        ):
+            await super().__call__(scope, receive, send)
+            return
+
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        # 파일 열기와 닫기도 디스크 I/O이므로 이벤트 루프 밖에서 실행합니다.
+        file = await anyio.to_thread.run_sync(_open_binary, self.path)
+        try:
+            await send({"type": _ZEROCOPY_EXTENSION, "file": file, "count": self.stat_result.st_size})
+        finally:
+            await anyio.to_thread.run_sync(file.close)
+
+        if self.background is not None:
+            await self.background()
+
+
+class UploadStaticFiles(StaticFiles):
+    """
+    /uploads 전용 정적 파일 서빙.
+
+    - blob 저장소의 파일(이름이 내용 해시)은 해시를 strong ETag로 쓰고 immutable로 캐시합니다.
+    - If-None-Match / If-Modified-Since에는 304, Range 요청에는 206으로 응답합니다.
+    - UPLOAD_ACCEL_REDIRECT_PREFIX를 설정하면 본문 대신 X-Accel-Redirect 헤더만 보내
+      nginx 같은 프록시가 파일을 직접 전송하게 합니다.
+    """
+
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        path = str(full_path)
+
+        headers: dict[str, str] = {}
+        if blob_key(path):
+            # 변환본(<hash>_w320.webp)도 이름만으로 내용이 정해지므로 확장자를 뺀 파일명을 ETag로 사용
+            headers["etag"] = f'"{os.path.splitext(os.path.basename(path))[0]}"'
+            headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+        else:
+            headers["cache-control"] = f"public, max-age={settings.UPLOAD_CACHE_MAX_AGE}"
+
+        response: Response
+        if accel_redirect_prefix := settings.UPLOAD_ACCEL_REDIRECT_PREFIX:
+            response = self._accel_redirect_response(path, stat_result, headers, status_code, accel_redirect_prefix)
+        else:
+            response = ZeroCopyFileResponse(
+                full_path, status_code=status_code, headers=headers, stat_result=stat_result
+            )
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def _accel_redirect_response(
+        self, path: str, stat_result: os.stat_result, headers: dict[str, str], status_code: int, prefix: str
+    ) -> Response:
+        # 프록시가 Range, Content-Length, sendfile을 처리하므로 헤더만 보냅니다.
+        file_response = FileResponse(path, headers=headers, stat_result=stat_result)
+        relative_path = os.path.relpath(path, str(self.directory))
+        response = Response(status_code=status_code, media_type=file_response.media_type)
+        response.headers["x-accel-redirect"] = prefix.rstrip("/") + "/" + relative_path
+        response.headers["etag"] = file_response.headers["etag"]
+        response.headers["last-modified"] = formatdate(stat_result.st_mtime, usegmt=True)
+        response.headers["cache-control"] = headers["cache-control"]
+        del response.headers["content-length"]
+        return response
@@ -0,0 +1,82 @@
+import re
+from typing import NamedTuple
+
+_SMALL_UNITS = {"천": 1_000, "백": 100, "십": 10}
+_LARGE_UNITS = {"억": 100_000_000, "만": 10_000}
+_TOKEN = re.compile(r"\s*(?:(\d+(?:\.\d+)?)|([천백십만억]))")
+_RANGE_SEPARATOR = re.compile(r"\s*[~\-〜～]\s*")
+_FIRST_DIGIT = re.compile(r"\d")
+
+
+class _Amount(NamedTuple):
+    value: float
+    # 마지막 자리 묶음에 곱해진 단위 (예: "70만" → 10,000, "300,000" → 1)
+    scale: int
+    end: int
+
+
+def _parse_expression(text: str, pos: int) -> _Amount | None:
+    """
+    pos부터 이어지는 숫자와 단위를 금액 하나로 읽습니다. 숫자/단위가 아닌 글자(원, 괄호 등)에서 멈춥니다.
+
+    억/만 사이의 자리는 천/백/십으로 묶어 읽고 ("3천5백만" → 35,000,000),
+    억 뒤에 만이 생략되면 만 단위로 봅니다. ("1억2천" → 120,000,000)
+    """
+    total = 0.0
+    group = 0.0
+    number: float | None = None
+    last_large_unit: int | None = None
+    matched = False
+
+    while match := _TOKEN.match(text, pos):
+        digits, unit = match.groups()
+        if digits is not None:
+            # "30 40"처럼 단위 없이 숫자가 이어지면 앞의 숫자까지만 읽습니다.
+            if number is not None:
+                break
+            number = float(digits)
+        elif unit in _SMALL_UNITS:
+            group += (1 if number is None else number) * _SMALL_UNITS[unit]
+            number = None
+        else:
+            group += number or 0
+            total += (group or 1) * _LARGE_UNITS[unit]
+            last_large_unit = _LARGE_UNITS[unit]
+            group, number = 0.0, None
+        pos = match.end()
+        matched = True
+
+    if not matched:
+        return None
+
+    group += number or 0
+    if not group:
+        return _Amount(total, last_large_unit or 1, pos)
+    if last_large_unit == _LARGE_UNITS["억"]:
+        return _Amount(total + group * _LARGE_UNITS["만"], _LARGE_UNITS["만"], pos)
+    return _Amount(total + group, 1, pos)
+
+
+def parse_amount(text: str) -> int:
+    """
+    '300,000원', '30만원', '1억 2천만원' 같은 금액 문자열을 원 단위 정수로 바꿉니다.
+
+    첫 번째 금액만 읽고 그 뒤의 글자("(VAT 10%)" 등)는 무시합니다.
+    범위("50~70만원")는 뒤쪽 단위를 앞쪽에도 적용해 낮은 쪽 금액을 반환하고, 숫자가 없으면 0을 반환합니다.
+    """
+    text = text.replace(",", "")
+    first_digit = _FIRST_DIGIT.search(text)
+    if first_digit is None:
+        return 0
+
+    amount = _parse_expression(text, first_digit.start())
+    if amount is None:
+        return 0
+
+    # 앞쪽이 단위 없는 작은 수일 때만 뒤쪽 단위를 적용합니다. ("300,000~50만원"은 그대로)
+    separator = _RANGE_SEPARATOR.match(text, amount.end)
+    if amount.scale == 1 and amount.value < _LARGE_UNITS["만"] and separator:
+        upper = _parse_expression(text, separator.end())
+        if upper is not None and upper.scale > 1:
+            return round(amount.value * upper.scale)
+    return round(amount.value)
@@ -0,0 +1,69 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any
+
+import orjson
+from fastapi import Request, Response, status
+
+
+@dataclass(frozen=True)
+class Validator:
+    """조건부 GET에 쓰는 응답 검증자 (ETag, Last-Modified)"""
+
+    etag: str
+    last_modified: datetime | None = None
+
+
+def _as_utc(value: datetime) -> datetime:
+    # DB의 DATETIME은 timezone 없이 UTC로 저장됩니다.
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def make_validator(*parts: Any, last_modified: datetime | None = None) -> Validator:
+    """
+    응답 내용을 결정하는 값들로 약한 ETag를 만듭니다.
+
+    Args:
+        parts: 응답이 바뀌면 함께 바뀌는 값 (예: max(updated_at), 행 수)
+        last_modified: 응답의 최종 수정 시각. 삭제를 반영하지 못하는 목록에는 넘기지 않습니다.
+    """
+    digest = hashlib.blake2b(orjson.dumps(parts, default=str), digest_size=12).hexdigest()
+    return Validator(etag=f'W/"{digest}"', last_modified=last_modified)
+
+
+def is_not_modified(request: Request, validator: Validator) -> bool:
+    """
+    If-None-Match(우선) 또는 If-Modified-Since로 클라이언트의 사본이 최신인지 확인합니다.
+
+    검증자는 리소스가 있는지 확인하지 않고 만들어지므로 If-None-Match의 `*`는 일치로 보지 않습니다.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return validator.etag.removeprefix("W/") in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and validator.last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return _as_utc(validator.last_modified).replace(microsecond=0) <= _as_utc(since)
+
+    return False
+
+
+def set_validator_headers(response: Response, validator: Validator) -> None:
+    response.headers["etag"] = validator.etag
+    # 캐시해 두되 매번 검증자로 재확인하도록
+    response.headers["cache-control"] = "no-cache"
+    if validator.last_modified is not None:
+        response.headers["last-modified"] = formatdate(_as_utc(validator.last_modified).timestamp(), usegmt=True)
+
+
+def not_modified_response(validator: Validator) -> Response:
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validator_headers(response, validator)
+    return response
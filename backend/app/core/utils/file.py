@@ -1,42 +1,211 @@
+import asyncio
+import hashlib
 import os
+import re
 import uuid
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional, Sequence
 
-from fastapi import UploadFile
+from fastapi import HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 
 from app.core.configs import settings
+from app.core.metrics import upload_bytes_total, upload_files_total
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
 
-async def save_upload_file(file: UploadFile, subdir: str) -> str:
+# 업로드 파일은 내용의 SHA-256 해시를 이름으로 blobs/ 아래에 한 번만 저장합니다.
+BLOB_DIR = "blobs"
+_BLOB_KEY_PATTERN = re.compile(r"^[0-9a-f]{64}")
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    url: str
+    path: Path
+    size: int
+    sha256: str
+    created: bool  # False이면 같은 내용의 파일이 이미 있어 새로 쓰지 않음
+    mtime: float  # 저장(또는 재업로드로 갱신)한 직후 파일의 mtime
+
+
+def _write_chunk(f: BinaryIO, digest: "hashlib._Hash", chunk: bytes) -> None:
+    digest.update(chunk)
+    f.write(chunk)
+
+
+def _close_file(f: BinaryIO) -> None:
+    f.flush()
+    os.fsync(f.fileno())
+    f.close()
+
+
+def _publish_blob(temp_path: Path, blob_path: Path) -> bool:
+    """임시 파일을 blob 경로로 옮깁니다. 같은 내용의 blob이 이미 있으면 임시 파일을 버리고 False를 반환합니다."""
+    blob_path.parent.mkdir(parents=True, exist_ok=True)
+    if blob_path.exists():
+        temp_path.unlink()
+        # GC 유예 시간을 다시 시작
+        os.utime(blob_path)
+        return False
+
+    os.replace(temp_path, blob_path)
+    return True
+
+
+def blob_key(file_url: str) -> str | None:
+    """
+    blob URL에서 내용 해시를 추출합니다.
+
+    Args:
+        file_url: 파일 URL (예: "/uploads/blobs/ab/ab12...ef.png")
+
+    Returns:
+        str | None: SHA-256 해시. blob 저장소의 파일이 아니면 None
+    """
+    if f"/{BLOB_DIR}/" not in file_url:
+        return None
+    match = _BLOB_KEY_PATTERN.match(file_url.rsplit("/", 1)[-1])
+    return match.group(0) if match else None
+
+
+def blob_dir(key: str) -> Path:
+    """해시에 해당하는 blob 디렉토리를 반환합니다."""
+    return Path(settings.UPLOAD_DIR) / BLOB_DIR / key[:2]
+
+
+async def store_upload_file(file: UploadFile) -> StoredFile:
+    """
+    업로드된 파일을 청크 단위로 스트리밍하여 내용 주소 방식으로 저장합니다.
+
+    파일 전체를 메모리에 올리지 않고, 디스크 쓰기와 해시 계산은 스레드 풀에서 실행합니다.
+    임시 파일에 기록한 뒤 원자적으로 이름을 바꾸므로 실패해도 불완전한 파일이 남지 않습니다.
+    같은 내용의 파일이 이미 있으면 새로 저장하지 않고 기존 파일의 URL을 반환합니다.
+
+    Args:
+        file: 업로드된 파일
+
+    Returns:
+        StoredFile: 저장된 파일의 URL, 경로, 크기, SHA-256 해시
+
+    Raises:
+        HTTPException: 파일 크기가 MAX_UPLOAD_SIZE를 넘는 경우 (413)
+    """
+    # 파일 확장자 추출
+    ext = os.path.splitext(str(file.filename))[1].lower()
+
+    # 해시를 알기 전까지는 임시 파일에 기록
+    blob_root = Path(settings.UPLOAD_DIR) / BLOB_DIR
+    await run_in_threadpool(blob_root.mkdir, parents=True, exist_ok=True)
+    temp_path = blob_root / f".{uuid.uuid4()}.part"
+
+    digest = hashlib.sha256()
+    size = 0
+    f: BinaryIO = await run_in_threadpool(open, temp_path, "wb")
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > settings.MAX_UPLOAD_SIZE:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"File exceeds the maximum upload size of {settings.MAX_UPLOAD_SIZE} bytes",
+                )
+            await run_in_threadpool(_write_chunk, f, digest, chunk)
+
+        await run_in_threadpool(_close_file, f)
+
+        key = digest.hexdigest()
+        filename = f"{key}{ext}"
+        file_path = blob_dir(key) / filename
+        created = await run_in_threadpool(_publish_blob, temp_path, file_path)
+        mtime = (await run_in_threadpool(file_path.stat)).st_mtime
+    except BaseException:
+        f.close()
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    upload_bytes_total.inc(amount=size)
+    upload_files_total.inc("true" if created else "false")
+
+    # URL 생성
+    return StoredFile(
+        url=f"/uploads/{BLOB_DIR}/{key[:2]}/{filename}",
+        path=file_path,
+        size=size,
+        sha256=key,
+        created=created,
+        mtime=mtime,
+    )
+
+
+async def save_upload_file(file: UploadFile) -> str:
     """
     업로드된 파일을 저장하고 URL을 반환합니다.
 
     Args:
         file: 업로드된 파일
-        subdir: 저장할 하위 디렉토리 (예: "portfolios", "reviews")
 
     Returns:
         str: 저장된 파일의 URL
     """
-    # 파일 확장자 추출
-    ext = os.path.splitext(str(file.filename))[1]
+    stored_file = await store_upload_file(file)
+    return stored_file.url
+
 
-    # 고유한 파일명 생성
-    filename = f"{uuid.uuid4()}{ext}"
+async def store_upload_files(files: Sequence[UploadFile]) -> list[StoredFile]:
+    """
+    여러 파일을 동시에 저장하고 입력 순서대로 저장 결과를 반환합니다.
 
-    # 저장 경로 생성
-    upload_dir = Path(settings.UPLOAD_DIR) / subdir
-    upload_dir.mkdir(parents=True, exist_ok=True)
+    동시에 저장하는 파일 수는 UPLOAD_CONCURRENCY로 제한합니다.
+    하나라도 실패하면 이번에 새로 저장된 파일을 삭제하고 첫 번째 예외를 다시 발생시킵니다.
 
-    # 파일 저장
-    file_path = upload_dir / filename
-    content = await file.read()
-    with open(file_path, "wb") as f:
-        f.write(content)
+    Args:
+        files: 업로드된 파일 목록
 
-    # URL 생성
-    return f"/uploads/{subdir}/{filename}"
+    Returns:
+        list[StoredFile]: 저장된 파일의 URL, 경로, 크기, SHA-256 해시 목록
+    """
+    semaphore = asyncio.Semaphore(settings.UPLOAD_CONCURRENCY)
+
+    async def save(file: UploadFile) -> StoredFile:
+        async with semaphore:
+            return await store_upload_file(file)
+
+    results = await asyncio.gather(*(save(file) for file in files), return_exceptions=True)
+
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        await delete_files([result.url for result in results if isinstance(result, StoredFile) and result.created])
+        raise errors[0]
+
+    return [result for result in results if isinstance(result, StoredFile)]
+
+
+async def delete_files(file_urls: Sequence[str]) -> None:
+    """
+    여러 파일을 스레드 풀에서 삭제합니다.
+
+    Args:
+        file_urls: 삭제할 파일의 URL 목록
+    """
+    for file_url in file_urls:
+        await run_in_threadpool(delete_file, file_url)
+
+
+def upload_path(file_url: str) -> Path:
+    """
+    파일 URL에 해당하는 디스크 경로를 반환합니다.
+
+    Args:
+        file_url: 파일 URL (예: "/uploads/blobs/ab/ab12...ef.png")
+
+    Returns:
+        Path: 업로드 디렉토리 아래의 파일 경로
+    """
+    # URL에서 파일 경로 추출
+    path = file_url.replace("/uploads", "")
+    return Path(settings.UPLOAD_DIR) / path.lstrip("/")
 
 
 def delete_file(file_url: str) -> None:
@@ -47,9 +216,7 @@ def delete_file(file_url: str) -> None:
         file_url: 삭제할 파일의 URL
     """
     try:
-        # URL에서 파일 경로 추출
-        path = file_url.replace("/uploads", "")
-        file_path = Path(settings.UPLOAD_DIR) / path.lstrip("/")
+        file_path = upload_path(file_url)
 
         # 파일이 존재하면 삭제
         if file_path.exists():
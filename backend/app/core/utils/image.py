@@ -0,0 +1,158 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Mapping, Sequence
+
+from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+from PIL import Image, ImageOps
+
+from app.core.configs import settings
+from app.core.utils.file import StoredFile, store_upload_file, upload_path
+
+logger = logging.getLogger(__name__)
+
+# 너비(px, 문자열) → 이미지 URL. JSON 컬럼에 그대로 저장합니다.
+ImageVariants = dict[str, str]
+
+_executor: ProcessPoolExecutor | None = None
+
+
+def _render_variants(source_path: str, widths: Sequence[int], image_format: str, quality: int) -> dict[int, str]:
+    """
+    (프로세스 풀에서 실행) 원본보다 좁은 너비마다 리사이즈한 이미지를 원본 옆에 저장합니다.
+
+    Returns:
+        dict[int, str]: 너비 → 파일명 (원본 포함)
+    """
+    source = Path(source_path)
+    variants: dict[int, str] = {}
+
+    with Image.open(source) as original:
+        image = ImageOps.exif_transpose(original)
+        variants[image.width] = source.name
+
+        for width in sorted(set(widths)):
+            if width >= image.width:
+                continue
+
+            name = f"{source.stem}_w{width}.{image_format}"
+            variants[width] = name
+            # 같은 내용의 원본에서 이미 만든 변환본은 다시 만들지 않음
+            if source.with_name(name).exists():
+                continue
+
+            height = max(1, round(image.height * width / image.width))
+            resized = image.resize((width, height), Image.Resampling.LANCZOS)
+            if resized.mode not in ("RGB", "RGBA") or (image_format == "jpeg" and resized.mode == "RGBA"):
+                resized = resized.convert("RGB")
+
+            temp_path = source.with_name(f".{name}.part")
+            resized.save(temp_path, format=image_format.upper(), quality=quality)
+            os.replace(temp_path, source.with_name(name))
+
+    return variants
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # 이벤트 루프와 DB 커넥션을 가진 워커 프로세스를 fork하지 않도록 새 인터프리터에서 시작합니다.
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.IMAGE_PROCESS_WORKERS, mp_context=multiprocessing.get_context(start_method)
+        )
+    return _executor
+
+
+def shutdown_image_executor() -> None:
+    """이미지 처리 프로세스 풀을 종료합니다."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+async def create_image_variants(file_url: str) -> ImageVariants | None:
+    """
+    업로드된 이미지의 너비별 변환본을 생성합니다.
+
+    리사이즈와 인코딩은 프로세스 풀에서 실행하므로 API 워커를 막지 않습니다.
+
+    Args:
+        file_url: 원본 이미지 URL
+
+    Returns:
+        ImageVariants | None: 너비 → URL (원본 포함). 이미지가 아니면 None
+    """
+    if not settings.IMAGE_VARIANT_WIDTHS:
+        return None
+
+    loop = asyncio.get_running_loop()
+    try:
+        names = await loop.run_in_executor(
+            _get_executor(),
+            _render_variants,
+            str(upload_path(file_url)),
+            list(settings.IMAGE_VARIANT_WIDTHS),
+            settings.IMAGE_VARIANT_FORMAT.lower(),
+            settings.IMAGE_VARIANT_QUALITY,
+        )
+    except Exception:
+        logger.warning("Failed to create image variants for %s", file_url, exc_info=True)
+        return None
+
+    base_url = file_url.rsplit("/", 1)[0]
+    return {str(width): f"{base_url}/{name}" for width, name in sorted(names.items())}
+
+
+def _read_size(source_path: str) -> tuple[int, int]:
+    """(스레드 풀에서 실행) 헤더만 읽어 화면에 보이는 방향(EXIF 회전 반영)의 크기를 반환합니다."""
+    with Image.open(source_path) as original:
+        orientation = original.getexif().get(0x0112)
+        if orientation in (5, 6, 7, 8):
+            return original.height, original.width
+        return original.width, original.height
+
+
+async def read_image_size(file_url: str) -> tuple[int, int] | None:
+    """
+    업로드된 이미지의 (너비, 높이)를 반환합니다. 이미지가 아니면 None
+
+    Args:
+        file_url: 이미지 URL
+    """
+    try:
+        return await run_in_threadpool(_read_size, str(upload_path(file_url)))
+    except Exception:
+        logger.warning("Failed to read image size for %s", file_url, exc_info=True)
+        return None
+
+
+async def save_upload_image(file: UploadFile) -> tuple[StoredFile, ImageVariants | None]:
+    """
+    업로드된 이미지를 저장하고 너비별 변환본을 생성합니다.
+
+    Args:
+        file: 업로드된 이미지
+
+    Returns:
+        tuple[StoredFile, ImageVariants | None]: 저장된 원본과 변환본
+    """
+    stored_file = await store_upload_file(file)
+    return stored_file, await create_image_variants(stored_file.url)
+
+
+def build_srcset(variants: Mapping[str, str] | None) -> str | None:
+    """
+    변환본 목록을 `srcset` 속성 값으로 만듭니다.
+
+    Returns:
+        str | None: "url 320w, url 640w, ..." 형식의 문자열
+    """
+    if not variants:
+        return None
+    return ", ".join(f"{url} {width}w" for width, url in sorted(variants.items(), key=lambda item: int(item[0])))
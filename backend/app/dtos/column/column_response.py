@@ -17,9 +17,23 @@ class ColumnResponse(BaseModel):
     content: str
     status: ColumnStatus
     thumbnail_url: str | None
+    thumbnail_srcset: str | None = None
     view_count: int
     created_at: datetime
     updated_at: datetime
     category: str | None
     prev_column: ColumnNavigation | None = None
     next_column: ColumnNavigation | None = None
+
+
+class ColumnSummaryResponse(BaseModel):
+    id: str
+    title: str
+    status: ColumnStatus
+    thumbnail_url: str | None
+    thumbnail_srcset: str | None = None
+    view_count: int
+    created_at: datetime
+    updated_at: datetime
+    category: str | None
+    excerpt: str | None = None
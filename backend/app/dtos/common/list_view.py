@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ListView(str, Enum):
+    FULL = "full"  # 본문 포함
+    SUMMARY = "summary"  # 카드 표시용 필드만
@@ -1,3 +1,4 @@
+from enum import Enum
 from typing import Generic, TypeVar
 
 from pydantic import BaseModel
@@ -5,12 +6,29 @@ from pydantic import BaseModel
 T = TypeVar("T")
 
 
+class PaginationMode(str, Enum):
+    OFFSET = "offset"
+    CURSOR = "cursor"
+
+
 class PaginatedResponse(BaseModel, Generic[T]):
     items: list[T]
     total: int
     page: int
     per_page: int
     total_pages: int
+    # True면 total이 테이블 통계로 추정한 값 (LIST_COUNT_MODE=estimated)
+    total_estimated: bool = False
+
+    class Config:
+        from_attributes = True
+
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    items: list[T]
+    per_page: int
+    next_cursor: str | None
+    prev_cursor: str | None
 
     class Config:
         from_attributes = True
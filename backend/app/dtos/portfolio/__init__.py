@@ -1,5 +1,6 @@
-from app.dtos.portfolio.portfolio_response import PortfolioResponse
+from app.dtos.portfolio.portfolio_response import PortfolioResponse, PortfolioSummaryResponse
 
 __all__ = [
     "PortfolioResponse",
+    "PortfolioSummaryResponse",
 ]
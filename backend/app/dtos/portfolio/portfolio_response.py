@@ -12,7 +12,21 @@ class PortfolioResponse(BaseModel):
     description: str
     category: PortfolioCategory
     image_url: str
+    image_srcset: str | None = None
     display_order: int
     visibility: PortfolioVisibility
     created_at: datetime
     updated_at: datetime
+
+
+class PortfolioSummaryResponse(BaseModel):
+    id: UUID
+    title: str
+    category: PortfolioCategory
+    image_url: str
+    image_srcset: str | None = None
+    display_order: int
+    visibility: PortfolioVisibility
+    created_at: datetime
+    updated_at: datetime
+    excerpt: str | None = None
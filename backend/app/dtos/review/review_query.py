@@ -3,6 +3,8 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+from app.dtos.common.paginated_response import PaginationMode
+
 
 class ReviewSortBy(str, Enum):
     CREATED_AT = "created_at"
@@ -22,3 +24,5 @@ class ReviewQueryParams(BaseModel):
     is_visible: Optional[bool] = None
     sort_by: ReviewSortBy = ReviewSortBy.CREATED_AT
     sort_order: SortOrder = SortOrder.DESC
+    pagination: PaginationMode = PaginationMode.OFFSET
+    cursor: Optional[str] = None
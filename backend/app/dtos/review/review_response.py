@@ -14,6 +14,7 @@ class ReviewResponse(BaseModel):
     order_amount: str
     working_days: int
     images: list[str]
+    image_srcsets: list[str | None] = []
     is_visible: bool
     created_at: datetime
     updated_at: datetime
@@ -1,4 +1,6 @@
 import logging.config
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
 from app.core.configs import settings
@@ -48,5 +50,46 @@ LOG_CONFIG: dict[str, Any] = {
 }
 
 
+_listener: QueueListener | None = None
+# dictConfig로 만든 로거별 핸들러. QueueListener가 멈춰 있을 때는 로거가 이 핸들러에 바로 씁니다.
+_handlers: dict[str, list[logging.Handler]] = {}
+
+
 def initialize_log() -> None:
+    """LOG_CONFIG를 적용합니다. QueueListener가 시작되기 전까지는 핸들러에 바로 씁니다."""
+    shutdown_log()
     logging.config.dictConfig(LOG_CONFIG)
+    _handlers.clear()
+    _handlers.update({name: list(logging.getLogger(name or None).handlers) for name in LOG_CONFIG["loggers"]})
+
+
+def start_log() -> None:
+    """
+    파일/콘솔 쓰기를 QueueListener 스레드로 옮기고, 이벤트 루프에서는 큐에 넣기만 합니다.
+
+    이미 시작했으면 아무것도 하지 않으므로 lifespan이 다시 시작될 때마다 호출해도 됩니다.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    queue_handler = QueueHandler(queue.SimpleQueue())
+    handlers = list(dict.fromkeys(handler for logger_handlers in _handlers.values() for handler in logger_handlers))
+    for name in _handlers:
+        logging.getLogger(name or None).handlers = [queue_handler]
+
+    _listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_log() -> None:
+    """큐에 남은 로그를 모두 기록하고 QueueListener를 멈춥니다. 이후 로그는 핸들러에 바로 씁니다."""
+    global _listener
+    if _listener is None:
+        return
+
+    _listener.stop()
+    _listener = None
+    # 리스너 없이 큐에 쌓이기만 하지 않도록 원래 핸들러로 되돌립니다.
+    for name, handlers in _handlers.items():
+        logging.getLogger(name or None).handlers = list(handlers)
@@ -0,0 +1,92 @@
+import logging
+import random
+import time
+from typing import Any
+
+import orjson
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.configs import settings
+
+logger = logging.getLogger("app.access")
+
+# 본문을 기록해도 되는 요청 (multipart 업로드는 제외)
+_TEXT_CONTENT_TYPES = ("application/json", "application/x-www-form-urlencoded")
+
+
+def route_template(scope: Scope) -> str:
+    """카디널리티가 낮도록 실제 경로 대신 라우트 템플릿을 반환합니다. (예: /api/v1/columns/{uuid})"""
+    route = scope.get("route")
+    if route is not None:
+        return str(getattr(route, "path_format", getattr(route, "path", "")))
+    # StaticFiles 같은 마운트된 앱
+    if "endpoint" in scope and scope.get("root_path"):
+        return f"{scope['root_path']}/{{path}}"
+    return "<unmatched>"
+
+
+class AccessLogMiddleware:
+    """
+    요청마다 method, 라우트 템플릿, status, 처리 시간, 요청/응답 바이트 수를 JSON 한 줄로 기록합니다.
+
+    요청 본문을 미리 읽지 않고 흘러가는 청크의 크기만 셉니다.
+    ACCESS_LOG_BODY_MAX_BYTES > 0이면 JSON/폼 요청 본문의 앞부분을 그만큼만 함께 기록합니다.
+    5xx 응답은 항상, 나머지는 ACCESS_LOG_SAMPLE_RATE 비율로 기록합니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.ACCESS_LOG_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        body_limit = settings.ACCESS_LOG_BODY_MAX_BYTES
+        if body_limit > 0:
+            content_type = Headers(scope=scope).get("content-type", "")
+            if not content_type.startswith(_TEXT_CONTENT_TYPES):
+                body_limit = 0
+
+        status_code = 500
+        request_bytes = 0
+        response_bytes = 0
+        body_sample = bytearray()
+
+        async def receive_wrapper() -> Message:
+            nonlocal request_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                request_bytes += len(chunk)
+                if len(body_sample) < body_limit:
+                    body_sample.extend(chunk[: body_limit - len(body_sample)])
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_bytes
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            elif message["type"] == "http.response.zerocopysend":
+                response_bytes += message.get("count") or 0
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            if status_code >= 500 or random.random() < settings.ACCESS_LOG_SAMPLE_RATE:
+                record: dict[str, Any] = {
+                    "method": scope["method"],
+                    "route": route_template(scope),
+                    "status": status_code,
+                    "duration_ms": round((time.perf_counter() - started_at) * 1000, 2),
+                    "request_bytes": request_bytes,
+                    "response_bytes": response_bytes,
+                }
+                if body_sample:
+                    record["body"] = body_sample.decode("utf-8", errors="replace")
+                logger.info(orjson.dumps(record).decode())
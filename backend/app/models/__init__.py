@@ -4,6 +4,7 @@ from app.models.order import Order, OrderStatus, PackageType
 from app.models.payment import Payment, PaymentMethod, PaymentStatus
 from app.models.portfolio import Portfolio
 from app.models.review import Review
+from app.models.review_image import ReviewImage
 from app.models.user import User
 
 __all__ = [
@@ -19,5 +20,6 @@ __all__ = [
     "PaymentMethod",
     "Column",
     "Review",
+    "ReviewImage",
     "Portfolio",
 ]
@@ -1,95 +1,241 @@
-from typing import Optional
+from collections import defaultdict
+from datetime import datetime
+from typing import Mapping, Optional
 
-from sqlalchemy import Integer, String, Text, func, select
+from sqlalchemy import JSON, Index, Integer, String, Text, func, literal, null, select, union_all, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, load_only, mapped_column, query_expression, with_expression
+from sqlalchemy.orm.interfaces import ORMOption
 
-from app.dtos.column.column_response import ColumnResponse
-from app.dtos.common.paginated_response import PaginatedResponse
+from app.core.database.counts import list_counts
+from app.core.database.keyset import SortKey, fetch_keyset_page
+from app.core.utils.image import ImageVariants, build_srcset
+from app.dtos.column.column_response import ColumnNavigation, ColumnResponse, ColumnSummaryResponse
+from app.dtos.common.list_view import ListView
+from app.dtos.common.paginated_response import CursorPaginatedResponse, PaginatedResponse
 from app.models.base import Base, TimestampMixin, UUIDMixin
 from app.models.column_enums import ColumnStatus
 
 
 class Column(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "columns"
+    __table_args__ = (
+        Index("ix_columns_status_created_at", "status", "created_at"),
+        # 상태 필터 없는 목록
+        Index("ix_columns_created_at", "created_at", "id"),
+    )
 
     title: Mapped[str] = mapped_column(String(100), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     status: Mapped[ColumnStatus] = mapped_column(String(20), nullable=False, default=ColumnStatus.DRAFT)
     thumbnail_url: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # 썸네일의 너비별 변환본 URL (원본 포함)
+    thumbnail_variants: Mapped[ImageVariants | None] = mapped_column(JSON, nullable=True)
     view_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     category: Mapped[str | None] = mapped_column(String(50), nullable=True)
 
+    # 목록 요약 조회에서만 채워지는 본문 앞부분
+    excerpt: Mapped[str | None] = query_expression()
+
+    def to_response(
+        self, prev_column: ColumnNavigation | None = None, next_column: ColumnNavigation | None = None
+    ) -> ColumnResponse:
+        return ColumnResponse(
+            id=self.id,
+            title=self.title,
+            content=self.content,
+            status=self.status,
+            thumbnail_url=self.thumbnail_url,
+            thumbnail_srcset=build_srcset(self.thumbnail_variants),
+            view_count=self.view_count,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            category=self.category,
+            prev_column=prev_column,
+            next_column=next_column,
+        )
+
+    def to_summary_response(self) -> ColumnSummaryResponse:
+        return ColumnSummaryResponse(
+            id=self.id,
+            title=self.title,
+            status=self.status,
+            thumbnail_url=self.thumbnail_url,
+            thumbnail_srcset=build_srcset(self.thumbnail_variants),
+            view_count=self.view_count,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            category=self.category,
+            excerpt=self.excerpt,
+        )
+
+    def to_list_item(self, view: ListView) -> ColumnResponse | ColumnSummaryResponse:
+        return self.to_summary_response() if view == ListView.SUMMARY else self.to_response()
+
+    @classmethod
+    def _list_options(cls, view: ListView, excerpt_length: int) -> list[ORMOption]:
+        """요약 조회에서는 TEXT 본문을 읽지 않고 카드 필드(와 본문 앞부분)만 조회합니다."""
+        if view != ListView.SUMMARY:
+            return []
+
+        options: list[ORMOption] = [
+            load_only(
+                cls.id,
+                cls.title,
+                cls.status,
+                cls.thumbnail_url,
+                cls.thumbnail_variants,
+                cls.view_count,
+                cls.created_at,
+                cls.updated_at,
+                cls.category,
+            )
+        ]
+        excerpt = func.substr(cls.content, 1, excerpt_length) if excerpt_length > 0 else null()
+        options.append(with_expression(cls.excerpt, excerpt))
+        return options
+
     @classmethod
     async def get_all_with_pagination(
-        cls, session: AsyncSession, page: int = 1, per_page: int = 12, status: ColumnStatus | None = None
-    ) -> PaginatedResponse[ColumnResponse]:
+        cls,
+        session: AsyncSession,
+        page: int = 1,
+        per_page: int = 12,
+        status: ColumnStatus | None = None,
+        view: ListView = ListView.FULL,
+        excerpt_length: int = 0,
+    ) -> PaginatedResponse[ColumnResponse | ColumnSummaryResponse]:
         query = select(cls)
         if status:
             query = query.where(cls.status == status)
 
-        total_count = await session.scalar(select(func.count()).select_from(query.subquery()))
-        if total_count is None:
-            total_count = 0
+        count = await list_counts.count(session, query, cls.__tablename__, status)
 
         offset = (page - 1) * per_page
-        result = await session.execute(query.order_by(cls.created_at.desc()).offset(offset).limit(per_page))
+        result = await session.execute(
+            query.options(*cls._list_options(view, excerpt_length))
+            .order_by(cls.created_at.desc())
+            .offset(offset)
+            .limit(per_page)
+        )
         columns = result.scalars().all()
 
-        column_responses = [
-            ColumnResponse(
-                id=column.id,
-                title=column.title,
-                content=column.content,
-                status=column.status,
-                thumbnail_url=column.thumbnail_url,
-                view_count=column.view_count,
-                created_at=column.created_at,
-                updated_at=column.updated_at,
-                category=column.category,
-            )
-            for column in columns
-        ]
+        column_responses = [column.to_list_item(view) for column in columns]
 
-        total_pages = (total_count + per_page - 1) // per_page
+        total_pages = (count.total + per_page - 1) // per_page
 
         return PaginatedResponse(
-            items=column_responses, total=total_count, page=page, per_page=per_page, total_pages=total_pages
+            items=column_responses,
+            total=count.total,
+            page=page,
+            per_page=per_page,
+            total_pages=total_pages,
+            total_estimated=count.estimated,
+        )
+
+    @classmethod
+    async def get_all_with_cursor(
+        cls,
+        session: AsyncSession,
+        per_page: int = 12,
+        cursor: str | None = None,
+        status: ColumnStatus | None = None,
+        view: ListView = ListView.FULL,
+        excerpt_length: int = 0,
+    ) -> CursorPaginatedResponse[ColumnResponse | ColumnSummaryResponse]:
+        query = select(cls).options(*cls._list_options(view, excerpt_length))
+        if status:
+            query = query.where(cls.status == status)
+
+        page = await fetch_keyset_page(
+            session,
+            query,
+            keys=[SortKey(cls.created_at, descending=True), SortKey(cls.id, descending=True)],
+            per_page=per_page,
+            cursor=cursor,
+        )
+
+        return CursorPaginatedResponse(
+            items=[column.to_list_item(view) for column in page.rows],
+            per_page=per_page,
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
         )
 
+    @classmethod
+    async def get_version(
+        cls, session: AsyncSession, status: ColumnStatus | None = None
+    ) -> tuple[datetime | None, int]:
+        """
+        목록 응답의 검증자로 쓸 (최종 수정 시각, 칼럼 수)를 조회합니다.
+
+        조회수는 조회마다 바뀌므로 포함하지 않습니다. 304 응답의 view_count는 이전 값일 수 있습니다.
+        """
+        query = select(func.max(cls.updated_at), func.count())
+        if status:
+            query = query.where(cls.status == status)
+
+        updated_at, count = (await session.execute(query)).one()
+        return updated_at, count
+
     @classmethod
     async def get_by_id(cls, session: AsyncSession, column_id: str) -> Optional["Column"]:
         result = await session.execute(select(cls).where(cls.id == column_id))
         return result.scalar_one_or_none()
 
     @classmethod
-    async def get_prev_next_columns(
-        cls, session: AsyncSession, column_id: str
-    ) -> tuple[Optional["Column"], Optional["Column"]]:
-        # 현재 컬럼 가져오기
-        current_column = await cls.get_by_id(session, column_id)
-        if not current_column:
-            return None, None
-
-        # 이전글 가져오기 (created_at이 현재 글보다 이전인 것 중 가장 최근)
+    async def get_view_count(cls, session: AsyncSession, column_id: str) -> int | None:
+        return await session.scalar(select(cls.view_count).where(cls.id == column_id))
+
+    @classmethod
+    async def exists(cls, session: AsyncSession, column_id: str) -> bool:
+        result = await session.execute(select(cls.id).where(cls.id == column_id))
+        return result.first() is not None
+
+    @classmethod
+    async def add_view_counts(cls, session: AsyncSession, view_counts: Mapping[str, int]) -> None:
+        """조회수 증가분을 원자적인 UPDATE로 반영합니다. 증가분이 같은 컬럼끼리 한 문장으로 묶습니다."""
+        ids_by_delta: defaultdict[int, list[str]] = defaultdict(list)
+        for column_id, delta in view_counts.items():
+            ids_by_delta[delta].append(column_id)
+
+        for delta, column_ids in ids_by_delta.items():
+            # 조회수 변경은 내용 수정이 아니므로 updated_at은 그대로 둡니다.
+            await session.execute(
+                update(cls)
+                .where(cls.id.in_(sorted(column_ids)))
+                .values(view_count=cls.view_count + delta, updated_at=cls.updated_at)
+                .execution_options(synchronize_session=False)
+            )
+
+    @classmethod
+    async def get_navigation(
+        cls, session: AsyncSession, created_at: datetime
+    ) -> tuple[ColumnNavigation | None, ColumnNavigation | None]:
+        """이전글/다음글의 id, 제목, 썸네일만 한 번의 쿼리로 조회합니다."""
+        # 이전글: created_at이 현재 글보다 이전인 것 중 가장 최근
         prev_query = (
-            select(cls)
-            .where(cls.created_at < current_column.created_at, cls.status == ColumnStatus.PUBLISHED)
+            select(cls.id, cls.title, cls.thumbnail_url, literal("prev").label("direction"))
+            .where(cls.status == ColumnStatus.PUBLISHED, cls.created_at < created_at)
             .order_by(cls.created_at.desc())
+            .limit(1)
+            .subquery()
         )
-        prev_result = await session.execute(prev_query)
-        prev_column = prev_result.scalars().first()
-
-        # 다음글 가져오기 (created_at이 현재 글보다 이후인 것 중 가장 오래된)
+        # 다음글: created_at이 현재 글보다 이후인 것 중 가장 오래된
         next_query = (
-            select(cls)
-            .where(cls.created_at > current_column.created_at, cls.status == ColumnStatus.PUBLISHED)
+            select(cls.id, cls.title, cls.thumbnail_url, literal("next").label("direction"))
+            .where(cls.status == ColumnStatus.PUBLISHED, cls.created_at > created_at)
             .order_by(cls.created_at.asc())
+            .limit(1)
+            .subquery()
         )
-        next_result = await session.execute(next_query)
-        next_column = next_result.scalars().first()
+        result = await session.execute(union_all(select(prev_query), select(next_query)))
 
-        return prev_column, next_column
+        navigation: dict[str, ColumnNavigation] = {
+            row.direction: ColumnNavigation(id=row.id, title=row.title, thumbnail_url=row.thumbnail_url)
+            for row in result
+        }
+        return navigation.get("prev"), navigation.get("next")
 
     @classmethod
     async def create_one(
@@ -100,12 +246,14 @@ class Column(Base, UUIDMixin, TimestampMixin):
         status: ColumnStatus,
         thumbnail_url: str | None = None,
         category: str | None = None,
+        thumbnail_variants: ImageVariants | None = None,
     ) -> "Column":
         column = cls(
             title=title,
             content=content,
             status=status,
             thumbnail_url=thumbnail_url,
+            thumbnail_variants=thumbnail_variants,
             category=category,
         )
         session.add(column)
@@ -121,6 +269,7 @@ class Column(Base, UUIDMixin, TimestampMixin):
         status: str | None = None,
         thumbnail_url: str | None = None,
         category: str | None = None,
+        thumbnail_variants: ImageVariants | None = None,
     ) -> None:
         if title is not None:
             self.title = title
@@ -130,6 +279,7 @@ class Column(Base, UUIDMixin, TimestampMixin):
             self.status = ColumnStatus(status)
         if thumbnail_url is not None:
             self.thumbnail_url = thumbnail_url
+            self.thumbnail_variants = thumbnail_variants
         if category is not None:
             self.category = category
 
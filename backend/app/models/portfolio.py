@@ -1,17 +1,27 @@
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Integer, String, Text, func, select
+from sqlalchemy import JSON, Index, Integer, String, Text, func, null, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, load_only, mapped_column, query_expression, with_expression
+from sqlalchemy.orm.interfaces import ORMOption
 
-from app.dtos.common.paginated_response import PaginatedResponse
-from app.dtos.portfolio.portfolio_response import PortfolioResponse
+from app.core.database.counts import list_counts
+from app.core.database.keyset import SortKey, fetch_keyset_page
+from app.core.utils.image import ImageVariants, build_srcset
+from app.dtos.common.list_view import ListView
+from app.dtos.common.paginated_response import CursorPaginatedResponse, PaginatedResponse
+from app.dtos.portfolio.portfolio_response import PortfolioResponse, PortfolioSummaryResponse
 from app.models.base import Base, TimestampMixin, UUIDMixin
 from app.models.portfolio_enums import PortfolioCategory, PortfolioVisibility
 
 
 class Portfolio(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "portfolios"
+    # 목록 정렬(display_order ASC, created_at DESC, id DESC)과 방향까지 같은 인덱스
+    __table_args__ = (
+        Index("ix_portfolios_display_order_created_at", "display_order", text("created_at DESC"), text("id DESC")),
+    )
 
     title: Mapped[str] = mapped_column(
         String(100),
@@ -30,6 +40,11 @@ class Portfolio(Base, UUIDMixin, TimestampMixin):
         String(255),
         nullable=False,
     )
+    # 너비별 변환본 URL (원본 포함)
+    image_variants: Mapped[ImageVariants | None] = mapped_column(
+        JSON,
+        nullable=True,
+    )
     display_order: Mapped[int] = mapped_column(
         Integer,
         nullable=False,
@@ -41,41 +56,135 @@ class Portfolio(Base, UUIDMixin, TimestampMixin):
         default=PortfolioVisibility.PUBLIC,
     )
 
+    # 목록 요약 조회에서만 채워지는 설명 앞부분
+    excerpt: Mapped[str | None] = query_expression()
+
+    def to_response(self) -> PortfolioResponse:
+        return PortfolioResponse(
+            id=self.id,
+            title=self.title,
+            description=self.description,
+            category=self.category,
+            image_url=self.image_url,
+            image_srcset=build_srcset(self.image_variants),
+            display_order=self.display_order,
+            visibility=self.visibility,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
+
+    def to_summary_response(self) -> PortfolioSummaryResponse:
+        return PortfolioSummaryResponse(
+            id=self.id,
+            title=self.title,
+            category=self.category,
+            image_url=self.image_url,
+            image_srcset=build_srcset(self.image_variants),
+            display_order=self.display_order,
+            visibility=self.visibility,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            excerpt=self.excerpt,
+        )
+
+    def to_list_item(self, view: ListView) -> PortfolioResponse | PortfolioSummaryResponse:
+        return self.to_summary_response() if view == ListView.SUMMARY else self.to_response()
+
+    @classmethod
+    def _list_options(cls, view: ListView, excerpt_length: int) -> list[ORMOption]:
+        """요약 조회에서는 TEXT 설명을 읽지 않고 카드 필드(와 설명 앞부분)만 조회합니다."""
+        if view != ListView.SUMMARY:
+            return []
+
+        options: list[ORMOption] = [
+            load_only(
+                cls.id,
+                cls.title,
+                cls.category,
+                cls.image_url,
+                cls.image_variants,
+                cls.display_order,
+                cls.visibility,
+                cls.created_at,
+                cls.updated_at,
+            )
+        ]
+        excerpt = func.substr(cls.description, 1, excerpt_length) if excerpt_length > 0 else null()
+        options.append(with_expression(cls.excerpt, excerpt))
+        return options
+
     @classmethod
     async def get_all_with_pagination(
-        cls, session: AsyncSession, page: int = 1, per_page: int = 12
-    ) -> PaginatedResponse[PortfolioResponse]:
-        total_count = await session.scalar(select(func.count()).select_from(cls))
-        if total_count is None:
-            total_count = 0
+        cls,
+        session: AsyncSession,
+        page: int = 1,
+        per_page: int = 12,
+        view: ListView = ListView.FULL,
+        excerpt_length: int = 0,
+    ) -> PaginatedResponse[PortfolioResponse | PortfolioSummaryResponse]:
+        count = await list_counts.count(session, select(cls), cls.__tablename__)
 
         offset = (page - 1) * per_page
         result = await session.execute(
-            select(cls).order_by(cls.display_order.asc(), cls.created_at.desc()).offset(offset).limit(per_page)
+            select(cls)
+            .options(*cls._list_options(view, excerpt_length))
+            .order_by(cls.display_order.asc(), cls.created_at.desc())
+            .offset(offset)
+            .limit(per_page)
         )
         portfolios = result.scalars().all()
 
-        portfolio_responses = [
-            PortfolioResponse(
-                id=portfolio.id,
-                title=portfolio.title,
-                description=portfolio.description,
-                category=portfolio.category,
-                image_url=portfolio.image_url,
-                display_order=portfolio.display_order,
-                visibility=portfolio.visibility,
-                created_at=portfolio.created_at,
-                updated_at=portfolio.updated_at,
-            )
-            for portfolio in portfolios
-        ]
+        portfolio_responses = [portfolio.to_list_item(view) for portfolio in portfolios]
 
-        total_pages = (total_count + per_page - 1) // per_page
+        total_pages = (count.total + per_page - 1) // per_page
 
         return PaginatedResponse(
-            items=portfolio_responses, total=total_count, page=page, per_page=per_page, total_pages=total_pages
+            items=portfolio_responses,
+            total=count.total,
+            page=page,
+            per_page=per_page,
+            total_pages=total_pages,
+            total_estimated=count.estimated,
+        )
+
+    @classmethod
+    async def get_all_with_cursor(
+        cls,
+        session: AsyncSession,
+        per_page: int = 12,
+        cursor: str | None = None,
+        view: ListView = ListView.FULL,
+        excerpt_length: int = 0,
+    ) -> CursorPaginatedResponse[PortfolioResponse | PortfolioSummaryResponse]:
+        page = await fetch_keyset_page(
+            session,
+            select(cls).options(*cls._list_options(view, excerpt_length)),
+            keys=[
+                SortKey(cls.display_order),
+                SortKey(cls.created_at, descending=True),
+                SortKey(cls.id, descending=True),
+            ],
+            per_page=per_page,
+            cursor=cursor,
+        )
+
+        return CursorPaginatedResponse(
+            items=[portfolio.to_list_item(view) for portfolio in page.rows],
+            per_page=per_page,
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
         )
 
+    @classmethod
+    async def get_version(cls, session: AsyncSession) -> tuple[datetime | None, int]:
+        """목록 응답의 검증자로 쓸 (최종 수정 시각, 포트폴리오 수)를 조회합니다."""
+        updated_at, count = (await session.execute(select(func.max(cls.updated_at), func.count()))).one()
+        return updated_at, count
+
+    @classmethod
+    async def get_updated_at(cls, session: AsyncSession, portfolio_id: str) -> datetime | None:
+        return await session.scalar(select(cls.updated_at).where(cls.id == portfolio_id))
+
     @classmethod
     async def get_by_id(cls, session: AsyncSession, portfolio_id: str) -> Optional["Portfolio"]:
         result = await session.execute(select(cls).where(cls.id == portfolio_id))
@@ -91,6 +200,7 @@ class Portfolio(Base, UUIDMixin, TimestampMixin):
         display_order: int,
         visibility: PortfolioVisibility,
         image_url: str,
+        image_variants: ImageVariants | None = None,
     ) -> "Portfolio":
         portfolio = cls(
             title=title,
@@ -99,6 +209,7 @@ class Portfolio(Base, UUIDMixin, TimestampMixin):
             display_order=display_order,
             visibility=visibility,
             image_url=image_url,
+            image_variants=image_variants,
         )
         session.add(portfolio)
         await session.flush()
@@ -114,6 +225,7 @@ class Portfolio(Base, UUIDMixin, TimestampMixin):
         display_order: int | None = None,
         visibility: str | None = None,
         image_url: str | None = None,
+        image_variants: ImageVariants | None = None,
     ) -> None:
         if title is not None:
             self.title = title
@@ -127,6 +239,7 @@ class Portfolio(Base, UUIDMixin, TimestampMixin):
             self.visibility = PortfolioVisibility(visibility)
         if image_url is not None:
             self.image_url = image_url
+            self.image_variants = image_variants
 
         await session.flush()
         await session.refresh(self)
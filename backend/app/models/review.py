@@ -1,18 +1,34 @@
-from typing import Optional
+from datetime import datetime
+from typing import Any, Optional
 
-from sqlalchemy import Integer, String, Text, asc, desc, func, select
+from sqlalchemy import BigInteger, Index, Integer, String, Text, asc, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import InstrumentedAttribute, Mapped, mapped_column, relationship
 
-from app.dtos.common.paginated_response import PaginatedResponse
-from app.dtos.review import ReviewStatsResponse
+from app.core.database.counts import list_counts
+from app.core.database.keyset import SortKey, fetch_keyset_page
+from app.core.utils.amount import parse_amount
+from app.core.utils.image import build_srcset
+from app.dtos.common.paginated_response import CursorPaginatedResponse, PaginatedResponse
 from app.dtos.review.review_query import ReviewSortBy, SortOrder
 from app.dtos.review.review_response import ReviewResponse
 from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.review_image import ReviewImage
 
 
 class Review(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "reviews"
+    # 목록의 정렬 기준마다 (공개 여부 필터 유무) 정렬된 인덱스. 커서의 동점 처리를 위해 id까지 포함합니다.
+    __table_args__ = (
+        Index("ix_reviews_created_at", "created_at", "id"),
+        Index("ix_reviews_rating", "rating", "id"),
+        Index("ix_reviews_working_days", "working_days", "id"),
+        Index("ix_reviews_order_amount_value", "order_amount_value", "id"),
+        Index("ix_reviews_is_visible_created_at", "is_visible", "created_at", "id"),
+        Index("ix_reviews_is_visible_rating", "is_visible", "rating", "id"),
+        Index("ix_reviews_is_visible_working_days", "is_visible", "working_days", "id"),
+        Index("ix_reviews_is_visible_order_amount_value", "is_visible", "order_amount_value", "id"),
+    )
 
     name: Mapped[str] = mapped_column(
         String(100),
@@ -34,6 +50,12 @@ class Review(Base, UUIDMixin, TimestampMixin):
         String(50),
         nullable=False,
     )
+    # 정렬/범위 조회용으로 order_amount를 원 단위 정수로 바꾼 값 (해석할 수 없으면 0)
+    order_amount_value: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+    )
     working_days: Mapped[int] = mapped_column(
         Integer,
         nullable=False,
@@ -42,20 +64,51 @@ class Review(Base, UUIDMixin, TimestampMixin):
         nullable=False,
         default=True,
     )
-    image_urls: Mapped[str | None] = mapped_column(
-        String(1000),  # Comma-separated URLs
-        nullable=True,
+    # 목록 한 페이지의 이미지를 리뷰 id의 IN 쿼리 한 번으로 함께 읽습니다.
+    images: Mapped[list[ReviewImage]] = relationship(
+        ReviewImage,
+        order_by=ReviewImage.position,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="selectin",
     )
 
     @property
-    def images(self) -> list[str]:
-        """이미지 URL 목록을 반환합니다."""
-        return self.image_urls.split(",") if self.image_urls else []
+    def image_urls(self) -> list[str]:
+        """이미지 URL 목록을 순서대로 반환합니다."""
+        return [image.url for image in self.images]
 
-    @images.setter
-    def images(self, urls: list[str]) -> None:
-        """이미지 URL 목록을 설정합니다."""
-        self.image_urls = ",".join(urls) if urls else None
+    @property
+    def image_srcsets(self) -> list[str | None]:
+        """이미지별 srcset 목록을 반환합니다."""
+        return [build_srcset(image.variants) for image in self.images]
+
+    def to_response(self) -> ReviewResponse:
+        return ReviewResponse(
+            id=self.id,
+            name=self.name,
+            rating=self.rating,
+            content=self.content,
+            order_type=self.order_type,
+            order_amount=self.order_amount,
+            working_days=self.working_days,
+            is_visible=self.is_visible,
+            images=self.image_urls,
+            image_srcsets=self.image_srcsets,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
+
+    @classmethod
+    def sort_column(cls, sort_by: ReviewSortBy) -> InstrumentedAttribute[Any]:
+        """정렬 기준의 컬럼. 금액은 표시용 문자열 대신 숫자 컬럼으로 정렬합니다."""
+        sort_columns: dict[ReviewSortBy, InstrumentedAttribute[Any]] = {
+            ReviewSortBy.CREATED_AT: cls.created_at,
+            ReviewSortBy.RATING: cls.rating,
+            ReviewSortBy.WORKING_DAYS: cls.working_days,
+            ReviewSortBy.ORDER_AMOUNT: cls.order_amount_value,
+        }
+        return sort_columns[sort_by]
 
     @classmethod
     async def get_all_with_pagination(
@@ -71,12 +124,10 @@ class Review(Base, UUIDMixin, TimestampMixin):
         if is_visible is not None:
             query = query.where(cls.is_visible == is_visible)
 
-        total_count = await session.scalar(select(func.count()).select_from(query.subquery()))
-        if total_count is None:
-            total_count = 0
+        count = await list_counts.count(session, query, cls.__tablename__, is_visible)
 
         # 정렬 적용
-        order_by_column = getattr(cls, sort_by)
+        order_by_column = cls.sort_column(sort_by)
         if sort_order == SortOrder.DESC:
             query = query.order_by(desc(order_by_column))
         else:
@@ -86,33 +137,64 @@ class Review(Base, UUIDMixin, TimestampMixin):
         result = await session.execute(query.offset(offset).limit(per_page))
         reviews = result.scalars().all()
 
-        review_responses = [
-            ReviewResponse(
-                id=review.id,
-                name=review.name,
-                rating=review.rating,
-                content=review.content,
-                order_type=review.order_type,
-                order_amount=review.order_amount,
-                working_days=review.working_days,
-                is_visible=review.is_visible,
-                images=review.image_urls.split(",") if review.image_urls else [],
-                created_at=review.created_at,
-                updated_at=review.updated_at,
-            )
-            for review in reviews
-        ]
-
-        total_pages = (total_count + per_page - 1) // per_page
+        review_responses = [review.to_response() for review in reviews]
+
+        total_pages = (count.total + per_page - 1) // per_page
 
         return PaginatedResponse(
             items=review_responses,
-            total=total_count,
+            total=count.total,
             page=page,
             per_page=per_page,
             total_pages=total_pages,
+            total_estimated=count.estimated,
+        )
+
+    @classmethod
+    async def get_all_with_cursor(
+        cls,
+        session: AsyncSession,
+        per_page: int = 12,
+        cursor: str | None = None,
+        is_visible: bool | None = None,
+        sort_by: ReviewSortBy = ReviewSortBy.CREATED_AT,
+        sort_order: SortOrder = SortOrder.DESC,
+    ) -> CursorPaginatedResponse[ReviewResponse]:
+        query = select(cls)
+        if is_visible is not None:
+            query = query.where(cls.is_visible == is_visible)
+
+        # 정렬 컬럼 값이 같은 리뷰는 id로 순서를 고정
+        descending = sort_order == SortOrder.DESC
+        page = await fetch_keyset_page(
+            session,
+            query,
+            keys=[SortKey(cls.sort_column(sort_by), descending=descending), SortKey(cls.id, descending=descending)],
+            per_page=per_page,
+            cursor=cursor,
         )
 
+        return CursorPaginatedResponse(
+            items=[review.to_response() for review in page.rows],
+            per_page=per_page,
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
+        )
+
+    @classmethod
+    async def get_version(cls, session: AsyncSession, is_visible: bool | None = None) -> tuple[datetime | None, int]:
+        """목록 응답의 검증자로 쓸 (최종 수정 시각, 리뷰 수)를 조회합니다."""
+        query = select(func.max(cls.updated_at), func.count())
+        if is_visible is not None:
+            query = query.where(cls.is_visible == is_visible)
+
+        updated_at, count = (await session.execute(query)).one()
+        return updated_at, count
+
+    @classmethod
+    async def get_updated_at(cls, session: AsyncSession, review_id: str) -> datetime | None:
+        return await session.scalar(select(cls.updated_at).where(cls.id == review_id))
+
     @classmethod
     async def get_by_id(cls, session: AsyncSession, review_id: str) -> Optional["Review"]:
         result = await session.execute(select(cls).where(cls.id == review_id))
@@ -129,7 +211,7 @@ class Review(Base, UUIDMixin, TimestampMixin):
         order_amount: str,
         working_days: int,
         is_visible: bool = True,
-        image_urls: str | None = None,
+        images: list[ReviewImage] | None = None,
     ) -> "Review":
         review = cls(
             name=name,
@@ -137,9 +219,10 @@ class Review(Base, UUIDMixin, TimestampMixin):
             content=content,
             order_type=order_type,
             order_amount=order_amount,
+            order_amount_value=parse_amount(order_amount),
             working_days=working_days,
             is_visible=is_visible,
-            image_urls=image_urls,
+            images=images or [],
         )
         session.add(review)
         await session.flush()
@@ -156,7 +239,7 @@ class Review(Base, UUIDMixin, TimestampMixin):
         order_amount: str | None = None,
         working_days: int | None = None,
         is_visible: bool | None = None,
-        image_urls: str | None = None,
+        images: list[ReviewImage] | None = None,
     ) -> "Review":
         if name is not None:
             self.name = name
@@ -168,12 +251,15 @@ class Review(Base, UUIDMixin, TimestampMixin):
             self.order_type = order_type
         if order_amount is not None:
             self.order_amount = order_amount
+            self.order_amount_value = parse_amount(order_amount)
         if working_days is not None:
             self.working_days = working_days
         if is_visible is not None:
             self.is_visible = is_visible
-        if image_urls is not None:
-            self.image_urls = image_urls
+        if images is not None:
+            self.images = images
+            # 이미지만 바뀌면 reviews에 UPDATE가 없어 onupdate가 돌지 않으므로 직접 갱신합니다. (ETag 검증값)
+            self.updated_at = func.now()
 
         await session.flush()
         await session.refresh(self)
@@ -184,23 +270,6 @@ class Review(Base, UUIDMixin, TimestampMixin):
         await session.flush()
 
     @classmethod
-    async def get_stats(cls, session: AsyncSession) -> ReviewStatsResponse:
-        result = await session.execute(select(cls).where(cls.is_visible))
-        reviews = result.scalars().all()
-
-        if not reviews:
-            return ReviewStatsResponse(
-                total_reviews=0,
-                average_rating=0.0,
-                rating_distribution={1: 0, 2: 0, 3: 0, 4: 0, 5: 0},
-            )
-
-        total = len(reviews)
-        avg_rating = sum(r.rating for r in reviews) / total
-        distribution = {i: sum(1 for r in reviews if r.rating == i) for i in range(1, 6)}
-
-        return ReviewStatsResponse(
-            total_reviews=total,
-            average_rating=round(avg_rating, 1),
-            rating_distribution=distribution,
-        )
+    async def get_rating_histogram(cls, session: AsyncSession) -> dict[int, int]:
+        result = await session.execute(select(cls.rating, func.count()).where(cls.is_visible).group_by(cls.rating))
+        return {rating: count for rating, count in result.tuples()}
@@ -0,0 +1,42 @@
+from sqlalchemy import JSON, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.utils.image import ImageVariants
+from app.models.base import Base, UUIDMixin
+
+
+class ReviewImage(Base, UUIDMixin):
+    __tablename__ = "review_images"
+    __table_args__ = (Index("ix_review_images_review_id_position", "review_id", "position"),)
+
+    review_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("reviews.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    # 리뷰 안에서 이미지의 순서 (0부터)
+    position: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    url: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+    )
+    # 너비별 변환본 URL (원본 포함)
+    variants: Mapped[ImageVariants | None] = mapped_column(
+        JSON,
+        nullable=True,
+    )
+    width: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+    height: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+    size_bytes: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+    )
@@ -0,0 +1,278 @@
+"""
+공개 API 엔드포인트별 처리량과 지연 시간(p50/p95/p99)을 고정된 동시성으로 측정합니다.
+
+실제 FastAPI 앱(lifespan 포함)을 프로세스 안에서 ASGI로 호출하고, --base-url을 주면 실행 중인 서버에 HTTP로 요청합니다.
+먼저 seed 스크립트로 데이터를 채운 뒤 실행하고, 결과 JSON을 --output으로 저장해 실행 간 회귀를 비교합니다.
+응답 캐시는 기본으로 꺼져 있으므로 캐시를 켜고 측정하려면 RESPONSE_CACHE_BACKEND=redis로 실행합니다.
+
+    export BENCHMARK_PASSWORD=...
+    poetry run python -m app.scripts.benchmarks.seed --url mysql+asyncmy://... --scale 100k --reset
+    poetry run python -m app.scripts.benchmarks.api_load --concurrency 16 --requests 2000 --output bench.json
+    poetry run python -m app.scripts.benchmarks.api_load --endpoints columns.list reviews.list --concurrency 64
+"""
+
+import argparse
+import asyncio
+import io
+import os
+import random
+import time
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+
+import httpx
+from sqlalchemy import func, select
+
+from app import app
+from app.core.configs import settings
+from app.core.database.session import async_session
+from app.models.column import Column
+from app.models.column_enums import ColumnStatus
+from app.models.portfolio import Portfolio
+from app.models.portfolio_enums import PortfolioCategory, PortfolioVisibility
+from app.models.review import Review
+from app.scripts.benchmarks.common import dump_json, summarize_latencies
+from app.scripts.benchmarks.seed import BENCHMARK_EMAIL, BENCHMARK_PASSWORD_ENV, BENCHMARK_PREFIX
+
+API_PREFIX = "/api/v1"
+SAMPLE_IDS = 1000
+LIST_PAGES = 50
+
+# 1x1 PNG (Pillow 없이 업로드 요청을 만들기 위한 최소 이미지)
+PLACEHOLDER_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010802000000907753de"
+    "0000000c49444154789c63f8ffff3f0005fe02fe0def46b80000000049454e44ae426082"
+)
+
+
+@dataclass
+class Context:
+    client: httpx.AsyncClient
+    rng: random.Random
+    column_ids: list[str]
+    portfolio_ids: list[str]
+    review_ids: list[str]
+    admin_password: str
+    admin_headers: dict[str, str] = field(default_factory=dict)
+    created_portfolio_ids: list[str] = field(default_factory=list)
+
+
+Scenario = Callable[[Context], Awaitable[httpx.Response]]
+
+
+async def columns_list(ctx: Context) -> httpx.Response:
+    page = ctx.rng.randint(1, LIST_PAGES)
+    return await ctx.client.get(f"{API_PREFIX}/columns", params={"status": ColumnStatus.PUBLISHED.value, "page": page})
+
+
+async def columns_list_cursor(ctx: Context) -> httpx.Response:
+    return await ctx.client.get(f"{API_PREFIX}/columns", params={"pagination": "cursor", "view": "summary"})
+
+
+async def columns_detail(ctx: Context) -> httpx.Response:
+    return await ctx.client.get(f"{API_PREFIX}/columns/{ctx.rng.choice(ctx.column_ids)}")
+
+
+async def portfolios_list(ctx: Context) -> httpx.Response:
+    return await ctx.client.get(f"{API_PREFIX}/portfolios", params={"page": ctx.rng.randint(1, LIST_PAGES)})
+
+
+async def portfolios_detail(ctx: Context) -> httpx.Response:
+    return await ctx.client.get(f"{API_PREFIX}/portfolios/{ctx.rng.choice(ctx.portfolio_ids)}")
+
+
+async def reviews_list(ctx: Context) -> httpx.Response:
+    params = {
+        "page": ctx.rng.randint(1, LIST_PAGES),
+        "sort_by": ctx.rng.choice(("created_at", "rating", "working_days", "order_amount")),
+        "is_visible": "true",
+    }
+    return await ctx.client.get(f"{API_PREFIX}/reviews", params=params)
+
+
+async def reviews_detail(ctx: Context) -> httpx.Response:
+    return await ctx.client.get(f"{API_PREFIX}/reviews/{ctx.rng.choice(ctx.review_ids)}")
+
+
+async def reviews_stats(ctx: Context) -> httpx.Response:
+    return await ctx.client.get(f"{API_PREFIX}/reviews/stats")
+
+
+async def auth_login(ctx: Context) -> httpx.Response:
+    return await ctx.client.post(
+        f"{API_PREFIX}/auth/login", json={"email": BENCHMARK_EMAIL, "password": ctx.admin_password}
+    )
+
+
+async def portfolios_upload(ctx: Context) -> httpx.Response:
+    # 매번 다른 내용이어야 blob 중복 제거 없이 저장 경로 전체를 측정합니다.
+    image = PLACEHOLDER_PNG + ctx.rng.randbytes(16)
+    response = await ctx.client.post(
+        f"{API_PREFIX}/portfolios",
+        headers=ctx.admin_headers,
+        data={
+            "title": f"{BENCHMARK_PREFIX} upload",
+            "description": "benchmark",
+            "category": PortfolioCategory.LOGO.value,
+            "visibility": PortfolioVisibility.PRIVATE.value,
+        },
+        files={"image": ("bench.png", io.BytesIO(image), "image/png")},
+    )
+    if response.status_code == 201:
+        ctx.created_portfolio_ids.append(response.json()["id"])
+    return response
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "columns.list": columns_list,
+    "columns.list_cursor": columns_list_cursor,
+    "columns.detail": columns_detail,
+    "portfolios.list": portfolios_list,
+    "portfolios.detail": portfolios_detail,
+    "reviews.list": reviews_list,
+    "reviews.detail": reviews_detail,
+    "reviews.stats": reviews_stats,
+    "auth.login": auth_login,
+    "portfolios.upload": portfolios_upload,
+}
+
+
+async def run_scenario(ctx: Context, name: str, requests: int, concurrency: int, warmup: int) -> dict[str, Any]:
+    scenario = SCENARIOS[name]
+    for _ in range(warmup):
+        await scenario(ctx)
+
+    latencies: list[float] = []
+    status_counts: dict[int, int] = {}
+    errors = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                response = await scenario(ctx)
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+            status_counts[response.status_code] = status_counts.get(response.status_code, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "endpoint": name,
+        "requests": requests,
+        "errors": errors,
+        "status_counts": status_counts,
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "latency": summarize_latencies(latencies),
+    }
+
+
+async def sample_ids(model: type[Column] | type[Portfolio] | type[Review], *conditions: Any) -> list[str]:
+    async with async_session() as session:
+        result = await session.scalars(select(model.id).where(*conditions).limit(SAMPLE_IDS))
+        return [str(row_id) for row_id in result]
+
+
+async def row_counts() -> dict[str, int]:
+    async with async_session() as session:
+        return {
+            model.__tablename__: await session.scalar(select(func.count()).select_from(model)) or 0
+            for model in (Column, Portfolio, Review)
+        }
+
+
+async def cleanup(ctx: Context) -> None:
+    for portfolio_id in ctx.created_portfolio_ids:
+        await ctx.client.delete(f"{API_PREFIX}/portfolios/{portfolio_id}", headers=ctx.admin_headers)
+
+
+async def main(
+    endpoints: list[str],
+    requests: int,
+    concurrency: int,
+    warmup: int,
+    base_url: str | None,
+    output: str | None,
+    admin_password: str,
+) -> None:
+    settings.ACCESS_LOG_ENABLED = False
+
+    async with AsyncExitStack() as stack:
+        if base_url:
+            client = httpx.AsyncClient(base_url=base_url, timeout=30)
+        else:
+            await stack.enter_async_context(app.router.lifespan_context(app))
+            client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark")
+        await stack.enter_async_context(client)
+
+        ctx = Context(
+            client=client,
+            rng=random.Random(0),
+            column_ids=await sample_ids(Column, Column.status == ColumnStatus.PUBLISHED),
+            portfolio_ids=await sample_ids(Portfolio, Portfolio.visibility == PortfolioVisibility.PUBLIC),
+            review_ids=await sample_ids(Review, Review.is_visible.is_(True)),
+            admin_password=admin_password,
+        )
+        login = await auth_login(ctx)
+        login.raise_for_status()
+        ctx.admin_headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        results = []
+        for name in endpoints:
+            results.append(await run_scenario(ctx, name, requests, concurrency, warmup))
+            print(f"{name}: {results[-1]['throughput_rps']} req/s", flush=True)
+        await cleanup(ctx)
+
+    dump_json(
+        {
+            "benchmark": "api_load",
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "target": base_url or "asgi",
+            "rows": await row_counts(),
+            "response_cache": settings.RESPONSE_CACHE_BACKEND.value,
+            "concurrency": concurrency,
+            "requests_per_endpoint": requests,
+            "results": results,
+        },
+        output,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoints", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=1000, help="엔드포인트별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시에 요청하는 클라이언트 수")
+    parser.add_argument("--warmup", type=int, default=20, help="측정 전에 보낼 요청 수")
+    parser.add_argument("--base-url", help="실행 중인 서버 주소 (없으면 프로세스 안에서 앱을 호출)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument(
+        "--admin-password",
+        default=os.environ.get(BENCHMARK_PASSWORD_ENV),
+        help=f"seed로 만든 벤치마크 관리자 계정 비밀번호 (기본 {BENCHMARK_PASSWORD_ENV} 환경 변수)",
+    )
+    args = parser.parse_args()
+    if not args.admin_password:
+        parser.error(f"--admin-password or {BENCHMARK_PASSWORD_ENV} is required")
+
+    asyncio.run(
+        main(
+            args.endpoints,
+            args.requests,
+            args.concurrency,
+            args.warmup,
+            args.base_url,
+            args.output,
+            args.admin_password,
+        )
+    )
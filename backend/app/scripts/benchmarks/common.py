@@ -0,0 +1,35 @@
+import math
+import statistics
+from typing import Any
+
+import orjson
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """nearest-rank 방식의 백분위 값을 반환합니다."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize_latencies(latencies: list[float]) -> dict[str, float]:
+    """초 단위 지연 시간 목록을 밀리초 단위 요약 통계로 변환합니다."""
+    return {
+        "count": len(latencies),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(max(latencies) * 1000, 3) if latencies else 0.0,
+    }
+
+
+def dump_json(result: Any, output: str | None) -> None:
+    """결과를 JSON으로 출력하고, output 경로가 있으면 파일로도 저장합니다."""
+    data = orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    if output:
+        with open(output, "wb") as f:
+            f.write(data)
+    print(data.decode())
@@ -0,0 +1,52 @@
+"""
+JWTHandler.decode_token의 처리량을 검증 토큰 캐시 사용 여부에 따라 비교합니다.
+
+    poetry run python -m app.scripts.benchmarks.jwt_decode --iterations 100000 --tokens 10
+"""
+
+import argparse
+import time
+from typing import Any
+
+from app.auth.jwt_codec import JWTHandler, UserRole
+from app.core.configs import settings
+from app.scripts.benchmarks.common import dump_json
+
+
+def run(tokens: list[str], iterations: int, cache_size: int) -> dict[str, Any]:
+    settings.JWT_CACHE_SIZE = cache_size
+    JWTHandler._verified_tokens.clear()
+
+    started = time.perf_counter()
+    for i in range(iterations):
+        JWTHandler.decode_token(tokens[i % len(tokens)])
+    elapsed = time.perf_counter() - started
+
+    return {
+        "cache_size": cache_size,
+        "iterations": iterations,
+        "elapsed_s": round(elapsed, 4),
+        "decodes_per_s": round(iterations / elapsed),
+        "us_per_decode": round(elapsed / iterations * 1_000_000, 3),
+    }
+
+
+def main(iterations: int, token_count: int, output: str | None) -> None:
+    cache_size = settings.JWT_CACHE_SIZE or 1024
+    tokens = [
+        JWTHandler.create_access_token(user_id=str(i), email=f"admin{i}@example.com", role=UserRole.ADMIN)
+        for i in range(token_count)
+    ]
+
+    results = [run(tokens, iterations, 0), run(tokens, iterations, cache_size)]
+    dump_json({"benchmark": "jwt_decode", "distinct_tokens": token_count, "results": results}, output)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=100_000, help="decode_token 호출 횟수")
+    parser.add_argument("--tokens", type=int, default=10, help="번갈아 사용할 서로 다른 토큰 수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    main(args.iterations, args.tokens, args.output)
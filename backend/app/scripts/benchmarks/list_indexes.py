@@ -0,0 +1,148 @@
+"""
+목록 조회(필터 + 정렬 + 페이지)마다 실행 계획과 지연 시간을 인덱스 사용/미사용으로 비교합니다.
+
+모델의 get_all_with_pagination / get_all_with_cursor가 만드는 것과 같은 WHERE, ORDER BY, LIMIT/OFFSET으로
+EXPLAIN(사용한 인덱스, 예상 행 수, filesort 여부)과 반복 실행 지연 시간을 기록합니다.
+MySQL에서는 IGNORE INDEX 힌트로 같은 쿼리를 인덱스 없이도 실행해 비교합니다.
+
+    poetry run python -m app.scripts.benchmarks.seed --url mysql+asyncmy://... --scale 1m --reset
+    poetry run python -m app.scripts.benchmarks.list_indexes --url mysql+asyncmy://... --repeat 20 --page 50 \
+        --output indexes.json
+"""
+
+import argparse
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, cast
+
+from sqlalchemy import Select, Table, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.database.session import create_engine
+from app.dtos.review.review_query import ReviewSortBy
+from app.models.column import Column
+from app.models.column_enums import ColumnStatus
+from app.models.portfolio import Portfolio
+from app.models.review import Review
+from app.scripts.benchmarks.common import dump_json, summarize_latencies
+
+PER_PAGE = 12
+
+
+@dataclass(frozen=True)
+class ListCase:
+    name: str
+    table: Table
+    where: tuple[ColumnElement[bool], ...]
+    order_by: tuple[ColumnElement[Any], ...]
+
+    def statement(self, page: int, ignore_indexes: bool) -> Select[Any]:
+        query = select(self.table).where(*self.where).order_by(*self.order_by)
+        if ignore_indexes:
+            names = ", ".join(index.name for index in self.table.indexes if index.name)
+            query = query.with_hint(self.table, f"IGNORE INDEX ({names})", "mysql")
+        return query.offset((page - 1) * PER_PAGE).limit(PER_PAGE)
+
+
+def list_cases() -> list[ListCase]:
+    # __table__은 FromClause로 선언되어 있지만 선언형 모델에서는 항상 Table입니다.
+    columns = cast(Table, Column.__table__)
+    portfolios = cast(Table, Portfolio.__table__)
+    reviews = cast(Table, Review.__table__)
+
+    cases = [
+        ListCase(
+            "columns.status",
+            columns,
+            (columns.c.status == ColumnStatus.PUBLISHED.value,),
+            (columns.c.created_at.desc(), columns.c.id.desc()),
+        ),
+        ListCase("columns.all", columns, (), (columns.c.created_at.desc(), columns.c.id.desc())),
+        ListCase(
+            "portfolios.all",
+            portfolios,
+            (),
+            (portfolios.c.display_order.asc(), portfolios.c.created_at.desc(), portfolios.c.id.desc()),
+        ),
+    ]
+    for sort_by in ReviewSortBy:
+        sort_column = reviews.c[Review.sort_column(sort_by).key]
+        cases.append(
+            ListCase(
+                f"reviews.visible.{sort_by.value}",
+                reviews,
+                (reviews.c.is_visible.is_(True),),
+                (sort_column.desc(), reviews.c.id.desc()),
+            )
+        )
+        cases.append(ListCase(f"reviews.all.{sort_by.value}", reviews, (), (sort_column.desc(), reviews.c.id.desc())))
+    return cases
+
+
+async def explain(connection: AsyncConnection, query: Select[Any]) -> list[dict[str, Any]]:
+    compiled = query.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+    prefix = "EXPLAIN QUERY PLAN" if connection.dialect.name == "sqlite" else "EXPLAIN"
+    result = await connection.execute(text(f"{prefix} {compiled}"))
+    return [dict(row._mapping) for row in result]
+
+
+def plan_summary(plan: list[dict[str, Any]]) -> dict[str, Any]:
+    """EXPLAIN 결과에서 비교에 필요한 값만 추립니다."""
+    if plan and "key" in plan[0]:
+        row = plan[0]
+        return {
+            "key": row.get("key"),
+            "rows": row.get("rows"),
+            "filesort": "filesort" in str(row.get("Extra") or ""),
+        }
+    detail = " / ".join(str(row.get("detail", "")) for row in plan)
+    return {"detail": detail, "filesort": "TEMP B-TREE" in detail}
+
+
+async def measure(connection: AsyncConnection, case: ListCase, page: int, repeat: int, ignore: bool) -> dict[str, Any]:
+    query = case.statement(page, ignore)
+    plan = await explain(connection, query)
+
+    latencies: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await connection.execute(query)
+        latencies.append(time.perf_counter() - started)
+
+    return {"plan": plan_summary(plan), "latency": summarize_latencies(latencies)}
+
+
+async def main(url: str | None, page: int, repeat: int, output: str | None) -> None:
+    target = create_engine(url)
+    results = []
+
+    try:
+        async with target.connect() as connection:
+            modes = [False, True] if connection.dialect.name == "mysql" else [False]
+            for case in list_cases():
+                result: dict[str, Any] = {"case": case.name}
+                for ignore in modes:
+                    result["without_indexes" if ignore else "with_indexes"] = await measure(
+                        connection, case, page, repeat, ignore
+                    )
+                results.append(result)
+                print(f"{case.name}: {result['with_indexes']['latency']['p50_ms']} ms", flush=True)
+    finally:
+        await target.dispose()
+
+    dump_json(
+        {"benchmark": "list_indexes", "page": page, "per_page": PER_PAGE, "repeat": repeat, "results": results}, output
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="DB URL (기본 settings.database_url)")
+    parser.add_argument("--page", type=int, default=1, help="조회할 페이지 (깊을수록 OFFSET 비용이 커짐)")
+    parser.add_argument("--repeat", type=int, default=10, help="쿼리별 반복 실행 횟수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.url, args.page, args.repeat, args.output))
@@ -0,0 +1,106 @@
+"""
+로그인 요청이 몰릴 때 다른 엔드포인트의 지연 시간을 측정합니다.
+
+bcrypt 검증을 이벤트 루프에서 직접 실행하는 기존 방식(inline)과 전용 스레드 풀에서 실행하는 방식(pool)을
+같은 조건에서 비교합니다. DB 없이 실행됩니다.
+
+    poetry run python -m app.scripts.benchmarks.login_latency --logins 16 --rounds 4
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+import httpx
+from fastapi import FastAPI, HTTPException, status
+
+from app.auth.password_hasher import PasswordHasher, PasswordHasherBusyError
+from app.scripts.benchmarks.common import dump_json, summarize_latencies
+
+PASSWORD = "benchmark-password"
+PROBE_INTERVAL = 0.01
+
+
+def create_app(hashed_password: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/login/inline")
+    async def login_inline() -> dict[str, bool]:
+        return {"ok": PasswordHasher.verify_password(PASSWORD, hashed_password)}
+
+    @app.post("/login/pool")
+    async def login_pool() -> dict[str, bool]:
+        try:
+            return {"ok": await PasswordHasher.verify_password_async(PASSWORD, hashed_password)}
+        except PasswordHasherBusyError as e:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+    @app.get("/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return app
+
+
+async def run_scenario(client: httpx.AsyncClient, mode: str, logins: int, rounds: int) -> dict[str, Any]:
+    login_latencies: list[float] = []
+    probe_latencies: list[float] = []
+    status_counts: dict[int, int] = {}
+    done = asyncio.Event()
+
+    async def login_worker() -> None:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            response = await client.post(f"/login/{mode}")
+            login_latencies.append(time.perf_counter() - start)
+            status_counts[response.status_code] = status_counts.get(response.status_code, 0) + 1
+
+    async def probe_worker() -> None:
+        # 일정한 간격으로 보내기로 예정된 요청마다 예정 시각부터 응답까지를 측정합니다.
+        # 이벤트 루프가 막혀 보내지 못한 요청도 밀린 만큼의 지연으로 기록됩니다.
+        scheduled = time.perf_counter()
+        while True:
+            await client.get("/ping")
+            finished = time.perf_counter()
+            while scheduled <= finished:
+                probe_latencies.append(finished - scheduled)
+                scheduled += PROBE_INTERVAL
+
+            if done.is_set():
+                return
+            await asyncio.sleep(scheduled - time.perf_counter())
+
+    started = time.perf_counter()
+    probe = asyncio.create_task(probe_worker())
+    await asyncio.gather(*(login_worker() for _ in range(logins)))
+    done.set()
+    await probe
+
+    return {
+        "mode": mode,
+        "duration_s": round(time.perf_counter() - started, 3),
+        "login_status_counts": status_counts,
+        "login": summarize_latencies(login_latencies),
+        "unrelated_endpoint": summarize_latencies(probe_latencies),
+    }
+
+
+async def main(logins: int, rounds: int, output: str | None) -> None:
+    hashed_password = PasswordHasher.hash_password(PASSWORD)
+    app = create_app(hashed_password)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark") as client:
+        results = [await run_scenario(client, mode, logins, rounds) for mode in ("inline", "pool")]
+
+    dump_json({"benchmark": "login_latency", "concurrent_logins": logins, "rounds": rounds, "results": results}, output)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=16, help="동시 로그인 요청 수")
+    parser.add_argument("--rounds", type=int, default=4, help="요청당 반복 횟수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.logins, args.rounds, args.output))
@@ -0,0 +1,121 @@
+"""
+조회 요청 하나가 DB와 주고받는 왕복 수와 지연 시간을 세션 방식별로 비교합니다.
+
+- transactional: get_db와 같은 방식 (트랜잭션 안에서 조회 후 COMMIT)
+- read_only: get_read_db와 같은 방식 (DB_READ_AUTOCOMMIT 조회 전용 엔진, 커밋 없음)
+
+왕복은 SQL 문, COMMIT, ROLLBACK, pre-ping을 셉니다. --rtt-ms를 주면 왕복마다 그만큼 지연을 넣어
+네트워크 너머의 DB를 흉내 냅니다.
+
+    poetry run python -m app.scripts.benchmarks.read_session --requests 200 --queries 2
+    poetry run python -m app.scripts.benchmarks.read_session --url sqlite+aiosqlite:///bench.db --rtt-ms 0.5
+"""
+
+import argparse
+import asyncio
+import time
+from collections import Counter
+from typing import Any, Callable
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.core.database.session import _skip_rollback, create_engine
+from app.scripts.benchmarks.common import dump_json, summarize_latencies
+
+
+def instrument(target: AsyncEngine, counts: Counter[str], rtt: float) -> None:
+    """엔진이 DB로 보내는 왕복을 종류별로 셉니다."""
+    dialect = target.sync_engine.dialect
+
+    def round_trip(kind: str) -> None:
+        counts[kind] += 1
+        if rtt:
+            time.sleep(rtt)
+
+    def wrap(kind: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            round_trip(kind)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    dialect.do_commit = wrap("commit", dialect.do_commit)  # type: ignore[method-assign]
+    dialect.do_ping = wrap("ping", dialect.do_ping)  # type: ignore[method-assign]
+    # 조회 전용 엔진은 ROLLBACK을 보내지 않습니다.
+    if dialect.do_rollback is not _skip_rollback:
+        dialect.do_rollback = wrap("rollback", dialect.do_rollback)  # type: ignore[method-assign]
+
+    @event.listens_for(target.sync_engine, "before_cursor_execute")
+    def count_statement(*_: Any) -> None:
+        round_trip("statement")
+
+
+async def transactional_request(session_factory: async_sessionmaker[AsyncSession], queries: int) -> None:
+    async with session_factory() as session:
+        for _ in range(queries):
+            await session.execute(text("SELECT 1"))
+        await session.commit()
+
+
+async def read_only_request(session_factory: async_sessionmaker[AsyncSession], queries: int) -> None:
+    async with session_factory() as session:
+        for _ in range(queries):
+            await session.execute(text("SELECT 1"))
+
+
+async def run_scenario(mode: str, url: str | None, requests: int, queries: int, rtt: float) -> dict[str, Any]:
+    target = create_engine(url, read_only=mode == "read_only")
+    session_factory = async_sessionmaker(target, class_=AsyncSession, expire_on_commit=False)
+    handler = read_only_request if mode == "read_only" else transactional_request
+
+    # 커넥션 생성과 AUTOCOMMIT 설정은 커넥션마다 한 번이므로 측정에서 제외
+    await handler(session_factory, queries)
+    counts: Counter[str] = Counter()
+    instrument(target, counts, rtt)
+
+    latencies: list[float] = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        await handler(session_factory, queries)
+        latencies.append(time.perf_counter() - start)
+    await target.dispose()
+
+    total = counts.total()
+    return {
+        "mode": mode,
+        "round_trips": dict(counts),
+        "round_trips_per_request": round(total / requests, 3),
+        "latency": summarize_latencies(latencies),
+    }
+
+
+async def main(url: str | None, requests: int, queries: int, rtt_ms: float, output: str | None) -> None:
+    results = [
+        await run_scenario(mode, url, requests, queries, rtt_ms / 1000) for mode in ("transactional", "read_only")
+    ]
+    saved = results[0]["round_trips_per_request"] - results[1]["round_trips_per_request"]
+
+    dump_json(
+        {
+            "benchmark": "read_session",
+            "requests": requests,
+            "queries_per_request": queries,
+            "rtt_ms": rtt_ms,
+            "round_trips_saved_per_request": round(saved, 3),
+            "results": results,
+        },
+        output,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="DB URL (기본 settings.database_url)")
+    parser.add_argument("--requests", type=int, default=200, help="방식별 요청 수")
+    parser.add_argument("--queries", type=int, default=2, help="요청당 SELECT 수 (예: 목록 + total)")
+    parser.add_argument("--rtt-ms", type=float, default=0.0, help="왕복마다 넣을 지연 (밀리초)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.url, args.requests, args.queries, args.rtt_ms, args.output))
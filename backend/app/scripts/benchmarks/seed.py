@@ -0,0 +1,223 @@
+"""
+부하 테스트용 데이터를 columns, portfolios, reviews 테이블에 채웁니다.
+
+같은 --seed면 같은 데이터가 만들어지고, 벤치마크로 만든 행은 제목/이름이 BENCHMARK_PREFIX로 시작하므로
+--reset으로 이전에 넣은 행과 벤치마크 관리자 계정만 지울 수 있습니다.
+--admin-password(또는 BENCHMARK_PASSWORD 환경 변수)를 주면 로그인 벤치마크용 관리자 계정도 만듭니다.
+ENV=local에서 --url로 지정한 로컬 DB에만 실행합니다.
+
+    BENCHMARK_PASSWORD=... poetry run python -m app.scripts.benchmarks.seed --url mysql+asyncmy://... --scale 100k --reset
+    poetry run python -m app.scripts.benchmarks.seed --url sqlite+aiosqlite:///bench.db --scale 1m --tables reviews
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+from uuid import uuid4
+
+from sqlalchemy import delete, func, insert, make_url, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.auth.jwt_codec import UserRole
+from app.auth.password_hasher import PasswordHasher
+from app.core.configs import settings
+from app.core.configs.settings import Env
+from app.core.database.session import create_engine
+from app.models.base import Base
+from app.models.column import Column
+from app.models.column_enums import ColumnStatus
+from app.models.portfolio import Portfolio
+from app.models.portfolio_enums import PortfolioCategory, PortfolioVisibility
+from app.models.review import Review
+from app.models.review_image import ReviewImage
+from app.models.user import User
+
+BENCHMARK_PREFIX = "[bench]"
+BENCHMARK_EMAIL = "bench-admin@example.com"
+# 관리자 계정 비밀번호를 읽는 환경 변수
+BENCHMARK_PASSWORD_ENV = "BENCHMARK_PASSWORD"
+PLACEHOLDER_IMAGE_URL = "/uploads/benchmark/placeholder.png"
+
+SCALES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+# 벤치마크 데이터를 넣을 수 있는 DB 호스트 (db는 docker-compose의 서비스 이름)
+LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "::1", "db"})
+
+# 최근 2년에 걸쳐 생성된 것처럼 created_at을 분산
+_TIME_SPAN = timedelta(days=730)
+
+
+def _created_at(rng: random.Random, now: datetime) -> datetime:
+    return now - _TIME_SPAN * rng.random()
+
+
+def column_row(index: int, rng: random.Random, now: datetime) -> dict[str, Any]:
+    created_at = _created_at(rng, now)
+    return {
+        "id": str(uuid4()),
+        "title": f"{BENCHMARK_PREFIX} 칼럼 {index}",
+        "content": "로고 디자인 이야기 " * rng.randint(20, 200),
+        "status": rng.choices(list(ColumnStatus), weights=(1, 8, 1))[0].value,
+        "thumbnail_url": PLACEHOLDER_IMAGE_URL,
+        "view_count": rng.randint(0, 10_000),
+        "category": rng.choice(("디자인", "브랜딩", "인사이트")),
+        "created_at": created_at,
+        "updated_at": created_at,
+    }
+
+
+def portfolio_row(index: int, rng: random.Random, now: datetime) -> dict[str, Any]:
+    created_at = _created_at(rng, now)
+    return {
+        "id": str(uuid4()),
+        "title": f"{BENCHMARK_PREFIX} 포트폴리오 {index}",
+        "description": "브랜드 아이덴티티 작업 " * rng.randint(5, 50),
+        "category": rng.choice(list(PortfolioCategory)).value,
+        "image_url": PLACEHOLDER_IMAGE_URL,
+        "display_order": rng.randint(0, 100),
+        "visibility": rng.choices(list(PortfolioVisibility), weights=(9, 1))[0].value,
+        "created_at": created_at,
+        "updated_at": created_at,
+    }
+
+
+def review_row(index: int, rng: random.Random, now: datetime) -> dict[str, Any]:
+    created_at = _created_at(rng, now)
+    order_amount = rng.randrange(50_000, 2_000_000, 10_000)
+    return {
+        "id": str(uuid4()),
+        "name": f"{BENCHMARK_PREFIX} 고객 {index}",
+        "rating": rng.choices((1, 2, 3, 4, 5), weights=(1, 1, 2, 6, 10))[0],
+        "content": "만족스러운 작업이었습니다. " * rng.randint(1, 20),
+        "order_type": rng.choice(("로고", "명함", "패키지")),
+        "order_amount": f"{order_amount:,}",
+        "order_amount_value": order_amount,
+        "working_days": rng.randint(1, 30),
+        "is_visible": rng.random() < 0.9,
+        "created_at": created_at,
+        "updated_at": created_at,
+    }
+
+
+def review_image_row(review: dict[str, Any]) -> dict[str, Any]:
+    return {"id": str(uuid4()), "review_id": review["id"], "position": 0, "url": PLACEHOLDER_IMAGE_URL}
+
+
+# 테이블 이름 -> (모델, 행 생성 함수, 벤치마크 행을 구분하는 컬럼)
+TABLES: dict[str, tuple[type[Base], Callable[[int, random.Random, datetime], dict[str, Any]], Any]] = {
+    "columns": (Column, column_row, Column.title),
+    "portfolios": (Portfolio, portfolio_row, Portfolio.title),
+    "reviews": (Review, review_row, Review.name),
+}
+
+# 테이블 이름 -> (자식 모델, 부모 행으로 자식 행을 만드는 함수). 부모와 같은 배치로 넣습니다.
+CHILD_TABLES: dict[str, tuple[type[Base], Callable[[dict[str, Any]], dict[str, Any]]]] = {
+    "reviews": (ReviewImage, review_image_row),
+}
+
+
+async def reset_table(target: AsyncEngine, table: str) -> int:
+    model, _, marker = TABLES[table]
+    async with target.begin() as connection:
+        result = await connection.execute(delete(model).where(marker.startswith(BENCHMARK_PREFIX)))
+    return result.rowcount
+
+
+async def seed_table(target: AsyncEngine, table: str, rows: int, batch_size: int, rng: random.Random) -> float:
+    """rows개의 행을 batch_size 단위의 multi-row INSERT로 넣고 걸린 시간을 반환합니다."""
+    model, make_row, _ = TABLES[table]
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    started = time.perf_counter()
+
+    for offset in range(0, rows, batch_size):
+        batch = [make_row(index, rng, now) for index in range(offset, min(offset + batch_size, rows))]
+        # 배치마다 커밋해 언두 로그와 잠금이 커지지 않게 합니다.
+        async with target.begin() as connection:
+            await connection.execute(insert(model), batch)
+            if table in CHILD_TABLES:
+                child_model, make_child_row = CHILD_TABLES[table]
+                await connection.execute(insert(child_model), [make_child_row(row) for row in batch])
+        print(f"{table}: {min(offset + batch_size, rows)}/{rows}", flush=True)
+
+    return time.perf_counter() - started
+
+
+async def reset_benchmark_user(target: AsyncEngine) -> int:
+    async with target.begin() as connection:
+        result = await connection.execute(delete(User).where(User.email == BENCHMARK_EMAIL))
+    return result.rowcount
+
+
+async def ensure_benchmark_user(target: AsyncEngine, password: str) -> None:
+    async with target.begin() as connection:
+        exists = await connection.scalar(select(func.count()).where(User.email == BENCHMARK_EMAIL))
+        if not exists:
+            await connection.execute(
+                insert(User).values(
+                    id=str(uuid4()),
+                    email=BENCHMARK_EMAIL,
+                    hashed_password=PasswordHasher.hash_password(password),
+                    name="Benchmark Admin",
+                    role=UserRole.ADMIN,
+                )
+            )
+
+
+def check_local_target(url: str) -> None:
+    """로컬 환경의 로컬 DB가 아니면 종료합니다. 벤치마크 관리자 계정과 대량의 행이 운영 DB에 들어가지 않게 합니다."""
+    if settings.ENV != Env.LOCAL:
+        raise SystemExit(f"Refusing to seed benchmark data with ENV={settings.ENV}")
+    host = make_url(url).host
+    if host is not None and host not in LOCAL_HOSTS:
+        raise SystemExit(f"Refusing to seed benchmark data on non-local host {host!r}")
+
+
+async def main(
+    url: str, rows: int, tables: list[str], batch_size: int, seed: int, reset: bool, admin_password: str | None
+) -> None:
+    check_local_target(url)
+    target = create_engine(url)
+    rng = random.Random(seed)
+
+    try:
+        if url.startswith("sqlite"):
+            async with target.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all)
+
+        if reset:
+            print(f"users: deleted {await reset_benchmark_user(target)} benchmark admin")
+        if admin_password:
+            await ensure_benchmark_user(target, admin_password)
+        for table in tables:
+            if reset:
+                print(f"{table}: deleted {await reset_table(target, table)} benchmark rows")
+            elapsed = await seed_table(target, table, rows, batch_size, rng)
+            print(f"{table}: inserted {rows} rows in {elapsed:.1f}s")
+    finally:
+        await target.dispose()
+
+
+def parse_scale(value: str) -> int:
+    return SCALES[value.lower()] if value.lower() in SCALES else int(value)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", required=True, help="로컬 DB URL (sqlite면 테이블도 생성)")
+    parser.add_argument("--scale", type=parse_scale, default="1k", help="테이블별 행 수 (1k, 100k, 1m 또는 숫자)")
+    parser.add_argument("--tables", nargs="+", choices=list(TABLES), default=list(TABLES), help="채울 테이블")
+    parser.add_argument("--batch-size", type=int, default=5000, help="INSERT 한 번에 넣을 행 수")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--reset", action="store_true", help="이전에 넣은 벤치마크 행과 관리자 계정을 먼저 삭제")
+    parser.add_argument(
+        "--admin-password",
+        default=os.environ.get(BENCHMARK_PASSWORD_ENV),
+        help=f"벤치마크 관리자 계정 비밀번호 (기본 {BENCHMARK_PASSWORD_ENV} 환경 변수, 없으면 계정을 만들지 않음)",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(main(args.url, args.scale, args.tables, args.batch_size, args.seed, args.reset, args.admin_password))
@@ -0,0 +1,23 @@
+import argparse
+import asyncio
+
+from app.core.database import async_session
+from app.core.storage import collect_garbage
+
+
+async def gc_uploads(grace_seconds: float | None) -> None:
+    async with async_session() as session:
+        removed = await collect_garbage(session, grace_seconds=grace_seconds)
+    print(f"Removed {removed} unreferenced upload files")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Delete uploaded blobs that no row references")
+    parser.add_argument(
+        "--grace-seconds",
+        type=float,
+        default=None,
+        help="Keep files stored more recently than this (default: UPLOAD_GC_GRACE_SECONDS)",
+    )
+    args = parser.parse_args()
+    asyncio.run(gc_uploads(args.grace_seconds))
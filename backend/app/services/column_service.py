@@ -1,20 +1,92 @@
+from datetime import datetime
+
 from fastapi import HTTPException, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.utils.file import save_upload_file
-from app.dtos.column.column_response import ColumnNavigation, ColumnResponse
-from app.dtos.common.paginated_response import PaginatedResponse
+from app.core.cache import response_cache
+from app.core.database.counts import list_counts
+from app.core.database.hooks import on_commit
+from app.core.database.keyset import InvalidCursorError
+from app.core.stats import view_count_buffer
+from app.core.storage import release_files_on_commit, release_files_on_rollback
+from app.core.utils.conditional import Validator, make_validator
+from app.core.utils.image import ImageVariants, save_upload_image
+from app.dtos.column.column_response import ColumnResponse, ColumnSummaryResponse
+from app.dtos.common.list_view import ListView
+from app.dtos.common.paginated_response import CursorPaginatedResponse, PaginatedResponse
 from app.models.column import Column
 from app.models.column_enums import ColumnStatus
 
 
-async def service_get_columns(
-    session: AsyncSession, page: int = 1, per_page: int = 12, status: ColumnStatus | None = None
-) -> PaginatedResponse[ColumnResponse]:
-    return await Column.get_all_with_pagination(session, page, per_page, status)
+async def _save_thumbnail(session: AsyncSession, thumbnail: UploadFile) -> tuple[str, ImageVariants | None]:
+    """썸네일과 변환본을 저장하고, 트랜잭션이 롤백되면 저장한 파일을 삭제합니다."""
+    stored_file, thumbnail_variants = await save_upload_image(thumbnail)
+    release_files_on_rollback(session, [stored_file])
+    return stored_file.url, thumbnail_variants
 
 
-async def service_get_column(session: AsyncSession, column_id: str) -> ColumnResponse:
+async def _with_current_views(session: AsyncSession, column: ColumnResponse) -> ColumnResponse:
+    """
+    상세 응답의 view_count를 DB 값에 아직 반영되지 않은 증가분을 더한 값으로 바꿉니다.
+
+    캐시된 응답의 view_count는 캐시한 시점의 값이라, flush 뒤에 증가분만 0이 되면 조회수가 줄어 보이므로
+    캐시를 쓰면 DB에서 다시 읽습니다.
+    """
+    view_count = column.view_count
+    if response_cache.enabled and (stored := await Column.get_view_count(session, column.id)) is not None:
+        view_count = stored
+    view_count += view_count_buffer.pending(column.id)
+    if view_count != column.view_count:
+        return column.model_copy(update={"view_count": view_count})
+    return column
+
+
+@response_cache.cached("columns")
+async def _get_columns_version(
+    session: AsyncSession, column_status: ColumnStatus | None
+) -> tuple[datetime | None, int]:
+    return await Column.get_version(session, column_status)
+
+
+async def service_get_columns_validator(session: AsyncSession, column_status: ColumnStatus | None = None) -> Validator:
+    """칼럼 목록 응답의 검증자."""
+    updated_at, count = await _get_columns_version(session, column_status)
+    return make_validator("columns", column_status, updated_at, count)
+
+
+async def service_get_column_validator(session: AsyncSession, column_id: str) -> Validator:
+    """칼럼 상세 응답의 검증자. 이전글/다음글도 포함되므로 공개 칼럼 전체의 버전을 사용합니다."""
+    updated_at, count = await _get_columns_version(session, ColumnStatus.PUBLISHED)
+    return make_validator("column", column_id, updated_at, count)
+
+
+@response_cache.cached("columns")
+async def _get_columns(
+    session: AsyncSession, page: int, per_page: int, status: ColumnStatus | None, view: ListView, excerpt_length: int
+) -> PaginatedResponse[ColumnResponse | ColumnSummaryResponse]:
+    return await Column.get_all_with_pagination(session, page, per_page, status, view, excerpt_length)
+
+
+@response_cache.cached("columns")
+async def _get_columns_by_cursor(
+    session: AsyncSession,
+    per_page: int,
+    cursor: str | None,
+    column_status: ColumnStatus | None,
+    view: ListView,
+    excerpt_length: int,
+) -> CursorPaginatedResponse[ColumnResponse | ColumnSummaryResponse]:
+    try:
+        return await Column.get_all_with_cursor(session, per_page, cursor, column_status, view, excerpt_length)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@response_cache.cached("columns")
+async def _get_column(session: AsyncSession, column_id: str) -> ColumnResponse:
     column = await Column.get_by_id(session, column_id)
 
     if not column:
@@ -30,37 +102,35 @@ async def service_get_column(session: AsyncSession, column_id: str) -> ColumnRes
         )
 
     # 이전글/다음글 가져오기
-    prev_column, next_column = await Column.get_prev_next_columns(session, column_id)
-
-    return ColumnResponse(
-        id=column.id,
-        title=column.title,
-        content=column.content,
-        status=column.status,
-        thumbnail_url=column.thumbnail_url,
-        view_count=column.view_count,
-        created_at=column.created_at,
-        updated_at=column.updated_at,
-        category=column.category,
-        prev_column=(
-            ColumnNavigation(
-                id=prev_column.id,
-                title=prev_column.title,
-                thumbnail_url=prev_column.thumbnail_url,
-            )
-            if prev_column
-            else None
-        ),
-        next_column=(
-            ColumnNavigation(
-                id=next_column.id,
-                title=next_column.title,
-                thumbnail_url=next_column.thumbnail_url,
-            )
-            if next_column
-            else None
-        ),
-    )
+    prev_column, next_column = await Column.get_navigation(session, column.created_at)
+
+    return column.to_response(prev_column=prev_column, next_column=next_column)
+
+
+async def service_get_columns(
+    session: AsyncSession,
+    page: int = 1,
+    per_page: int = 12,
+    status: ColumnStatus | None = None,
+    view: ListView = ListView.FULL,
+    excerpt_length: int = 0,
+) -> PaginatedResponse[ColumnResponse | ColumnSummaryResponse]:
+    return await _get_columns(session, page, per_page, status, view, excerpt_length)
+
+
+async def service_get_columns_by_cursor(
+    session: AsyncSession,
+    per_page: int = 12,
+    cursor: str | None = None,
+    column_status: ColumnStatus | None = None,
+    view: ListView = ListView.FULL,
+    excerpt_length: int = 0,
+) -> CursorPaginatedResponse[ColumnResponse | ColumnSummaryResponse]:
+    return await _get_columns_by_cursor(session, per_page, cursor, column_status, view, excerpt_length)
+
+
+async def service_get_column(session: AsyncSession, column_id: str) -> ColumnResponse:
+    return await _with_current_views(session, await _get_column(session, column_id))
 
 
 async def service_create_column(
@@ -71,7 +141,7 @@ async def service_create_column(
     category: str,
     thumbnail: UploadFile,
 ) -> ColumnResponse:
-    thumbnail_url = await save_upload_file(thumbnail, subdir="columns")
+    thumbnail_url, thumbnail_variants = await _save_thumbnail(session, thumbnail)
 
     column = await Column.create_one(
         session=session,
@@ -80,19 +150,12 @@ async def service_create_column(
         status=column_status,
         thumbnail_url=thumbnail_url,
         category=category,
+        thumbnail_variants=thumbnail_variants,
     )
+    list_counts.apply_on_commit(session, Column.__tablename__, before=None, after=column.status)
+    response_cache.invalidate_on_commit(session, "columns")
 
-    return ColumnResponse(
-        id=column.id,
-        title=column.title,
-        content=column.content,
-        status=column.status,
-        thumbnail_url=column.thumbnail_url,
-        view_count=column.view_count,
-        created_at=column.created_at,
-        updated_at=column.updated_at,
-        category=column.category,
-    )
+    return column.to_response()
 
 
 async def service_update_column(
@@ -112,7 +175,12 @@ async def service_update_column(
             detail="Column not found",
         )
 
-    thumbnail_url = await save_upload_file(thumbnail_image, subdir="columns") if thumbnail_image else None
+    thumbnail_url, thumbnail_variants = (
+        await _save_thumbnail(session, thumbnail_image) if thumbnail_image else (None, None)
+    )
+    if thumbnail_url is not None and column.thumbnail_url and thumbnail_url != column.thumbnail_url:
+        release_files_on_commit(session, [column.thumbnail_url])
+    status_before = column.status
 
     await column.update(
         session=session,
@@ -121,19 +189,12 @@ async def service_update_column(
         status=column_status,
         thumbnail_url=thumbnail_url,
         category=category,
+        thumbnail_variants=thumbnail_variants,
     )
+    list_counts.apply_on_commit(session, Column.__tablename__, before=status_before, after=column.status)
+    response_cache.invalidate_on_commit(session, "columns")
 
-    return ColumnResponse(
-        id=column.id,
-        title=column.title,
-        content=column.content,
-        status=column.status,
-        thumbnail_url=column.thumbnail_url,
-        view_count=column.view_count,
-        created_at=column.created_at,
-        updated_at=column.updated_at,
-        category=column.category,
-    )
+    return column.to_response()
 
 
 async def service_delete_column(session: AsyncSession, column_id: str) -> None:
@@ -146,16 +207,21 @@ async def service_delete_column(session: AsyncSession, column_id: str) -> None:
         )
 
     await column.delete(session=session)
+    if column.thumbnail_url:
+        release_files_on_commit(session, [column.thumbnail_url])
+    on_commit(session, lambda: view_count_buffer.forget(column_id))
+    list_counts.apply_on_commit(session, Column.__tablename__, before=column.status, after=None)
+    response_cache.invalidate_on_commit(session, "columns")
 
 
 async def service_increment_view_count(session: AsyncSession, column_id: str) -> None:
-    column = await Column.get_by_id(session, column_id)
-
-    if not column:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Column not found",
-        )
+    # 존재가 확인된 칼럼은 DB를 거치지 않고 메모리 버퍼에만 더합니다.
+    if not view_count_buffer.is_known(column_id):
+        if not await Column.exists(session, column_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Column not found",
+            )
+        view_count_buffer.remember(column_id)
 
-    column.view_count += 1
-    await session.flush()
+    view_count_buffer.increment(column_id)
@@ -1,19 +1,81 @@
+from datetime import datetime
+
 from fastapi import File, HTTPException, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.utils.file import save_upload_file
-from app.dtos.common.paginated_response import PaginatedResponse
-from app.dtos.portfolio.portfolio_response import PortfolioResponse
+from app.core.cache import response_cache
+from app.core.database.counts import list_counts
+from app.core.database.keyset import InvalidCursorError
+from app.core.storage import release_files_on_commit, release_files_on_rollback
+from app.core.utils.conditional import Validator, make_validator
+from app.core.utils.image import ImageVariants, save_upload_image
+from app.dtos.common.list_view import ListView
+from app.dtos.common.paginated_response import CursorPaginatedResponse, PaginatedResponse
+from app.dtos.portfolio.portfolio_response import PortfolioResponse, PortfolioSummaryResponse
 from app.models.portfolio import Portfolio
 from app.models.portfolio_enums import PortfolioCategory, PortfolioVisibility
 
 
+async def _save_portfolio_image(session: AsyncSession, image: UploadFile) -> tuple[str, ImageVariants | None]:
+    """포트폴리오 이미지와 변환본을 저장하고, 트랜잭션이 롤백되면 저장한 파일을 삭제합니다."""
+    stored_file, image_variants = await save_upload_image(image)
+    release_files_on_rollback(session, [stored_file])
+    return stored_file.url, image_variants
+
+
+@response_cache.cached("portfolios")
+async def _get_portfolios_version(session: AsyncSession) -> tuple[datetime | None, int]:
+    return await Portfolio.get_version(session)
+
+
+@response_cache.cached("portfolios")
+async def _get_portfolio_updated_at(session: AsyncSession, portfolio_id: str) -> datetime | None:
+    return await Portfolio.get_updated_at(session, portfolio_id)
+
+
+async def service_get_portfolios_validator(session: AsyncSession) -> Validator:
+    """포트폴리오 목록 응답의 검증자"""
+    updated_at, count = await _get_portfolios_version(session)
+    return make_validator("portfolios", updated_at, count)
+
+
+async def service_get_portfolio_validator(session: AsyncSession, portfolio_id: str) -> Validator | None:
+    """포트폴리오 상세 응답의 검증자. 포트폴리오가 없으면 None"""
+    updated_at = await _get_portfolio_updated_at(session, portfolio_id)
+    if updated_at is None:
+        return None
+    return make_validator("portfolio", portfolio_id, updated_at, last_modified=updated_at)
+
+
+@response_cache.cached("portfolios")
 async def service_get_portfolios(
-    session: AsyncSession, page: int = 1, per_page: int = 12
-) -> PaginatedResponse[PortfolioResponse]:
-    return await Portfolio.get_all_with_pagination(session, page, per_page)
+    session: AsyncSession,
+    page: int = 1,
+    per_page: int = 12,
+    view: ListView = ListView.FULL,
+    excerpt_length: int = 0,
+) -> PaginatedResponse[PortfolioResponse | PortfolioSummaryResponse]:
+    return await Portfolio.get_all_with_pagination(session, page, per_page, view, excerpt_length)
+
+
+@response_cache.cached("portfolios")
+async def service_get_portfolios_by_cursor(
+    session: AsyncSession,
+    per_page: int = 12,
+    cursor: str | None = None,
+    view: ListView = ListView.FULL,
+    excerpt_length: int = 0,
+) -> CursorPaginatedResponse[PortfolioResponse | PortfolioSummaryResponse]:
+    try:
+        return await Portfolio.get_all_with_cursor(session, per_page, cursor, view, excerpt_length)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
 
 
+@response_cache.cached("portfolios")
 async def service_get_portfolio(session: AsyncSession, portfolio_id: str) -> PortfolioResponse:
     portfolio = await Portfolio.get_by_id(session, portfolio_id)
 
@@ -23,17 +85,7 @@ async def service_get_portfolio(session: AsyncSession, portfolio_id: str) -> Por
             detail="Portfolio not found",
         )
 
-    return PortfolioResponse(
-        id=portfolio.id,
-        title=portfolio.title,
-        description=portfolio.description,
-        category=portfolio.category,
-        image_url=portfolio.image_url,
-        display_order=portfolio.display_order,
-        visibility=portfolio.visibility,
-        created_at=portfolio.created_at,
-        updated_at=portfolio.updated_at,
-    )
+    return portfolio.to_response()
 
 
 async def service_create_portfolio(
@@ -45,7 +97,7 @@ async def service_create_portfolio(
     visibility: str,
     image: UploadFile = File(...),
 ) -> PortfolioResponse:
-    image_url = await save_upload_file(image, subdir="portfolios")
+    image_url, image_variants = await _save_portfolio_image(session, image)
 
     portfolio = await Portfolio.create_one(
         session=session,
@@ -55,19 +107,12 @@ async def service_create_portfolio(
         display_order=display_order,
         visibility=PortfolioVisibility(visibility),
         image_url=image_url,
+        image_variants=image_variants,
     )
+    list_counts.apply_on_commit(session, Portfolio.__tablename__, before=None, after=portfolio.visibility)
+    response_cache.invalidate_on_commit(session, "portfolios")
 
-    return PortfolioResponse(
-        id=portfolio.id,
-        title=portfolio.title,
-        description=portfolio.description,
-        category=portfolio.category,
-        image_url=portfolio.image_url,
-        display_order=portfolio.display_order,
-        visibility=portfolio.visibility,
-        created_at=portfolio.created_at,
-        updated_at=portfolio.updated_at,
-    )
+    return portfolio.to_response()
 
 
 async def service_update_portfolio(
@@ -88,7 +133,10 @@ async def service_update_portfolio(
             detail="Portfolio not found",
         )
 
-    image_url = await save_upload_file(image, subdir="portfolios") if image else None
+    image_url, image_variants = await _save_portfolio_image(session, image) if image else (None, None)
+    if image_url is not None and image_url != portfolio.image_url:
+        release_files_on_commit(session, [portfolio.image_url])
+    visibility_before = portfolio.visibility
 
     await portfolio.update(
         session,
@@ -98,19 +146,12 @@ async def service_update_portfolio(
         display_order=display_order,
         visibility=visibility,
         image_url=image_url,
+        image_variants=image_variants,
     )
+    list_counts.apply_on_commit(session, Portfolio.__tablename__, before=visibility_before, after=portfolio.visibility)
+    response_cache.invalidate_on_commit(session, "portfolios")
 
-    return PortfolioResponse(
-        id=portfolio.id,
-        title=portfolio.title,
-        description=portfolio.description,
-        category=portfolio.category,
-        image_url=portfolio.image_url,
-        display_order=portfolio.display_order,
-        visibility=portfolio.visibility,
-        created_at=portfolio.created_at,
-        updated_at=portfolio.updated_at,
-    )
+    return portfolio.to_response()
 
 
 async def service_delete_portfolio(session: AsyncSession, portfolio_id: str) -> None:
@@ -123,3 +164,6 @@ async def service_delete_portfolio(session: AsyncSession, portfolio_id: str) ->
         )
 
     await portfolio.delete(session)
+    release_files_on_commit(session, [portfolio.image_url])
+    list_counts.apply_on_commit(session, Portfolio.__tablename__, before=portfolio.visibility, after=None)
+    response_cache.invalidate_on_commit(session, "portfolios")
@@ -1,33 +1,78 @@
+import asyncio
+from datetime import datetime
 from typing import Optional
 
-from fastapi import HTTPException, UploadFile, status, File
+from fastapi import File, HTTPException, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.utils.file import save_upload_file
-from app.dtos.common.paginated_response import PaginatedResponse
+from app.core.cache import response_cache
+from app.core.database.counts import list_counts
+from app.core.database.keyset import InvalidCursorError
+from app.core.stats import review_stats
+from app.core.storage import release_files_on_commit, release_files_on_rollback
+from app.core.utils.conditional import Validator, make_validator
+from app.core.utils.file import store_upload_files
+from app.core.utils.image import create_image_variants, read_image_size
+from app.dtos.common.paginated_response import CursorPaginatedResponse, PaginatedResponse
 from app.dtos.review import ReviewStatsResponse
 from app.dtos.review.review_query import ReviewQueryParams
 from app.dtos.review.review_response import ReviewResponse
 from app.models.review import Review
+from app.models.review_image import ReviewImage
 
 
-def _to_review_response(review: Review) -> ReviewResponse:
-    """Review 모델을 ReviewResponse로 변환합니다."""
-    return ReviewResponse(
-        id=review.id,
-        name=review.name,
-        rating=review.rating,
-        content=review.content,
-        order_type=review.order_type,
-        order_amount=review.order_amount,
-        working_days=review.working_days,
-        is_visible=review.is_visible,
-        images=review.image_urls.split(",") if review.image_urls else [],
-        created_at=review.created_at,
-        updated_at=review.updated_at,
+def _visible_rating(review: Review) -> int | None:
+    """공개 리뷰이면 평점을, 비공개 리뷰이면 None을 반환합니다."""
+    return review.rating if review.is_visible else None
+
+
+async def _save_review_images(session: AsyncSession, images: list[UploadFile]) -> list[ReviewImage]:
+    """리뷰 이미지를 동시에 저장하고 변환본과 크기를 구합니다. 트랜잭션이 롤백되면 저장한 파일을 삭제합니다."""
+    stored_files = await store_upload_files(images)
+    release_files_on_rollback(session, stored_files)
+    image_urls = [stored_file.url for stored_file in stored_files]
+    variants, sizes = await asyncio.gather(
+        asyncio.gather(*(create_image_variants(image_url) for image_url in image_urls)),
+        asyncio.gather(*(read_image_size(image_url) for image_url in image_urls)),
     )
+    return [
+        ReviewImage(
+            position=position,
+            url=stored_file.url,
+            variants=image_variants,
+            width=size[0] if size else None,
+            height=size[1] if size else None,
+            size_bytes=stored_file.size,
+        )
+        for position, (stored_file, image_variants, size) in enumerate(zip(stored_files, variants, sizes))
+    ]
+
+
+@response_cache.cached("reviews")
+async def _get_reviews_version(session: AsyncSession, is_visible: bool | None) -> tuple[datetime | None, int]:
+    return await Review.get_version(session, is_visible)
+
+
+@response_cache.cached("reviews")
+async def _get_review_updated_at(session: AsyncSession, review_id: str) -> datetime | None:
+    return await Review.get_updated_at(session, review_id)
+
 
+async def service_get_reviews_validator(session: AsyncSession, is_visible: bool | None = None) -> Validator:
+    """리뷰 목록 응답의 검증자"""
+    updated_at, count = await _get_reviews_version(session, is_visible)
+    return make_validator("reviews", is_visible, updated_at, count)
 
+
+async def service_get_review_validator(session: AsyncSession, review_id: str) -> Validator | None:
+    """리뷰 상세 응답의 검증자. 리뷰가 없으면 None"""
+    updated_at = await _get_review_updated_at(session, review_id)
+    if updated_at is None:
+        return None
+    return make_validator("review", review_id, updated_at, last_modified=updated_at)
+
+
+@response_cache.cached("reviews")
 async def service_get_reviews(
     session: AsyncSession,
     query_params: ReviewQueryParams,
@@ -43,11 +88,31 @@ async def service_get_reviews(
     )
 
 
+@response_cache.cached("reviews")
+async def service_get_reviews_by_cursor(
+    session: AsyncSession,
+    query_params: ReviewQueryParams,
+) -> CursorPaginatedResponse[ReviewResponse]:
+    """커서 기반으로 리뷰 목록을 조회합니다."""
+    try:
+        return await Review.get_all_with_cursor(
+            session=session,
+            per_page=query_params.per_page,
+            cursor=query_params.cursor,
+            is_visible=query_params.is_visible,
+            sort_by=query_params.sort_by,
+            sort_order=query_params.sort_order,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@response_cache.cached("reviews")
 async def service_get_review_by_id(session: AsyncSession, review_id: str) -> Optional[ReviewResponse]:
     """ID로 리뷰를 조회합니다."""
     review = await Review.get_by_id(session=session, review_id=review_id)
     if review:
-        return _to_review_response(review)
+        return review.to_response()
     return None
 
 
@@ -63,7 +128,7 @@ async def service_create_review(
     images: list[UploadFile] = File(...),
 ) -> ReviewResponse:
     """새로운 리뷰를 생성합니다."""
-    image_urls = ",".join([await save_upload_file(image, subdir="reviews") for image in images])
+    review_images = await _save_review_images(session, images)
 
     review = await Review.create_one(
         session=session,
@@ -74,9 +139,12 @@ async def service_create_review(
         order_amount=order_amount,
         working_days=working_days,
         is_visible=is_visible,
-        image_urls=image_urls,
+        images=review_images,
     )
-    return _to_review_response(review)
+    list_counts.apply_on_commit(session, Review.__tablename__, before=None, after=review.is_visible)
+    response_cache.invalidate_on_commit(session, "reviews")
+    review_stats.apply_on_commit(session, before=None, after=_visible_rating(review))
+    return review.to_response()
 
 
 async def service_update_review(
@@ -100,7 +168,11 @@ async def service_update_review(
             detail="Review not found",
         )
 
-    image_urls = ",".join([await save_upload_file(image, subdir="reviews") for image in images]) if images else None
+    review_images = await _save_review_images(session, images) if images else None
+    if review_images is not None:
+        release_files_on_commit(session, review.image_urls)
+    rating_before = _visible_rating(review)
+    visible_before = review.is_visible
 
     await review.update(
         session=session,
@@ -111,9 +183,12 @@ async def service_update_review(
         order_amount=order_amount,
         working_days=working_days,
         is_visible=is_visible,
-        image_urls=image_urls,
+        images=review_images,
     )
-    return _to_review_response(review)
+    list_counts.apply_on_commit(session, Review.__tablename__, before=visible_before, after=review.is_visible)
+    response_cache.invalidate_on_commit(session, "reviews")
+    review_stats.apply_on_commit(session, before=rating_before, after=_visible_rating(review))
+    return review.to_response()
 
 
 async def service_delete_review(session: AsyncSession, review_id: str) -> None:
@@ -122,9 +197,14 @@ async def service_delete_review(session: AsyncSession, review_id: str) -> None:
     if not review:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Review not found")
 
+    rating_before = _visible_rating(review)
     await review.delete(session=session)
+    release_files_on_commit(session, review.image_urls)
+    list_counts.apply_on_commit(session, Review.__tablename__, before=review.is_visible, after=None)
+    response_cache.invalidate_on_commit(session, "reviews")
+    review_stats.apply_on_commit(session, before=rating_before, after=None)
 
 
 async def service_get_review_stats(session: AsyncSession) -> ReviewStatsResponse:
     """리뷰 통계를 조회합니다."""
-    return await Review.get_stats(session=session)
+    return await review_stats.get_stats(session=session)
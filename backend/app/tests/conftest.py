@@ -0,0 +1,59 @@
+from pathlib import Path
+from typing import AsyncIterator
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app import app
+from app.core import dependencies
+from app.core.cache import response_cache
+from app.core.configs import settings
+from app.core.configs.settings import ReplicaStrategy
+from app.core.database.counts import list_counts
+from app.core.database.routing import ReplicaRouter
+from app.core.metrics.profiler import instrument_engine_for_profiling
+from app.core.stats import review_stats
+from app.models.base import Base
+
+
+@pytest.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    """테스트마다 새로 만드는 인메모리 SQLite 엔진. SQL 문을 query_budget으로 셀 수 있게 계측합니다."""
+    test_engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    instrument_engine_for_profiling(test_engine)
+    async with test_engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield test_engine
+    await test_engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+async def client(
+    session_factory: async_sessionmaker[AsyncSession], monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[httpx.AsyncClient]:
+    """테스트 DB를 쓰는 ASGI 클라이언트. 응답 캐시를 끄므로 요청마다 실제 쿼리가 실행됩니다."""
+    monkeypatch.setattr(dependencies, "async_session", session_factory)
+    monkeypatch.setattr(
+        dependencies, "replica_router", ReplicaRouter(session_factory, [], ReplicaStrategy.ROUND_ROBIN, 0, 1)
+    )
+    monkeypatch.setattr(response_cache, "_backend", None)
+    # 프로세스 메모리에 남은 이전 테스트 DB의 개수와 통계를 버립니다.
+    monkeypatch.setattr(list_counts, "_entries", {})
+    monkeypatch.setattr(review_stats, "_loaded_at", None)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def upload_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """업로드 파일을 테스트마다 새 임시 디렉토리에 저장합니다."""
+    monkeypatch.setattr(settings, "UPLOAD_DIR", tmp_path)
+    return tmp_path
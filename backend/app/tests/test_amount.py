@@ -0,0 +1,56 @@
+import pytest
+
+from app.core.utils.amount import parse_amount
+
+
+@pytest.mark.parametrize(
+    ("text", "amount"),
+    [
+        ("300,000원", 300_000),
+        ("300000", 300_000),
+        ("30만원", 300_000),
+        ("30 만원", 300_000),
+        ("1.5억", 150_000_000),
+        ("1억 2천만원", 120_000_000),
+        ("1억2천", 120_000_000),
+        ("3천5백만원", 35_000_000),
+        ("2천원", 2_000),
+        ("약 50만원", 500_000),
+    ],
+)
+def test_parse_amount(text: str, amount: int) -> None:
+    assert parse_amount(text) == amount
+
+
+@pytest.mark.parametrize(
+    ("text", "amount"),
+    [
+        ("1,500,000원 (VAT 10%)", 1_500_000),
+        ("30만원 + 추가 5만원", 300_000),
+        ("50만원, 수정 3회", 500_000),
+    ],
+)
+def test_parse_amount_reads_only_the_first_amount(text: str, amount: int) -> None:
+    assert parse_amount(text) == amount
+
+
+@pytest.mark.parametrize(
+    ("text", "amount"),
+    [
+        ("50~70만원", 500_000),
+        ("50 ~ 70만원", 500_000),
+        ("50-70만원", 500_000),
+        ("5천~7천만원", 50_000_000),
+        ("1~2억", 100_000_000),
+        ("50만~70만원", 500_000),
+        ("300,000~500,000원", 300_000),
+        ("300,000~50만원", 300_000),
+    ],
+)
+def test_parse_amount_range_returns_lower_bound(text: str, amount: int) -> None:
+    assert parse_amount(text) == amount
+
+
+@pytest.mark.parametrize("text", ["", "협의", "견적 후 안내", "만원"])
+def test_parse_amount_without_number_returns_zero(text: str) -> None:
+    assert parse_amount(text) == 0
@@ -0,0 +1,93 @@
+import dataclasses
+import io
+import os
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.database.hooks import run_rollback_hooks
+from app.core.storage import blob_store
+from app.core.storage.blob_store import release_files, release_files_on_rollback
+from app.core.utils.file import StoredFile, store_upload_file
+
+
+async def _store(content: bytes) -> StoredFile:
+    return await store_upload_file(UploadFile(io.BytesIO(content), filename="image.png"))
+
+
+def _age(stored_file: StoredFile, seconds: float) -> StoredFile:
+    """blob을 seconds초 전에 저장한 것처럼 mtime을 되돌립니다."""
+    mtime = time.time() - seconds
+    os.utime(stored_file.path, (mtime, mtime))
+    return dataclasses.replace(stored_file, mtime=stored_file.path.stat().st_mtime)
+
+
+def _variant(stored_file: StoredFile) -> Path:
+    variant = stored_file.path.with_name(f"{stored_file.sha256}_w320.webp")
+    variant.write_bytes(b"variant")
+    return variant
+
+
+async def test_rollback_discards_blobs_created_by_the_request(
+    upload_dir: Path, session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    """방금 저장한 blob은 유예 시간 안이어도 롤백되면 변환본과 함께 삭제합니다."""
+    stored_file = await _store(b"new image")
+    variant = _variant(stored_file)
+
+    async with session_factory() as session:
+        release_files_on_rollback(session, [stored_file])
+        await run_rollback_hooks(session)
+
+    assert stored_file.created
+    assert not stored_file.path.exists()
+    assert not variant.exists()
+
+
+async def test_rollback_keeps_deduplicated_blob(
+    upload_dir: Path, session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    """이미 있던 blob에 중복 제거된 파일은 다른 행이 참조할 수 있으므로 남겨 둡니다."""
+    await _store(b"shared image")
+    deduplicated = await _store(b"shared image")
+
+    async with session_factory() as session:
+        release_files_on_rollback(session, [deduplicated])
+        await run_rollback_hooks(session)
+
+    assert not deduplicated.created
+    assert deduplicated.path.exists()
+
+
+async def test_rollback_keeps_blob_reuploaded_by_another_request(
+    upload_dir: Path, session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    stored_file = _age(await _store(b"raced image"), seconds=60)
+    # 롤백 전에 다른 요청이 같은 내용을 올려 mtime이 갱신됨
+    await _store(b"raced image")
+
+    async with session_factory() as session:
+        release_files_on_rollback(session, [stored_file])
+        await run_rollback_hooks(session)
+
+    assert stored_file.path.exists()
+
+
+@pytest.mark.parametrize(("age", "deleted"), [(0, False), (3600, True)])
+async def test_release_files_applies_grace_period(
+    upload_dir: Path,
+    session_factory: async_sessionmaker[AsyncSession],
+    monkeypatch: pytest.MonkeyPatch,
+    age: float,
+    deleted: bool,
+) -> None:
+    """커밋 후 정리에서는 최근에 저장되거나 재업로드된 blob을 남겨 둡니다."""
+    monkeypatch.setattr(blob_store, "async_session", session_factory)
+    stored_file = _age(await _store(b"released image"), seconds=age)
+
+    await release_files([stored_file.url])
+
+    assert stored_file.path.exists() is not deleted
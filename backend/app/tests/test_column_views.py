@@ -0,0 +1,48 @@
+from typing import AsyncIterator
+from uuid import uuid4
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.cache import MemoryCacheBackend, response_cache
+from app.core.stats import view_count_buffer
+from app.models.column import Column
+from app.models.column_enums import ColumnStatus
+
+
+@pytest.fixture
+async def column_id(
+    client: httpx.AsyncClient, session_factory: async_sessionmaker[AsyncSession], monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[str]:
+    # 상세 응답을 캐시한 채로 조회수가 바뀌는 경우를 확인합니다.
+    monkeypatch.setattr(response_cache, "_backend", MemoryCacheBackend(max_entries=100))
+    monkeypatch.setattr(view_count_buffer, "_session_factory", session_factory)
+
+    column_id = str(uuid4())
+    async with session_factory() as session:
+        column = Column(id=column_id, title="칼럼", content="내용", status=ColumnStatus.PUBLISHED, category="디자인")
+        session.add(column)
+        await session.commit()
+    yield column_id
+    view_count_buffer.forget(column_id)
+
+
+async def _view_count(client: httpx.AsyncClient, column_id: str) -> int:
+    response = await client.get(f"/api/v1/columns/{column_id}")
+    assert response.status_code == 200, response.text
+    count: int = response.json()["view_count"]
+    return count
+
+
+async def test_detail_view_count_does_not_go_backwards_after_flush(client: httpx.AsyncClient, column_id: str) -> None:
+    assert await _view_count(client, column_id) == 0
+
+    for _ in range(3):
+        assert (await client.post(f"/api/v1/columns/{column_id}/view")).status_code == 200
+    assert await _view_count(client, column_id) == 3
+
+    # flush 뒤에는 증가분이 0이 되고 캐시된 응답은 flush 이전 값이므로 DB에서 다시 읽어야 합니다.
+    await view_count_buffer.flush()
+    assert view_count_buffer.pending(column_id) == 0
+    assert await _view_count(client, column_id) == 3
@@ -0,0 +1,85 @@
+from datetime import datetime
+from uuid import uuid4
+
+import httpx
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.column import Column
+from app.models.column_enums import ColumnStatus
+
+
+@pytest.fixture
+async def column_id(session_factory: async_sessionmaker[AsyncSession]) -> str:
+    column_id = str(uuid4())
+    async with session_factory() as session:
+        session.add(
+            Column(
+                id=column_id,
+                title="칼럼",
+                content="내용",
+                status=ColumnStatus.PUBLISHED,
+                category="디자인",
+                updated_at=datetime(2020, 1, 1),
+            )
+        )
+        await session.commit()
+    return column_id
+
+
+async def _etag(client: httpx.AsyncClient, url: str) -> str:
+    response = await client.get(url)
+    assert response.status_code == 200, response.text
+    assert response.headers["cache-control"] == "no-cache"
+    return response.headers["etag"]
+
+
+async def test_matching_etag_returns_not_modified(client: httpx.AsyncClient, column_id: str) -> None:
+    url = f"/api/v1/columns/{column_id}"
+    etag = await _etag(client, url)
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+@pytest.mark.parametrize("if_none_match", ['"{tag}"', 'W/"other", {etag}', '"other",W/"{tag}"'])
+async def test_if_none_match_uses_weak_comparison(
+    if_none_match: str, client: httpx.AsyncClient, column_id: str
+) -> None:
+    url = f"/api/v1/columns/{column_id}"
+    etag = await _etag(client, url)
+    tag = etag.removeprefix("W/").strip('"')
+
+    response = await client.get(url, headers={"If-None-Match": if_none_match.format(etag=etag, tag=tag)})
+
+    assert response.status_code == 304
+
+
+async def test_if_none_match_star_is_ignored(client: httpx.AsyncClient, column_id: str) -> None:
+    # 검증자는 리소스가 있는지 모른 채 만들어지므로 없는 칼럼에도 304를 주면 안 됩니다.
+    assert (await client.get(f"/api/v1/columns/{column_id}", headers={"If-None-Match": "*"})).status_code == 200
+    assert (await client.get(f"/api/v1/columns/{uuid4()}", headers={"If-None-Match": "*"})).status_code == 404
+
+
+async def test_etag_changes_after_update(
+    client: httpx.AsyncClient, column_id: str, session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    url = f"/api/v1/columns/{column_id}"
+    etag = await _etag(client, url)
+    list_etag = await _etag(client, "/api/v1/columns")
+
+    async with session_factory() as session:
+        await session.execute(
+            update(Column).where(Column.id == column_id).values(title="수정한 칼럼", updated_at=datetime(2021, 1, 1))
+        )
+        await session.commit()
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["title"] == "수정한 칼럼"
+    assert (await client.get("/api/v1/columns", headers={"If-None-Match": list_etag})).status_code == 200
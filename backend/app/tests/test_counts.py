@@ -0,0 +1,146 @@
+from collections.abc import Hashable
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.configs.settings import ListCountMode
+from app.core.database import counts
+from app.core.database.counts import ListCount, ListCountCache
+from app.core.database.hooks import run_commit_hooks, run_rollback_hooks
+from app.models.column import Column
+from app.models.column_enums import ColumnStatus
+
+TABLE = Column.__tablename__
+PUBLISHED_QUERY = select(Column.id).where(Column.status == ColumnStatus.PUBLISHED)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    # time 모듈 전체를 바꾸면 이벤트 루프 시계도 바뀌므로 counts 모듈이 보는 time만 바꿉니다.
+    fake_clock = FakeClock()
+    monkeypatch.setattr(counts, "time", fake_clock)
+    return fake_clock
+
+
+async def _add_columns(session_factory: async_sessionmaker[AsyncSession], status: ColumnStatus, amount: int) -> None:
+    async with session_factory() as session:
+        session.add_all(
+            Column(id=str(uuid4()), title="칼럼", content="내용", status=status, category="디자인")
+            for _ in range(amount)
+        )
+        await session.commit()
+
+
+async def _count(
+    cache: ListCountCache, session_factory: async_sessionmaker[AsyncSession], filter_value: Hashable = None
+) -> ListCount:
+    query = PUBLISHED_QUERY if filter_value == ColumnStatus.PUBLISHED else select(Column.id)
+    async with session_factory() as session:
+        return await cache.count(session, query, TABLE, filter_value)
+
+
+async def test_exact_mode_counts_every_time(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    cache = ListCountCache(ListCountMode.EXACT, refresh_interval=60, estimate_threshold=0)
+    await _add_columns(session_factory, ColumnStatus.PUBLISHED, 2)
+    assert await _count(cache, session_factory) == ListCount(2, estimated=False)
+
+    await _add_columns(session_factory, ColumnStatus.PUBLISHED, 1)
+    assert await _count(cache, session_factory) == ListCount(3, estimated=False)
+
+
+async def test_cached_count_is_reloaded_after_refresh_interval(
+    session_factory: async_sessionmaker[AsyncSession], clock: FakeClock
+) -> None:
+    cache = ListCountCache(ListCountMode.CACHED, refresh_interval=60, estimate_threshold=0)
+    await _add_columns(session_factory, ColumnStatus.PUBLISHED, 2)
+    assert (await _count(cache, session_factory)).total == 2
+
+    # 다른 워커가 추가한 행은 refresh_interval이 지나야 보입니다.
+    await _add_columns(session_factory, ColumnStatus.PUBLISHED, 1)
+    clock.now += 59
+    assert (await _count(cache, session_factory)).total == 2
+
+    clock.now += 1
+    assert (await _count(cache, session_factory)).total == 3
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+async def test_commit_adjusts_cached_totals(
+    session_factory: async_sessionmaker[AsyncSession], clock: FakeClock
+) -> None:
+    cache = ListCountCache(ListCountMode.CACHED, refresh_interval=60, estimate_threshold=0)
+    await _add_columns(session_factory, ColumnStatus.PUBLISHED, 2)
+    await _add_columns(session_factory, ColumnStatus.DRAFT, 1)
+    assert (await _count(cache, session_factory)).total == 3
+    assert (await _count(cache, session_factory, ColumnStatus.PUBLISHED)).total == 2
+
+    async with session_factory() as session:
+        cache.apply_on_commit(session, TABLE, before=None, after=ColumnStatus.PUBLISHED)
+        cache.apply_on_commit(session, TABLE, before=ColumnStatus.DRAFT, after=ColumnStatus.PUBLISHED)
+        await run_commit_hooks(session)
+
+        cache.apply_on_commit(session, TABLE, before=ColumnStatus.PUBLISHED, after=None)
+        await run_rollback_hooks(session)
+
+    assert (await _count(cache, session_factory)).total == 4
+    assert (await _count(cache, session_factory, ColumnStatus.PUBLISHED)).total == 4
+    assert cache.misses == 2
+
+
+async def test_count_loaded_during_write_is_not_stored(
+    session_factory: async_sessionmaker[AsyncSession], clock: FakeClock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = ListCountCache(ListCountMode.CACHED, refresh_interval=60, estimate_threshold=0)
+    count_rows = ListCountCache._count_rows
+
+    async def count_rows_while_writing(session: AsyncSession, query: Select[Any]) -> int:
+        # 세는 도중에 다른 요청의 쓰기가 커밋된 경우
+        total = await count_rows(session, query)
+        cache.apply(TABLE, before=None, after=ColumnStatus.PUBLISHED)
+        return total
+
+    monkeypatch.setattr(cache, "_count_rows", count_rows_while_writing)
+    await _count(cache, session_factory)
+    await _count(cache, session_factory)
+
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+async def test_estimated_mode_falls_back_to_exact_count_without_statistics(
+    session_factory: async_sessionmaker[AsyncSession], clock: FakeClock
+) -> None:
+    # SQLite에는 테이블 통계가 없으므로 추정하지 않고 셉니다.
+    cache = ListCountCache(ListCountMode.ESTIMATED, refresh_interval=60, estimate_threshold=0)
+    await _add_columns(session_factory, ColumnStatus.PUBLISHED, 2)
+
+    assert await _count(cache, session_factory) == ListCount(2, estimated=False)
+
+
+@pytest.mark.parametrize(("estimate", "expected"), [(50_000, ListCount(50_000, True)), (10, ListCount(2, False))])
+async def test_estimated_mode_uses_estimate_above_threshold(
+    estimate: int,
+    expected: ListCount,
+    session_factory: async_sessionmaker[AsyncSession],
+    clock: FakeClock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = ListCountCache(ListCountMode.ESTIMATED, refresh_interval=60, estimate_threshold=10_000)
+    await _add_columns(session_factory, ColumnStatus.PUBLISHED, 2)
+
+    async def estimate_rows(*args: object) -> int:
+        return estimate
+
+    monkeypatch.setattr(cache, "_estimate_rows", estimate_rows)
+
+    assert await _count(cache, session_factory) == expected
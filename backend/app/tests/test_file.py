@@ -0,0 +1,65 @@
+import io
+import os
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from app.core.configs import settings
+from app.core.utils.file import BLOB_DIR, StoredFile, store_upload_file, store_upload_files
+
+
+def _upload(content: bytes, filename: str = "image.png") -> UploadFile:
+    return UploadFile(io.BytesIO(content), filename=filename)
+
+
+def _stored_paths(upload_dir: Path) -> list[Path]:
+    """임시 파일(.part)을 포함해 blob 디렉토리에 남은 파일 목록"""
+    return sorted(path for path in (upload_dir / BLOB_DIR).rglob("*") if path.is_file())
+
+
+async def test_oversized_file_is_rejected_without_leftovers(upload_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", 10)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await store_upload_file(_upload(b"x" * 11))
+
+    assert exc_info.value.status_code == 413
+    assert _stored_paths(upload_dir) == []
+
+
+async def test_same_content_is_stored_once_and_refreshes_mtime(upload_dir: Path) -> None:
+    first = await store_upload_file(_upload(b"same image", "first.png"))
+    # GC 유예 시간이 거의 지난 blob
+    aged = time.time() - 3600
+    os.utime(first.path, (aged, aged))
+
+    second = await store_upload_file(_upload(b"same image", "second.png"))
+
+    assert first.created and not second.created
+    assert second.url == first.url
+    assert second.path.stat().st_mtime > aged
+    assert second.mtime == second.path.stat().st_mtime
+    assert _stored_paths(upload_dir) == [first.path]
+
+
+async def test_failed_batch_deletes_only_files_it_created(upload_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", 10)
+    existing: StoredFile = await store_upload_file(_upload(b"existing"))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await store_upload_files([_upload(b"new one"), _upload(b"existing"), _upload(b"x" * 11), _upload(b"new two")])
+
+    assert exc_info.value.status_code == 413
+    # 다른 요청이 쓰고 있는 기존 blob은 남기고 이번 배치가 새로 만든 blob만 지웁니다.
+    assert _stored_paths(upload_dir) == [existing.path]
+
+
+async def test_batch_returns_files_in_input_order(upload_dir: Path) -> None:
+    contents = [b"first", b"second", b"third"]
+
+    stored_files = await store_upload_files([_upload(content) for content in contents])
+
+    assert [stored_file.path.read_bytes() for stored_file in stored_files] == contents
+    assert all(stored_file.created for stored_file in stored_files)
@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.database.keyset import (
+    CursorDirection,
+    InvalidCursorError,
+    SortKey,
+    decode_cursor,
+    encode_cursor,
+    fetch_keyset_page,
+)
+from app.models.column import Column
+from app.models.column_enums import ColumnStatus
+
+KEYS = [SortKey(Column.created_at, descending=True), SortKey(Column.id, descending=True)]
+BASE_TIME = datetime(2026, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+async def column_ids(session_factory: async_sessionmaker[AsyncSession]) -> list[str]:
+    """created_at 내림차순, 같은 시각이면 id 내림차순으로 정렬한 칼럼 id 목록. 두 개씩 created_at이 같습니다."""
+    columns = [
+        Column(
+            id=str(uuid4()),
+            title=f"칼럼 {index}",
+            content="내용",
+            status=ColumnStatus.PUBLISHED,
+            category="디자인",
+            created_at=BASE_TIME + timedelta(minutes=index // 2),
+        )
+        for index in range(5)
+    ]
+    async with session_factory() as session:
+        session.add_all(columns)
+        await session.commit()
+
+    ordered = sorted(columns, key=lambda column: (column.created_at, str(column.id)), reverse=True)
+    return [str(column.id) for column in ordered]
+
+
+async def _page(session: AsyncSession, cursor: str | None = None, per_page: int = 2) -> tuple[list[str], Any]:
+    page = await fetch_keyset_page(session, select(Column), KEYS, per_page=per_page, cursor=cursor)
+    return [str(column.id) for column in page.rows], page
+
+
+def test_cursor_round_trip() -> None:
+    row = Column(id=str(uuid4()), created_at=BASE_TIME)
+
+    cursor = encode_cursor(KEYS, CursorDirection.PREV, row)
+
+    assert decode_cursor(KEYS, cursor) == (CursorDirection.PREV, [BASE_TIME, row.id])
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [
+        [SortKey(Column.created_at), SortKey(Column.id)],
+        [SortKey(Column.title, descending=True), SortKey(Column.id, descending=True)],
+        [SortKey(Column.id, descending=True)],
+    ],
+)
+def test_cursor_for_other_sort_is_rejected(keys: list[SortKey]) -> None:
+    cursor = encode_cursor(keys, CursorDirection.NEXT, Column(id=str(uuid4()), title="칼럼", created_at=BASE_TIME))
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(KEYS, cursor)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "eyJzIjoxfQ"])
+def test_malformed_cursor_is_rejected(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(KEYS, cursor)
+
+
+async def test_pages_forward_and_backward(
+    session_factory: async_sessionmaker[AsyncSession], column_ids: list[str]
+) -> None:
+    async with session_factory() as session:
+        first, page = await _page(session)
+        assert first == column_ids[:2]
+        assert page.prev_cursor is None
+
+        second, page = await _page(session, page.next_cursor)
+        assert second == column_ids[2:4]
+        assert page.prev_cursor is not None
+
+        last, page = await _page(session, page.next_cursor)
+        assert last == column_ids[4:]
+        assert page.next_cursor is None
+
+        back, page = await _page(session, page.prev_cursor)
+        assert back == column_ids[2:4]
+        assert page.next_cursor is not None
+
+        back, page = await _page(session, page.prev_cursor)
+        assert back == column_ids[:2]
+        assert page.prev_cursor is None
+
+
+async def test_ties_on_sort_value_are_not_skipped_or_repeated(
+    session_factory: async_sessionmaker[AsyncSession], column_ids: list[str]
+) -> None:
+    # 한 페이지에 한 건씩 넘기면 created_at이 같은 행 사이에서 커서가 id로 이어져야 합니다.
+    seen: list[str] = []
+    cursor = None
+    async with session_factory() as session:
+        while True:
+            rows, page = await _page(session, cursor, per_page=1)
+            seen.extend(rows)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+    assert seen == column_ids
@@ -0,0 +1,39 @@
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+
+from app import log
+from app.log import shutdown_log, start_log
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+def test_queue_listener_restarts_with_lifespan(monkeypatch: pytest.MonkeyPatch) -> None:
+    """lifespan이 다시 시작되어도 로그가 유실되지 않고, 리스너가 멈춘 동안에는 핸들러에 바로 씁니다."""
+    handler = RecordingHandler()
+    logger = logging.getLogger("app.tests.log")
+    monkeypatch.setattr(logger, "handlers", [handler])
+    monkeypatch.setattr(logger, "propagate", False)
+    logger.setLevel(logging.INFO)
+    monkeypatch.setattr(log, "_handlers", {"app.tests.log": [handler]})
+    monkeypatch.setattr(log, "_listener", None)
+
+    for cycle in range(2):
+        start_log()
+        start_log()
+        assert isinstance(logger.handlers[0], QueueHandler)
+        logger.info("queued %d", cycle)
+        shutdown_log()
+        assert logger.handlers == [handler]
+
+    logger.info("direct")
+
+    assert handler.messages == ["queued 0", "queued 1", "direct"]
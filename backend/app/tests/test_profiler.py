@@ -0,0 +1,59 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.metrics.profiler import QueryBudgetExceeded, QueryProfile, profile_queries, query_budget, statement_shape
+
+
+@pytest.mark.parametrize(
+    ("statement", "shape"),
+    [
+        ("SELECT *\n  FROM reviews\tWHERE id = ?", "SELECT * FROM reviews WHERE id = ?"),
+        (
+            "SELECT * FROM review_images WHERE review_id IN (?, ?, ?)",
+            "SELECT * FROM review_images WHERE review_id IN (?)",
+        ),
+        ("SELECT * FROM columns WHERE id IN (%s,%s)", "SELECT * FROM columns WHERE id IN (?)"),
+        ("SELECT * FROM columns WHERE id IN (%(id_1)s, %(id_2)s)", "SELECT * FROM columns WHERE id IN (?)"),
+        ("SELECT * FROM columns WHERE id IN (:id_1, :id_2)", "SELECT * FROM columns WHERE id IN (?)"),
+        ("SELECT count(*) FROM columns", "SELECT count(*) FROM columns"),
+    ],
+)
+def test_statement_shape_folds_whitespace_and_in_lists(statement: str, shape: str) -> None:
+    assert statement_shape(statement) == shape
+
+
+def test_repeated_groups_statements_by_shape() -> None:
+    profile = QueryProfile(
+        statements=[
+            ("SELECT * FROM reviews LIMIT ?", 0.001),
+            ("SELECT * FROM review_images WHERE review_id IN (?)", 0.001),
+            ("SELECT * FROM review_images WHERE review_id IN (?, ?)", 0.001),
+            ("SELECT  *  FROM review_images WHERE review_id IN (?)", 0.001),
+        ]
+    )
+
+    assert profile.repeated() == {"SELECT * FROM review_images WHERE review_id IN (?)": 3}
+
+
+def test_repeated_is_empty_without_duplicates() -> None:
+    profile = QueryProfile(statements=[("SELECT 1", 0.001), ("SELECT 2", 0.001)])
+
+    assert profile.repeated() == {}
+
+
+async def test_nested_profiles_record_the_same_statements(engine: AsyncEngine) -> None:
+    async with engine.connect() as connection:
+        with profile_queries() as outer:
+            await connection.execute(text("SELECT 1"))
+            with profile_queries() as inner:
+                await connection.execute(text("SELECT 2"))
+
+    assert [statement for statement, _ in outer.statements] == ["SELECT 1", "SELECT 2"]
+    assert [statement for statement, _ in inner.statements] == ["SELECT 2"]
+
+
+def test_query_budget_raises_when_exceeded() -> None:
+    with pytest.raises(QueryBudgetExceeded, match="2 queries exceeded the budget of 1"):
+        with query_budget(1) as profile:
+            profile.statements.extend([("SELECT 1", 0.001), ("SELECT 1", 0.001)])
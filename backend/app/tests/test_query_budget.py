@@ -0,0 +1,82 @@
+from uuid import uuid4
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.metrics.profiler import query_budget
+from app.models.column import Column
+from app.models.column_enums import ColumnStatus
+from app.models.portfolio import Portfolio
+from app.models.portfolio_enums import PortfolioCategory, PortfolioVisibility
+from app.models.review import Review
+from app.models.review_image import ReviewImage
+
+# 목록에 여러 행이 있어야 행마다 실행되는 조회(N+1)가 예산을 넘습니다.
+ROWS = 5
+
+
+@pytest.fixture
+async def ids(session_factory: async_sessionmaker[AsyncSession]) -> dict[str, str]:
+    async with session_factory() as session:
+        columns = [
+            Column(id=str(uuid4()), title=f"칼럼 {i}", content="내용", status=ColumnStatus.PUBLISHED, category="디자인")
+            for i in range(ROWS)
+        ]
+        portfolios = [
+            Portfolio(
+                id=str(uuid4()),
+                title=f"포트폴리오 {i}",
+                description="설명",
+                category=PortfolioCategory.LOGO,
+                image_url=f"/uploads/portfolios/{i}.png",
+                display_order=i,
+                visibility=PortfolioVisibility.PUBLIC,
+            )
+            for i in range(ROWS)
+        ]
+        reviews = [
+            Review(
+                id=str(uuid4()),
+                name=f"고객 {i}",
+                rating=5,
+                content="만족합니다",
+                order_type="로고",
+                order_amount="300,000원",
+                order_amount_value=300_000,
+                working_days=3,
+                is_visible=True,
+                images=[
+                    ReviewImage(id=str(uuid4()), position=p, url=f"/uploads/reviews/{i}-{p}.png") for p in range(2)
+                ],
+            )
+            for i in range(ROWS)
+        ]
+        session.add_all([*columns, *portfolios, *reviews])
+        await session.commit()
+        return {"column": str(columns[0].id), "portfolio": str(portfolios[0].id), "review": str(reviews[0].id)}
+
+
+@pytest.mark.parametrize(
+    ("path", "budget"),
+    [
+        ("/api/v1/columns", 3),
+        ("/api/v1/columns?pagination=cursor", 2),
+        ("/api/v1/reviews?pagination=cursor", 3),
+        ("/api/v1/columns/{column}", 3),
+        ("/api/v1/portfolios", 3),
+        ("/api/v1/portfolios/{portfolio}", 2),
+        ("/api/v1/reviews", 4),
+        ("/api/v1/reviews/{review}", 3),
+        ("/api/v1/reviews/stats", 1),
+    ],
+)
+async def test_read_routes_stay_within_query_budget(
+    client: httpx.AsyncClient, ids: dict[str, str], path: str, budget: int
+) -> None:
+    with query_budget(budget) as profile:
+        response = await client.get(path.format(**ids))
+
+    assert response.status_code == 200, response.text
+    # 같은 모양의 쿼리가 반복되면 행마다 조회하는 N+1
+    assert not profile.repeated()
@@ -0,0 +1,148 @@
+import asyncio
+from typing import Awaitable, Callable
+
+import pytest
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.cache import (
+    CacheBackend,
+    LocalKeyValueClient,
+    MemoryCacheBackend,
+    ResponseCache,
+    SharedCacheBackend,
+    create_cache_backend,
+)
+from app.core.cache.response_cache import READ_YOUR_WRITES
+from app.core.configs import settings
+from app.core.configs.settings import CacheBackendType
+from app.core.database.hooks import run_commit_hooks, run_rollback_hooks
+
+
+@pytest.mark.parametrize("backend_type", [CacheBackendType.MEMORY, CacheBackendType.LOCAL])
+def test_per_process_backend_requires_single_worker_opt_in(
+    backend_type: CacheBackendType, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_SINGLE_WORKER", False)
+
+    with pytest.raises(ValueError, match="RESPONSE_CACHE_SINGLE_WORKER"):
+        create_cache_backend(backend_type)
+
+
+@pytest.mark.parametrize("backend_type", [CacheBackendType.MEMORY, CacheBackendType.LOCAL])
+def test_per_process_backend_rejects_web_concurrency(
+    backend_type: CacheBackendType, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_SINGLE_WORKER", True)
+    monkeypatch.setenv("WEB_CONCURRENCY", "4")
+
+    with pytest.raises(ValueError):
+        create_cache_backend(backend_type)
+
+
+def test_per_process_backend_with_single_worker_opt_in(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_SINGLE_WORKER", True)
+    monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+
+    assert isinstance(create_cache_backend(CacheBackendType.MEMORY), MemoryCacheBackend)
+    assert isinstance(create_cache_backend(CacheBackendType.LOCAL), SharedCacheBackend)
+
+
+def test_default_backend_is_disabled() -> None:
+    assert type(settings).model_fields["RESPONSE_CACHE_BACKEND"].default == CacheBackendType.NONE
+    assert create_cache_backend(CacheBackendType.NONE) is None
+
+
+class Item(BaseModel):
+    name: str
+    page: int
+
+
+def _cached_items(cache: ResponseCache) -> tuple[Callable[..., Awaitable[Item]], list[tuple[str, int]]]:
+    """호출될 때마다 인자를 calls에 남기는 캐시된 조회 함수를 만듭니다."""
+    calls: list[tuple[str, int]] = []
+
+    @cache.cached("items")
+    async def service_get_item(session: AsyncSession, name: str, page: int = 1) -> Item:
+        calls.append((name, page))
+        return Item(name=name, page=page)
+
+    return service_get_item, calls
+
+
+@pytest.mark.parametrize("backend", [MemoryCacheBackend(max_entries=10), SharedCacheBackend(LocalKeyValueClient())])
+async def test_cache_key_ignores_argument_style_and_session(
+    backend: CacheBackend, session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    cache = ResponseCache(backend, ttl=60)
+    get_item, calls = _cached_items(cache)
+
+    async with session_factory() as session, session_factory() as other_session:
+        assert await get_item(session, "a") == Item(name="a", page=1)
+        assert await get_item(other_session, name="a", page=1) == Item(name="a", page=1)
+        assert await get_item(session, "a", 2) == Item(name="a", page=2)
+
+    assert calls == [("a", 1), ("a", 2)]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+async def test_commit_invalidates_namespace(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    cache = ResponseCache(MemoryCacheBackend(max_entries=10), ttl=60)
+    get_item, calls = _cached_items(cache)
+
+    async with session_factory() as session:
+        await get_item(session, "a")
+        cache.invalidate_on_commit(session, "items")
+        await get_item(session, "a")
+        assert len(calls) == 1
+
+        await run_commit_hooks(session)
+        await get_item(session, "a")
+
+    assert len(calls) == 2
+
+
+async def test_rollback_keeps_cached_entries(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    cache = ResponseCache(MemoryCacheBackend(max_entries=10), ttl=60)
+    get_item, calls = _cached_items(cache)
+
+    async with session_factory() as session:
+        await get_item(session, "a")
+        cache.invalidate_on_commit(session, "items")
+        await run_rollback_hooks(session)
+        await get_item(session, "a")
+
+    assert len(calls) == 1
+
+
+async def test_replica_lag_invalidates_again_after_commit(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    cache = ResponseCache(MemoryCacheBackend(max_entries=10), ttl=60, replica_lag=0.05)
+    get_item, calls = _cached_items(cache)
+
+    async with session_factory() as session:
+        cache.invalidate_on_commit(session, "items")
+        await run_commit_hooks(session)
+
+        # 복제본이 따라잡기 전에 읽어 채운 항목은 지연 무효화로 버려져야 합니다.
+        await get_item(session, "a")
+        await get_item(session, "a")
+        assert len(calls) == 1
+
+        await asyncio.sleep(0.1)
+        await get_item(session, "a")
+
+    assert len(calls) == 2
+    await cache.close()
+
+
+async def test_read_your_writes_session_bypasses_cache(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    cache = ResponseCache(MemoryCacheBackend(max_entries=10), ttl=60)
+    get_item, calls = _cached_items(cache)
+
+    async with session_factory() as session:
+        session.info[READ_YOUR_WRITES] = True
+        await get_item(session, "a")
+        await get_item(session, "a")
+
+    assert len(calls) == 2
+    assert (cache.hits, cache.misses) == (0, 0)
@@ -0,0 +1,38 @@
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.review import Review
+from app.models.review_image import ReviewImage
+
+
+async def test_replacing_only_images_bumps_updated_at(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    """이미지만 바꿔도 updated_at이 바뀌어야 목록/상세 ETag가 새 값이 됩니다."""
+    review_id = str(uuid4())
+    async with session_factory() as session:
+        review = Review(
+            id=review_id,
+            name="고객",
+            rating=5,
+            content="만족합니다",
+            order_type="로고",
+            order_amount="300,000원",
+            order_amount_value=300_000,
+            working_days=3,
+            is_visible=True,
+            images=[ReviewImage(id=str(uuid4()), position=0, url="/uploads/reviews/old.png")],
+            updated_at=datetime(2020, 1, 1),
+        )
+        session.add(review)
+        await session.commit()
+
+        await review.update(
+            session=session,
+            images=[ReviewImage(id=str(uuid4()), position=0, url="/uploads/reviews/new.png")],
+        )
+        await session.commit()
+
+        assert review.image_urls == ["/uploads/reviews/new.png"]
+        assert review.updated_at.replace(tzinfo=None) > datetime(2020, 1, 1)
+        assert await Review.get_updated_at(session, review_id) == review.updated_at
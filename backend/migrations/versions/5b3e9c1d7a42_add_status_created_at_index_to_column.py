@@ -0,0 +1,27 @@
+"""add_status_created_at_index_to_column
+
+Revision ID: 5b3e9c1d7a42
+Revises: aec3affc3fe8
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b3e9c1d7a42"
+down_revision: Union[str, None] = "aec3affc3fe8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_columns_status_created_at", "columns", ["status", "created_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_columns_status_created_at", table_name="columns")
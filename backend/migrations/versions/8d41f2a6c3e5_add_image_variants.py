@@ -0,0 +1,32 @@
+"""add_image_variants
+
+Revision ID: 8d41f2a6c3e5
+Revises: 5b3e9c1d7a42
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d41f2a6c3e5"
+down_revision: Union[str, None] = "5b3e9c1d7a42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("portfolios", sa.Column("image_variants", sa.JSON(), nullable=True))
+    op.add_column("columns", sa.Column("thumbnail_variants", sa.JSON(), nullable=True))
+    op.add_column("reviews", sa.Column("image_variants", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("reviews", "image_variants")
+    op.drop_column("columns", "thumbnail_variants")
+    op.drop_column("portfolios", "image_variants")
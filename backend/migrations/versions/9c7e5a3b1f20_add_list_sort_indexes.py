@@ -0,0 +1,48 @@
+"""add_list_sort_indexes
+
+Revision ID: 9c7e5a3b1f20
+Revises: 8d41f2a6c3e5
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c7e5a3b1f20"
+down_revision: Union[str, None] = "8d41f2a6c3e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스 이름, 테이블, 컬럼). InnoDB는 보조 인덱스를 잠금 없이(ALGORITHM=INPLACE, LOCK=NONE) 추가합니다.
+INDEXES: list[tuple[str, str, list[str | sa.TextClause]]] = [
+    ("ix_columns_created_at", "columns", ["created_at", "id"]),
+    (
+        "ix_portfolios_display_order_created_at",
+        "portfolios",
+        ["display_order", sa.text("created_at DESC"), sa.text("id DESC")],
+    ),
+    ("ix_reviews_created_at", "reviews", ["created_at", "id"]),
+    ("ix_reviews_rating", "reviews", ["rating", "id"]),
+    ("ix_reviews_working_days", "reviews", ["working_days", "id"]),
+    ("ix_reviews_order_amount", "reviews", ["order_amount", "id"]),
+    ("ix_reviews_is_visible_created_at", "reviews", ["is_visible", "created_at", "id"]),
+    ("ix_reviews_is_visible_rating", "reviews", ["is_visible", "rating", "id"]),
+    ("ix_reviews_is_visible_working_days", "reviews", ["is_visible", "working_days", "id"]),
+    ("ix_reviews_is_visible_order_amount", "reviews", ["is_visible", "order_amount", "id"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,96 @@
+"""add_review_order_amount_value
+
+Revision ID: b4f1d8e26a93
+Revises: 9c7e5a3b1f20
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+
+import re
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b4f1d8e26a93"
+down_revision: Union[str, None] = "9c7e5a3b1f20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+# 마이그레이션은 앱 코드가 바뀌어도 같은 결과를 내야 하므로 이 리비전 시점의 parse_amount를 복사해 둡니다.
+_UNITS = {"억": 100_000_000, "천만": 10_000_000, "백만": 1_000_000, "만": 10_000, "천": 1_000}
+_AMOUNT = re.compile(r"(\d+(?:\.\d+)?)\s*(억|천만|백만|만|천)?")
+
+
+def parse_amount(text: str) -> int:
+    """단위가 붙은 숫자가 여러 개면 더하고, 숫자가 없으면 0을 반환합니다."""
+    amount = 0.0
+    for number, unit in _AMOUNT.findall(text.replace(",", "")):
+        amount += float(number) * _UNITS.get(unit, 1)
+    return round(amount)
+
+
+reviews = sa.table(
+    "reviews",
+    sa.column("id", sa.String),
+    sa.column("order_amount", sa.String),
+    sa.column("order_amount_value", sa.BigInteger),
+)
+
+
+def backfill_order_amount_value() -> None:
+    """
+    id 순서로 BATCH_SIZE개씩 읽어 배치마다 UPDATE 한 문장으로 채웁니다.
+
+    autocommit 블록에서 실행되므로 배치마다 커밋되어 잠금이 그 배치의 행에만 짧게 걸립니다.
+    """
+    connection = op.get_bind()
+    last_id = ""
+    with op.get_context().autocommit_block():
+        while True:
+            rows = connection.execute(
+                sa.select(reviews.c.id, reviews.c.order_amount)
+                .where(reviews.c.id > last_id)
+                .order_by(reviews.c.id)
+                .limit(BATCH_SIZE)
+            ).all()
+            if not rows:
+                break
+
+            values = {row.id: amount for row in rows if (amount := parse_amount(row.order_amount))}
+            if values:
+                connection.execute(
+                    sa.update(reviews)
+                    .where(reviews.c.id.in_(list(values)))
+                    .values(order_amount_value=sa.case(values, value=reviews.c.id, else_=0))
+                )
+            last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기본값이 있는 컬럼 추가는 InnoDB에서 테이블을 다시 만들지 않습니다. (ALGORITHM=INSTANT)
+    op.add_column(
+        "reviews", sa.Column("order_amount_value", sa.BigInteger(), nullable=False, server_default=sa.text("0"))
+    )
+    backfill_order_amount_value()
+
+    # 인덱스는 채운 뒤에 만들어 백필 중 인덱스 갱신 비용을 없앱니다.
+    op.create_index("ix_reviews_order_amount_value", "reviews", ["order_amount_value", "id"], unique=False)
+    op.create_index(
+        "ix_reviews_is_visible_order_amount_value", "reviews", ["is_visible", "order_amount_value", "id"], unique=False
+    )
+    op.drop_index("ix_reviews_is_visible_order_amount", table_name="reviews")
+    op.drop_index("ix_reviews_order_amount", table_name="reviews")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_reviews_order_amount", "reviews", ["order_amount", "id"], unique=False)
+    op.create_index("ix_reviews_is_visible_order_amount", "reviews", ["is_visible", "order_amount", "id"], unique=False)
+    op.drop_index("ix_reviews_is_visible_order_amount_value", table_name="reviews")
+    op.drop_index("ix_reviews_order_amount_value", table_name="reviews")
+    op.drop_column("reviews", "order_amount_value")
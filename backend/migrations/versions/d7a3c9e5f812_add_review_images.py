@@ -0,0 +1,137 @@
+"""add_review_images
+
+Revision ID: d7a3c9e5f812
+Revises: b4f1d8e26a93
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+from uuid import uuid4
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7a3c9e5f812"
+down_revision: Union[str, None] = "b4f1d8e26a93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+reviews = sa.table(
+    "reviews",
+    sa.column("id", sa.String),
+    sa.column("image_urls", sa.String),
+    sa.column("image_variants", sa.JSON),
+)
+review_images = sa.table(
+    "review_images",
+    sa.column("id", sa.String),
+    sa.column("review_id", sa.String),
+    sa.column("position", sa.Integer),
+    sa.column("url", sa.String),
+    sa.column("variants", sa.JSON),
+)
+# 옮길 때의 image_urls. f6a2d8b4c1e7이 이후 이전 버전 코드가 바꾼 리뷰를 찾는 데 쓰고 삭제합니다.
+review_image_urls_copied = sa.table(
+    "review_image_urls_copied",
+    sa.column("review_id", sa.String),
+    sa.column("image_urls", sa.String),
+)
+
+
+def copy_image_urls_to_review_images() -> None:
+    """
+    쉼표로 이어 붙인 image_urls를 id 순서로 BATCH_SIZE개 리뷰씩 review_images 행으로 옮깁니다.
+
+    autocommit 블록에서 배치마다 multi-row INSERT 한 문장으로 커밋하므로 reviews 테이블을 잠그지 않고,
+    이미 옮긴 리뷰는 건너뛰므로 중간에 실패해도 다시 실행할 수 있습니다.
+    옮긴 image_urls는 review_image_urls_copied에 함께 남깁니다.
+    """
+    connection = op.get_bind()
+    last_id = ""
+    with op.get_context().autocommit_block():
+        while True:
+            rows = connection.execute(
+                sa.select(reviews.c.id, reviews.c.image_urls, reviews.c.image_variants)
+                .where(reviews.c.id > last_id)
+                .order_by(reviews.c.id)
+                .limit(BATCH_SIZE)
+            ).all()
+            if not rows:
+                break
+
+            review_ids = [row.id for row in rows]
+            copied = set(
+                connection.scalars(
+                    sa.select(review_images.c.review_id).distinct().where(review_images.c.review_id.in_(review_ids))
+                )
+            )
+            snapshotted = set(
+                connection.scalars(
+                    sa.select(review_image_urls_copied.c.review_id).where(
+                        review_image_urls_copied.c.review_id.in_(review_ids)
+                    )
+                )
+            )
+            images = []
+            snapshots = []
+            for row in rows:
+                if not row.image_urls:
+                    continue
+                if row.id not in snapshotted:
+                    snapshots.append({"review_id": row.id, "image_urls": row.image_urls})
+                if row.id in copied:
+                    continue
+                variants = row.image_variants or []
+                for position, url in enumerate(row.image_urls.split(",")):
+                    images.append(
+                        {
+                            "id": str(uuid4()),
+                            "review_id": row.id,
+                            "position": position,
+                            "url": url,
+                            "variants": variants[position] if position < len(variants) else None,
+                        }
+                    )
+            if images:
+                connection.execute(sa.insert(review_images), images)
+            if snapshots:
+                connection.execute(sa.insert(review_image_urls_copied), snapshots)
+            last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "review_images",
+        sa.Column("review_id", sa.String(length=36), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("url", sa.String(length=255), nullable=False),
+        sa.Column("variants", sa.JSON(), nullable=True),
+        sa.Column("width", sa.Integer(), nullable=True),
+        sa.Column("height", sa.Integer(), nullable=True),
+        sa.Column("size_bytes", sa.Integer(), nullable=True),
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.ForeignKeyConstraint(["review_id"], ["reviews.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_review_images_review_id_position", "review_images", ["review_id", "position"], unique=False)
+    op.create_table(
+        "review_image_urls_copied",
+        sa.Column("review_id", sa.String(length=36), nullable=False),
+        sa.Column("image_urls", sa.String(length=1000), nullable=False),
+        sa.PrimaryKeyConstraint("review_id"),
+    )
+
+    # 이전 버전 코드가 아직 image_urls를 읽고 쓰므로 컬럼 삭제는 contract 브랜치(f6a2d8b4c1e7)에서 따로 합니다.
+    copy_image_urls_to_review_images()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("review_image_urls_copied")
+    op.drop_index("ix_review_images_review_id_position", table_name="review_images")
+    op.drop_table("review_images")
@@ -0,0 +1,154 @@
+"""recompute_review_order_amount_value
+
+d7a3c9e5f812에서 갈라지는 main 브랜치의 첫 리비전입니다. 새 리비전은 `--head main@head`로 만듭니다.
+
+Revision ID: e3b8f1c4a6d2
+Revises: d7a3c9e5f812
+Create Date: 2026-10-17 23:00:00.000000
+
+"""
+
+import re
+from typing import NamedTuple, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3b8f1c4a6d2"
+down_revision: Union[str, None] = "d7a3c9e5f812"
+branch_labels: Union[str, Sequence[str], None] = ("main",)
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+# 마이그레이션은 앱 코드가 바뀌어도 같은 결과를 내야 하므로 이 리비전 시점의 parse_amount를 복사해 둡니다.
+_SMALL_UNITS = {"천": 1_000, "백": 100, "십": 10}
+_LARGE_UNITS = {"억": 100_000_000, "만": 10_000}
+_TOKEN = re.compile(r"\s*(?:(\d+(?:\.\d+)?)|([천백십만억]))")
+_RANGE_SEPARATOR = re.compile(r"\s*[~\-〜～]\s*")
+_FIRST_DIGIT = re.compile(r"\d")
+
+
+class _Amount(NamedTuple):
+    value: float
+    # 마지막 자리 묶음에 곱해진 단위 (예: "70만" → 10,000, "300,000" → 1)
+    scale: int
+    end: int
+
+
+def _parse_expression(text: str, pos: int) -> _Amount | None:
+    """
+    pos부터 이어지는 숫자와 단위를 금액 하나로 읽습니다. 숫자/단위가 아닌 글자(원, 괄호 등)에서 멈춥니다.
+
+    억/만 사이의 자리는 천/백/십으로 묶어 읽고 ("3천5백만" → 35,000,000),
+    억 뒤에 만이 생략되면 만 단위로 봅니다. ("1억2천" → 120,000,000)
+    """
+    total = 0.0
+    group = 0.0
+    number: float | None = None
+    last_large_unit: int | None = None
+    matched = False
+
+    while match := _TOKEN.match(text, pos):
+        digits, unit = match.groups()
+        if digits is not None:
+            # "30 40"처럼 단위 없이 숫자가 이어지면 앞의 숫자까지만 읽습니다.
+            if number is not None:
+                break
+            number = float(digits)
+        elif unit in _SMALL_UNITS:
+            group += (1 if number is None else number) * _SMALL_UNITS[unit]
+            number = None
+        else:
+            group += number or 0
+            total += (group or 1) * _LARGE_UNITS[unit]
+            last_large_unit = _LARGE_UNITS[unit]
+            group, number = 0.0, None
+        pos = match.end()
+        matched = True
+
+    if not matched:
+        return None
+
+    group += number or 0
+    if not group:
+        return _Amount(total, last_large_unit or 1, pos)
+    if last_large_unit == _LARGE_UNITS["억"]:
+        return _Amount(total + group * _LARGE_UNITS["만"], _LARGE_UNITS["만"], pos)
+    return _Amount(total + group, 1, pos)
+
+
+def parse_amount(text: str) -> int:
+    """
+    '300,000원', '30만원', '1억 2천만원' 같은 금액 문자열을 원 단위 정수로 바꿉니다.
+
+    첫 번째 금액만 읽고 그 뒤의 글자("(VAT 10%)" 등)는 무시합니다.
+    범위("50~70만원")는 뒤쪽 단위를 앞쪽에도 적용해 낮은 쪽 금액을 반환하고, 숫자가 없으면 0을 반환합니다.
+    """
+    text = text.replace(",", "")
+    first_digit = _FIRST_DIGIT.search(text)
+    if first_digit is None:
+        return 0
+
+    amount = _parse_expression(text, first_digit.start())
+    if amount is None:
+        return 0
+
+    # 앞쪽이 단위 없는 작은 수일 때만 뒤쪽 단위를 적용합니다. ("300,000~50만원"은 그대로)
+    separator = _RANGE_SEPARATOR.match(text, amount.end)
+    if amount.scale == 1 and amount.value < _LARGE_UNITS["만"] and separator:
+        upper = _parse_expression(text, separator.end())
+        if upper is not None and upper.scale > 1:
+            return round(amount.value * upper.scale)
+    return round(amount.value)
+
+
+reviews = sa.table(
+    "reviews",
+    sa.column("id", sa.String),
+    sa.column("order_amount", sa.String),
+    sa.column("order_amount_value", sa.BigInteger),
+)
+
+
+def recompute_order_amount_value() -> None:
+    """
+    parse_amount가 모든 숫자를 더해 채운 order_amount_value를 첫 번째 금액으로 다시 계산합니다.
+
+    b4f1d8e26a93과 같이 id 순서로 BATCH_SIZE개씩 읽고, 값이 달라진 행만 배치마다 UPDATE 한 문장으로 고칩니다.
+    """
+    connection = op.get_bind()
+    last_id = ""
+    with op.get_context().autocommit_block():
+        while True:
+            rows = connection.execute(
+                sa.select(reviews.c.id, reviews.c.order_amount, reviews.c.order_amount_value)
+                .where(reviews.c.id > last_id)
+                .order_by(reviews.c.id)
+                .limit(BATCH_SIZE)
+            ).all()
+            if not rows:
+                break
+
+            values = {
+                row.id: amount for row in rows if (amount := parse_amount(row.order_amount)) != row.order_amount_value
+            }
+            if values:
+                connection.execute(
+                    sa.update(reviews)
+                    .where(reviews.c.id.in_(list(values)))
+                    .values(order_amount_value=sa.case(values, value=reviews.c.id, else_=0))
+                )
+            last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    recompute_order_amount_value()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 잘못 계산된 이전 값으로 되돌릴 필요가 없으므로 아무것도 하지 않습니다.
+    pass
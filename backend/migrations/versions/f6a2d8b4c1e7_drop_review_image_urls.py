@@ -0,0 +1,167 @@
+"""drop_review_image_urls
+
+contract 브랜치의 리비전이므로 `alembic upgrade main@head`로는 적용되지 않습니다.
+image_urls를 읽고 쓰는 이전 버전 인스턴스가 모두 내려간 뒤 `alembic upgrade contract@head`로 적용합니다.
+
+Revision ID: f6a2d8b4c1e7
+Revises: d7a3c9e5f812
+Create Date: 2026-10-17 23:30:00.000000
+
+"""
+
+from collections import defaultdict
+from typing import Sequence, Union
+from uuid import uuid4
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a2d8b4c1e7"
+down_revision: Union[str, None] = "d7a3c9e5f812"
+branch_labels: Union[str, Sequence[str], None] = ("contract",)
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+reviews = sa.table(
+    "reviews",
+    sa.column("id", sa.String),
+    sa.column("image_urls", sa.String),
+    sa.column("image_variants", sa.JSON),
+)
+review_images = sa.table(
+    "review_images",
+    sa.column("id", sa.String),
+    sa.column("review_id", sa.String),
+    sa.column("position", sa.Integer),
+    sa.column("url", sa.String),
+    sa.column("variants", sa.JSON),
+)
+review_image_urls_copied = sa.table(
+    "review_image_urls_copied",
+    sa.column("review_id", sa.String),
+    sa.column("image_urls", sa.String),
+)
+
+
+def sync_changed_image_urls() -> None:
+    """
+    d7a3c9e5f812 이후 이전 버전 코드가 image_urls를 바꾼 리뷰의 review_images를 image_urls로 다시 만듭니다.
+
+    옮길 때 남긴 image_urls(review_image_urls_copied)와 지금 값이 다른 리뷰만 고치므로,
+    새 버전 코드가 review_images에만 쓴 변경은 그대로 둡니다.
+    id 순서로 BATCH_SIZE개씩 읽어 배치마다 DELETE, INSERT 한 문장씩 커밋합니다.
+    """
+    connection = op.get_bind()
+    last_id = ""
+    with op.get_context().autocommit_block():
+        while True:
+            rows = connection.execute(
+                sa.select(
+                    reviews.c.id,
+                    reviews.c.image_urls,
+                    reviews.c.image_variants,
+                    review_image_urls_copied.c.image_urls.label("copied_image_urls"),
+                )
+                .outerjoin(review_image_urls_copied, review_image_urls_copied.c.review_id == reviews.c.id)
+                .where(reviews.c.id > last_id)
+                .order_by(reviews.c.id)
+                .limit(BATCH_SIZE)
+            ).all()
+            if not rows:
+                break
+
+            changed = [row for row in rows if (row.image_urls or None) != row.copied_image_urls]
+            if changed:
+                connection.execute(
+                    sa.delete(review_images).where(review_images.c.review_id.in_([row.id for row in changed]))
+                )
+                images = []
+                for row in changed:
+                    if not row.image_urls:
+                        continue
+                    variants = row.image_variants or []
+                    for position, url in enumerate(row.image_urls.split(",")):
+                        images.append(
+                            {
+                                "id": str(uuid4()),
+                                "review_id": row.id,
+                                "position": position,
+                                "url": url,
+                                "variants": variants[position] if position < len(variants) else None,
+                            }
+                        )
+                if images:
+                    connection.execute(sa.insert(review_images), images)
+            last_id = rows[-1].id
+
+
+def copy_review_images_to_image_urls() -> None:
+    """
+    review_images를 리뷰마다 image_urls, image_variants로 되돌립니다. (downgrade)
+
+    되돌린 값은 review_image_urls_copied에도 남겨 d7a3c9e5f812 직후와 같은 상태로 만듭니다.
+    """
+    connection = op.get_bind()
+    last_id = ""
+    with op.get_context().autocommit_block():
+        while True:
+            review_ids = connection.scalars(
+                sa.select(reviews.c.id).where(reviews.c.id > last_id).order_by(reviews.c.id).limit(BATCH_SIZE)
+            ).all()
+            if not review_ids:
+                break
+
+            images: defaultdict[str, list[sa.Row]] = defaultdict(list)
+            for image in connection.execute(
+                sa.select(review_images.c.review_id, review_images.c.url, review_images.c.variants)
+                .where(review_images.c.review_id.in_(review_ids))
+                .order_by(review_images.c.review_id, review_images.c.position)
+            ):
+                images[image.review_id].append(image)
+
+            if images:
+                image_urls = {review_id: ",".join(image.url for image in rows) for review_id, rows in images.items()}
+                connection.execute(
+                    sa.update(reviews)
+                    .where(reviews.c.id == sa.bindparam("review_id"))
+                    .values(image_urls=sa.bindparam("urls"), image_variants=sa.bindparam("variants")),
+                    [
+                        {
+                            "review_id": review_id,
+                            "urls": image_urls[review_id],
+                            "variants": [image.variants for image in rows],
+                        }
+                        for review_id, rows in images.items()
+                    ],
+                )
+                connection.execute(
+                    sa.insert(review_image_urls_copied),
+                    [{"review_id": review_id, "image_urls": urls} for review_id, urls in image_urls.items()],
+                )
+            last_id = review_ids[-1]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    sync_changed_image_urls()
+    op.drop_table("review_image_urls_copied")
+
+    # MySQL 8.0.29+는 컬럼 삭제도 테이블을 다시 만들지 않습니다. (ALGORITHM=INSTANT)
+    op.drop_column("reviews", "image_variants")
+    op.drop_column("reviews", "image_urls")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column("reviews", sa.Column("image_urls", sa.String(length=1000), nullable=True))
+    op.add_column("reviews", sa.Column("image_variants", sa.JSON(), nullable=True))
+    op.create_table(
+        "review_image_urls_copied",
+        sa.Column("review_id", sa.String(length=36), nullable=False),
+        sa.Column("image_urls", sa.String(length=1000), nullable=False),
+        sa.PrimaryKeyConstraint("review_id"),
+    )
+
+    copy_review_images_to_image_urls()